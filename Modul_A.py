@@ -1,18 +1,134 @@
+import argparse
+import atexit
+import json
 import math
+import os
 import numpy as np
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+from pemilihan import TOLERANSI_KENA, uji_kena
+from pemotongan import indeks_gabungan, potong_garis_batch, sutherland_hodgman_batch
+from pemotongan_paralel import PemotongParalel
+from cache_pemotongan import CachePemotongan
+from daftar_gambar import DaftarGambar
+from indeks_spasial import IndeksSpasial
+from masukan import PenggabungMasukan
+from penyimpanan_bentuk import PenyimpananBentuk
+from profiler import Profiler, buat_sink
+from transformasi import rotasi_2d, skala_2d, translasi_2d
+from renderer_vbo import MODE_GAMBAR, PenggambarVBO
+
+
+# Penyimpanan yang dipakai bentuk jika tidak diberikan secara eksplisit.
+PENYIMPANAN_DEFAULT = PenyimpananBentuk()
+
+# Jarak maksimum (piksel) antara busur elips dan tali busur penggantinya.
+TOLERANSI_ELIPS = 0.25
+JUMLAH_SEGMEN_MIN, JUMLAH_SEGMEN_MAKS = 8, 1024
+
+# Tabel (cos, sin) lingkaran satuan per jumlah segmen, dipakai bersama oleh semua elips.
+_TABEL_LINGKARAN = {}
+
+# Tombol transformasi bentuk terpilih: rotasi (derajat) dari keyboard biasa, sisanya dari tombol khusus.
+TOMBOL_ROTASI = {b'[': -5, b'{': -5, b']': 5, b'}': 5}
+TOMBOL_TRANSFORMASI = {
+    GLUT_KEY_UP: ('translasi', (0, -5)), GLUT_KEY_DOWN: ('translasi', (0, 5)),
+    GLUT_KEY_LEFT: ('translasi', (-5, 0)), GLUT_KEY_RIGHT: ('translasi', (5, 0)),
+    GLUT_KEY_PAGE_UP: ('skala', 1.05), GLUT_KEY_PAGE_DOWN: ('skala', 0.95),
+}
+
+
+def jumlah_segmen_elips(radius_x, radius_y, toleransi=TOLERANSI_ELIPS):
+    """
+    Jumlah segmen terkecil (kelipatan 4) agar tali busur tidak menyimpang lebih dari
+    `toleransi` piksel dari elips: r * (1 - cos(pi / n)) <= toleransi untuk radius terbesar.
+    """
+    radius = max(abs(radius_x), abs(radius_y))
+    if radius <= toleransi:
+        return JUMLAH_SEGMEN_MIN
+    jumlah = math.pi / math.acos(1 - toleransi / radius)
+    return min(JUMLAH_SEGMEN_MAKS, max(JUMLAH_SEGMEN_MIN, 4 * math.ceil(jumlah / 4)))
+
+
+def jumlah_segmen_elips_batch(radius, toleransi=TOLERANSI_ELIPS):
+    """Seperti `jumlah_segmen_elips` untuk banyak elips sekaligus; `radius` berukuran (k, 2)."""
+    radius = np.abs(np.asarray(radius, dtype=np.float64)).max(axis=1, initial=0)
+    besar = radius > toleransi
+    jumlah = np.full(len(radius), JUMLAH_SEGMEN_MIN, dtype=np.int64)
+    n = np.pi / np.arccos(1 - toleransi / radius[besar])
+    jumlah[besar] = np.clip(4 * np.ceil(n / 4), JUMLAH_SEGMEN_MIN, JUMLAH_SEGMEN_MAKS)
+    return jumlah
+
+
+def lingkaran_satuan(jumlah_segmen):
+    """Simpul (jumlah_segmen, 2) lingkaran satuan dari tabel bersama (jangan diubah)."""
+    tabel = _TABEL_LINGKARAN.get(jumlah_segmen)
+    if tabel is None:
+        sudut_segmen = 2 * np.pi * np.arange(jumlah_segmen) / jumlah_segmen
+        tabel = np.column_stack((np.cos(sudut_segmen), np.sin(sudut_segmen)))
+        tabel.flags.writeable = False
+        _TABEL_LINGKARAN[jumlah_segmen] = tabel
+    return tabel
+
+
+def lingkaran_satuan_banyak(jumlah_segmen):
+    """
+    Simpul lingkaran satuan untuk banyak elips sekaligus, terkemas berurutan (sum(jumlah_segmen), 2);
+    nilainya sama persis dengan `lingkaran_satuan` untuk tiap jumlah segmen.
+    """
+    jumlah_segmen = np.asarray(jumlah_segmen, dtype=np.int64)
+    sudut_segmen = 2 * np.pi * indeks_gabungan(np.zeros(len(jumlah_segmen), dtype=np.int64), jumlah_segmen)
+    sudut_segmen = sudut_segmen / np.repeat(jumlah_segmen, jumlah_segmen)
+    return np.column_stack((np.cos(sudut_segmen), np.sin(sudut_segmen)))
 
-class Shape:
 
-    def __init__(self, tipe_bentuk, warna, ketebalan):
-        self.tipe_bentuk = tipe_bentuk
-        self.warna = warna
-        self.ketebalan = ketebalan
-        self.terpilih = False
-        self.simpul = []
+class Shape:
+    """
+    View ringan ke satu baris `PenyimpananBentuk`: semua data bentuk (simpul, warna,
+    ketebalan, dst.) berada di kolom-kolom array penyimpanan, objek ini hanya menyimpan id-nya.
+    """
+    __slots__ = ('penyimpanan', 'id')
+
+    def __init__(self, tipe_bentuk, warna, ketebalan, penyimpanan=None):
+        self.penyimpanan = PENYIMPANAN_DEFAULT if penyimpanan is None else penyimpanan
+        self.id = self.penyimpanan.tambah(tipe_bentuk, warna, ketebalan)
+
+    @classmethod
+    def dari_id(cls, penyimpanan, id_bentuk):
+        """View ke bentuk yang sudah ada di `penyimpanan` (mis. hasil `muat_biner`), tanpa menambah baris."""
+        bentuk = cls.__new__(cls)
+        bentuk.penyimpanan, bentuk.id = penyimpanan, id_bentuk
+        return bentuk
+
+    @property
+    def tipe_bentuk(self):
+        return PenyimpananBentuk.TIPE[self.penyimpanan.tipe[self.id]]
+
+    @property
+    def warna(self):
+        return self.penyimpanan.palet[self.penyimpanan.indeks_warna[self.id]]
+
+    @warna.setter
+    def warna(self, warna):
+        self.penyimpanan.indeks_warna[self.id] = self.penyimpanan.indeks_palet(warna)
+
+    @property
+    def ketebalan(self):
+        return float(self.penyimpanan.ketebalan[self.id])
+
+    @ketebalan.setter
+    def ketebalan(self, ketebalan):
+        self.penyimpanan.ketebalan[self.id] = ketebalan
+
+    @property
+    def simpul(self):
+        return self.penyimpanan.simpul_bentuk(self.id)
+
+    @simpul.setter
+    def simpul(self, simpul):
+        self.penyimpanan.atur_simpul(self.id, simpul)
 
     def gambar(self, timpa_warna=None, mode_gambar=GL_LINE_LOOP):
 
@@ -21,82 +137,130 @@ class Shape:
         glBegin(mode_gambar)
 
 
-        for simpul_tunggal in self.simpul:
+        for simpul_tunggal in self.dapatkan_simpul_hasil_transformasi():
             glVertex2f(simpul_tunggal[0], simpul_tunggal[1])
         glEnd()
 
     def get_titikPusat(self):
 
-        if not self.simpul: return 0, 0
+        if not len(self.simpul): return 0, 0
 
-        # Hitung rata-rata dari semua koordinat x dan y.
-        koordinat_x = [s[0] for s in self.simpul]
-        koordinat_y = [s[1] for s in self.simpul]
+        # Rata-rata semua koordinat x dan y, diambil dari cache penyimpanan.
+        pusat_x, pusat_y = self.penyimpanan.pusat_bentuk(self.id).tolist()
+        return pusat_x, pusat_y
 
-        return sum(koordinat_x) / len(koordinat_x), sum(koordinat_y) / len(koordinat_y)
-
-    def transformasi(self, matriks):
+    def get_batas(self):
+        """Kotak pembatas (min_x, min_y, max_x, max_y) dalam koordinat layar (di-cache)."""
+        min_x, min_y, max_x, max_y = self.penyimpanan.batas_bentuk(self.id).tolist()
+        return min_x, min_y, max_x, max_y
 
-        simpul_baru = []
-        for x, y in self.simpul:
-            vektor = np.array([x, y, 1])
-            vektor_hasil = matriks @ vektor # perkalian matriks.
-            simpul_baru.append((vektor_hasil[0], vektor_hasil[1]))# Kembalikan ke koordinat 2D dan simpan.
+    def dapatkan_simpul_hasil_transformasi(self):
+        """Simpul dalam koordinat layar (di-cache, hanya dihitung ulang setelah bentuk berubah)."""
+        return self.penyimpanan.simpul_dunia_bentuk(self.id)
 
-        self.simpul = simpul_baru
+    def transformasi(self, matriks):
+        # Hanya matriks gabungan bentuk yang dikalikan; simpul dihitung ulang saat dibutuhkan.
+        self.penyimpanan.gabung_matriks(self.id, matriks)
 
 # ============================================ ====================================================
 class Titik(Shape):
+    __slots__ = ()
 
-    def __init__(self, p1, warna, ketebalan):
-        super().__init__("titik", warna, ketebalan)
-        self.simpul.append(p1)
+    def __init__(self, p1, warna, ketebalan, penyimpanan=None):
+        super().__init__("titik", warna, ketebalan, penyimpanan)
+        self.simpul = [p1]
 
     def gambar(self, timpa_warna=None):
         glColor3fv(timpa_warna or self.warna)
         glPointSize(self.ketebalan * 2)
         glBegin(GL_POINTS)
-        glVertex2f(self.simpul[0][0], self.simpul[0][1])
+        x, y = self.dapatkan_simpul_hasil_transformasi()[0]
+        glVertex2f(x, y)
         glEnd()
 
 class Garis(Shape):
+    __slots__ = ()
 
-    def __init__(self, p1, p2, warna, ketebalan):
-        super().__init__("garis", warna, ketebalan)
-        self.simpul.extend([p1, p2])
+    def __init__(self, p1, p2, warna, ketebalan, penyimpanan=None):
+        super().__init__("garis", warna, ketebalan, penyimpanan)
+        self.simpul = [p1, p2]
 
     def gambar(self, timpa_warna=None):
         # Memanggil metode gambar dari parent class dengan mode GL_LINES.
         super().gambar(timpa_warna, GL_LINES)
 
 class Persegi(Shape):
+    __slots__ = ()
 
-    def __init__(self, p1, p2, warna, ketebalan):
-        super().__init__("persegi", warna, ketebalan)
+    def __init__(self, p1, p2, warna, ketebalan, penyimpanan=None):
+        super().__init__("persegi", warna, ketebalan, penyimpanan)
         min_x, max_x = min(p1[0], p2[0]), max(p1[0], p2[0])
         min_y, max_y = min(p1[1], p2[1]), max(p1[1], p2[1])
         # Buat 4 simpul dari dua titik diagonal.
-        self.simpul.extend([(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)])
+        self.simpul = [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
 
 class Elips(Shape):
+    __slots__ = ()
 
-    def __init__(self, pusat, radius_x, radius_y, warna, ketebalan):
-        super().__init__("elips", warna, ketebalan)
+    def __init__(self, pusat, radius_x, radius_y, warna, ketebalan, penyimpanan=None):
+        super().__init__("elips", warna, ketebalan, penyimpanan)
         self.pusat = pusat  # Titik pusat elips.
         self.radius_x = radius_x  # Radius horizontal.
         self.radius_y = radius_y  # Radius vertikal.
         self.sudut = 0.0  # Sudut rotasi dalam derajat.
         self._buat_simpul()
 
+    @property
+    def pusat(self):
+        pusat_x, pusat_y = self.penyimpanan.pusat[self.id].tolist()
+        return pusat_x, pusat_y
+
+    @pusat.setter
+    def pusat(self, pusat):
+        self.penyimpanan.pusat[self.id] = pusat
+        self.penyimpanan.tandai_berubah(self.id)
+
+    @property
+    def radius_x(self):
+        return self.penyimpanan.radius[self.id, 0]
+
+    @radius_x.setter
+    def radius_x(self, radius_x):
+        self.penyimpanan.radius[self.id, 0] = radius_x
+        self.penyimpanan.tandai_berubah(self.id)
+        self._sesuaikan_segmen()
+
+    @property
+    def radius_y(self):
+        return self.penyimpanan.radius[self.id, 1]
+
+    @radius_y.setter
+    def radius_y(self, radius_y):
+        self.penyimpanan.radius[self.id, 1] = radius_y
+        self.penyimpanan.tandai_berubah(self.id)
+        self._sesuaikan_segmen()
+
+    @property
+    def sudut(self):
+        return self.penyimpanan.sudut[self.id]
+
+    @sudut.setter
+    def sudut(self, sudut):
+        self.penyimpanan.sudut[self.id] = sudut
+        self.penyimpanan.tandai_berubah(self.id)
+
     def _buat_simpul(self):
 
-        self.simpul = []
-        jumlah_segmen = 72  # Jumlah segmen yang cukup untuk membuat elips terlihat halus.
-        for i in range(jumlah_segmen):
-            sudut_segmen = 2 * math.pi * i / jumlah_segmen
-            x = self.radius_x * math.cos(sudut_segmen)
-            y = self.radius_y * math.sin(sudut_segmen)
-            self.simpul.append((x, y))
+        # Jumlah segmen mengikuti ukuran elips di layar (koordinat layar = piksel).
+        # Simpulnya lingkaran satuan dari tabel bersama; radius diterapkan saat menggambar
+        # dan menghitung simpul layar, sehingga penskalaan tidak perlu membuat ulang simpul.
+        self.simpul = lingkaran_satuan(jumlah_segmen_elips(self.radius_x, self.radius_y))
+
+    def _sesuaikan_segmen(self):
+        # Buat ulang simpul hanya jika perubahan radius mengubah jumlah segmen.
+        panjang = self.penyimpanan.panjang[self.id]
+        if panjang and panjang != jumlah_segmen_elips(self.radius_x, self.radius_y):
+            self._buat_simpul()
 
     def gambar(self, timpa_warna=None):
         """
@@ -116,7 +280,7 @@ class Elips(Shape):
         # 4. Gambar simpul-simpul elips (yang berpusat di 0,0) pada sistem koordinat
         #    yang sudah ditransformasi.
         glBegin(GL_LINE_LOOP)
-        for simpul_tunggal in self.simpul:
+        for simpul_tunggal in self.simpul * (self.radius_x, self.radius_y):
             glVertex2f(simpul_tunggal[0], simpul_tunggal[1])
         glEnd()
 
@@ -125,21 +289,6 @@ class Elips(Shape):
     def get_titikPusat(self):
         return self.pusat
 
-    def dapatkan_simpul_hasil_transformasi(self):
-        hasil_transformasi = []
-        sudut_rad = math.radians(self.sudut)
-        cos_s, sin_s = math.cos(sudut_rad), math.sin(sudut_rad)
-        for x_local, y_local in self.simpul:
-
-            rotate_x = x_local * cos_s - y_local * sin_s
-            rotate_y = x_local * sin_s + y_local * cos_s
-
-            # meambahkan translasi untuk mendapatkan koordinat global.
-            x_global = rotate_x + self.pusat[0]
-            y_global = rotate_y + self.pusat[1]
-            hasil_transformasi.append((x_global, y_global))
-        return hasil_transformasi
-
     def transformasi(self, matriks):
         """Override metode transformasi khusus untuk Elips."""
         # Terapkan translasi pada pusat elips.
@@ -154,17 +303,98 @@ class Elips(Shape):
             perubahan_sudut_rad = math.atan2(matriks[1, 0], matriks[0, 0])
             self.sudut += math.degrees(perubahan_sudut_rad)
 
-        # Penskalaan dihandle di `terapkan_transformasi` dengan mengubah radius.
-        self._buat_simpul()
+        # Penskalaan dihandle di `terapkan_transformasi` dengan mengubah radius;
+        # simpul lingkaran satuan tidak perlu dibuat ulang.
+
+
+KELAS_BENTUK = {PenyimpananBentuk.TITIK: Titik, PenyimpananBentuk.GARIS: Garis,
+                PenyimpananBentuk.PERSEGI: Persegi, PenyimpananBentuk.ELIPS: Elips}
+
+
+class DaftarBentuk:
+    """
+    Daftar bentuk scene dalam urutan gambar. Yang disimpan hanyalah array id; objek view
+    (`Titik`, `Garis`, ...) dibuat saat pertama kali diakses lalu diingat, sehingga scene
+    yang dimuat dari berkas tidak perlu membuat objek untuk jutaan bentuk sekaligus.
+    """
+
+    def __init__(self, penyimpanan):
+        self.penyimpanan = penyimpanan
+        self._ids = np.zeros(64, dtype=np.int64)
+        self._jumlah = 0
+        self._objek = {}
+
+    def __len__(self):
+        return self._jumlah
+
+    def ids(self):
+        """Array id sesuai urutan gambar (view; jangan diubah)."""
+        return self._ids[:self._jumlah]
+
+    def bentuk(self, id_bentuk):
+        objek = self._objek.get(id_bentuk)
+        if objek is None:
+            kelas = KELAS_BENTUK[self.penyimpanan.tipe[id_bentuk]]
+            objek = self._objek[id_bentuk] = kelas.dari_id(self.penyimpanan, id_bentuk)
+        return objek
+
+    def __getitem__(self, indeks):
+        if isinstance(indeks, slice):
+            return [self.bentuk(id_bentuk) for id_bentuk in self.ids()[indeks].tolist()]
+        return self.bentuk(int(self.ids()[indeks]))
+
+    def __iter__(self):
+        for id_bentuk in self.ids().tolist():
+            yield self.bentuk(id_bentuk)
+
+    def append(self, bentuk):
+        if self._jumlah == len(self._ids):
+            self._ids = np.concatenate((self._ids, np.zeros(max(len(self._ids), 64), dtype=np.int64)))
+        self._ids[self._jumlah] = bentuk.id
+        self._jumlah += 1
+        self._objek[bentuk.id] = bentuk
+
+    def atur_ids(self, ids):
+        """Ganti isi daftar dengan id-id ini; objeknya baru dibuat saat diakses."""
+        self._ids = np.array(ids, dtype=np.int64)
+        self._jumlah = len(self._ids)
+        self._objek = {}
+
+    def clear(self):
+        self._jumlah = 0
+        self._objek = {}
 
 
 #==========================================================================================
 class Main:
-    def __init__(self):
+    RENDERER = ('daftar', 'langsung', 'vbo')
+    BACKEND_POTONG = ('cpu', 'gpu')
+
+    def __init__(self, renderer='langsung', profiler=None, pekerja_potong=1, backend_potong='cpu'):
+        if renderer not in self.RENDERER:
+            raise ValueError(f"Renderer tidak dikenal: {renderer}")
+        if backend_potong not in self.BACKEND_POTONG:
+            raise ValueError(f"Backend pemotongan tidak dikenal: {backend_potong}")
+        # Dengan lebih dari satu pekerja, batch pemotongan yang besar dibagi ke beberapa proses.
+        self.pemotong_paralel = None
+        if pekerja_potong > 1:
+            self.pemotong_paralel = PemotongParalel(pekerja_potong)
+            atexit.register(self.pemotong_paralel.tutup)
+        # 'daftar' = DaftarGambar (daftar_gambar.py), 'langsung' = immediate mode per bentuk,
+        # 'vbo' = PenggambarVBO (renderer_vbo.py).
+        self.renderer = renderer
+        self.daftar_gambar = DaftarGambar()
+        self.penggambar_vbo = None
+        self.profiler = Profiler() if profiler is None else profiler
+        self.tekstur_info, self.kunci_info, self.ukuran_info = None, None, (0, 0)
         self.lebar, self.tinggi = 1280, 720
         self.header_primaryWindow = b"Modul_A"
+        self.path_scene = 'scene.bin'  # tujuan tombol 'k' (biner; JSON jika berakhiran .json)
 
-        self.daftar_bentuk, self.titik_sementara, self.bentuk_terpilih = [], [], None
+        self.titik_sementara = []
+        # Id bentuk terpilih (terurut, unik); kotak_seret = (x0, y0, x1, y1) selama seleksi kotak.
+        self.ids_terpilih = np.zeros(0, dtype=np.int64)
+        self.kotak_seret, self.tambah_seleksi = None, False
         self.mode_sekarang = 'PILIH'
         self.pilihan_mode = {
             '1': 'GAMBAR_TITIK', 'd': 'GAMBAR_TITIK', '2': 'GAMBAR_GARIS', 'l': 'GAMBAR_GARIS',
@@ -202,13 +432,29 @@ class Main:
             (0.6, 0.9, 0.9),  # Pastel Cyan
             (0.9, 0.6, 0.9),  # Pastel Magenta
         ]
+        # Semua bentuk di `daftar_bentuk` disimpan di sini (lihat penyimpanan_bentuk.py).
+        self.penyimpanan = PenyimpananBentuk(palet=self.daftar_warna)
+        self.daftar_bentuk = DaftarBentuk(self.penyimpanan)
+        # Grid kotak pembatas untuk picking dan culling jendela.
+        self.indeks_spasial = IndeksSpasial()
+        self.indeks_spasial_kotor = set()  # id bentuk yang kotaknya belum diperbarui di indeks
+
+        self.profiler.daftarkan_penghitung('jumlah_bentuk', lambda: len(self.daftar_bentuk))
+        self.cache_pemotongan = CachePemotongan(self.penyimpanan, self.algoritma_garis_batch,
+                                                self.algoritma_sutherland_hodgman_batch)
         self.indeks_warna = 2
         self.warna_sekarang = self.daftar_warna[self.indeks_warna]
         self.ketebalan_sekarang = 2.0
         self.window_clipping = None
         self.warna_potong = (0.2, 0.8, 0.2)
+        self.metode_potong_garis = 'cohen_sutherland'  # atau 'liang_barsky'
+        # 'cpu' = tampilan memakai hasil Cohen-Sutherland/Sutherland-Hodgman, 'gpu' = bidang potong
+        # OpenGL + stencil (gambar_terpotong_gpu); hasil potong CPU tetap tersedia lewat potong_semua_bentuk.
+        self.backend_potong = backend_potong
         self.drag_window = False
         self.posisi_awal_geser = None
+        # Gerak mouse dan transformasi berulang digabung menjadi satu perubahan per frame (masukan.py).
+        self.masukan = PenggabungMasukan(glutPostRedisplay)
         self.DI_DALAM, self.KIRI, self.KANAN, self.BAWAH, self.ATAS = 0, 1, 2, 4, 8
 
 
@@ -223,6 +469,12 @@ class Main:
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
+        if self.renderer == 'vbo':
+            self.penggambar_vbo = PenggambarVBO(self.penyimpanan)
+
+        # Tekstur teks bantuan milik konteks GL ini; dibuat saat frame pertama.
+        self.tekstur_info, self.kunci_info = None, None
+
     def display_infoMenu(self):
 
         baris_bantuan = [
@@ -237,7 +489,7 @@ class Main:
             "--- KONTROL ---",
             f"[c] untuk ganti Warna: {self.warna_sekarang}",
             f"[+/-] untuk ubah Tebal: {self.ketebalan_sekarang:.1f}",
-            "[x] Hapus Semua | [ESC] Batal Pilih Mode",
+            "[x] Hapus Semua | [k] Simpan Scene | [p] Profiler | [ESC] Batal Pilih Mode",
 
             " ",
 
@@ -253,85 +505,368 @@ class Main:
             baris_bantuan.append("\nJendela Pemotongan Aktif. Klik & seret untuk geser.")
         return baris_bantuan
 
-    def gambar_teks(self, x, y, teks, font=GLUT_BITMAP_9_BY_15):
+    def gambar_teks(self, x, y, teks, font=GLUT_BITMAP_9_BY_15, warna=(0.1, 0.1, 0.1)):
 
-        glColor3f(0.1, 0.1, 0.1)
+        glColor3f(*warna)
         glRasterPos2f(x, y)
         for karakter in teks:
             glutBitmapCharacter(font, ord(karakter))
 
     def tampilkan(self):
 
+        profiler = self.profiler
+        with profiler.fase('masukan'):
+            self.terapkan_masukan()
+        with profiler.fase('hud'):
+            self.siapkan_info()
+        self.gambar_scene()
+        with profiler.fase('hud'):
+            self.gambar_info()
+        if profiler.overlay:
+            with profiler.fase('overlay'):
+                self.gambar_overlay_profiler()
+
+        with profiler.fase('swap'):
+            glutSwapBuffers()
+        jumlah_event, latensi_maks = self.masukan.swap_selesai()
+        profiler.tambah('latensi_maks_ms', latensi_maks)
+        profiler.tambah('event_per_frame', jumlah_event)
+        profiler.akhir_frame()
+
+    def cetak_latensi(self):
+        """Cetak histogram latensi event -> swap (dipanggil saat keluar jika profiler aktif)."""
+        if self.profiler.aktif and len(self.masukan.histogram):
+            print("Latensi event masukan sampai swap buffer:")
+            print('\n'.join(self.masukan.histogram.baris()))
+
+    def gambar_overlay_profiler(self):
+        """Persentil waktu fase (ms) dan penghitung dari `profiler`, di pojok kanan atas."""
+        offset_y = 20
+        for baris in self.profiler.baris_overlay():
+            self.gambar_teks(self.lebar - 400, offset_y, baris)
+            offset_y += 17
+
+    def siapkan_info(self):
+        """
+        Render teks bantuan sekali ke tekstur (mask intensitas) dan buat ulang hanya jika keadaan
+        yang ditampilkan (mode, warna, ketebalan, jendela aktif, ukuran jendela) berubah.
+        Dipanggil sebelum `gambar_scene` karena memakai framebuffer sebagai tempat render sementara.
+        """
+        kunci = (self.mode_sekarang, self.warna_sekarang, self.ketebalan_sekarang, bool(self.window_clipping),
+                 self.lebar, self.tinggi)
+        if self.tekstur_info is not None and kunci == self.kunci_info:
+            return
+        if self.tekstur_info is None:
+            self.tekstur_info = glGenTextures(1)
+
+        glPushAttrib(GL_COLOR_BUFFER_BIT)
+        glClearColor(0.0, 0.0, 0.0, 1.0)
         glClear(GL_COLOR_BUFFER_BIT)
         glLoadIdentity()
+        offset_y, panjang_maks = 20, 0
+        for baris in self.display_infoMenu():
+            for bagian in baris.split('\n'):
+                self.gambar_teks(10, offset_y, bagian, warna=(1.0, 1.0, 1.0))
+                offset_y += 17
+                panjang_maks = max(panjang_maks, len(bagian))
+
+        # Salin area teks (pojok kiri atas layar = baris framebuffer paling atas) ke tekstur.
+        lebar, tinggi = min(self.lebar, 10 + 9 * (panjang_maks + 1)), min(self.tinggi, offset_y)
+        glBindTexture(GL_TEXTURE_2D, self.tekstur_info)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glCopyTexImage2D(GL_TEXTURE_2D, 0, GL_INTENSITY, 0, self.tinggi - tinggi, lebar, tinggi, 0)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glPopAttrib()
+
+        self.ukuran_info, self.kunci_info = (lebar, tinggi), kunci
+
+    def gambar_info(self):
+        """Gambar teks bantuan dari tekstur `siapkan_info` dengan satu quad."""
+        lebar, tinggi = self.ukuran_info
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.tekstur_info)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glColor3f(0.1, 0.1, 0.1)  # Warna teks; alpha dari mask sehingga latar tetap terlihat.
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 0); glVertex2f(0, tinggi)
+        glTexCoord2f(1, 0); glVertex2f(lebar, tinggi)
+        glTexCoord2f(1, 1); glVertex2f(lebar, 0)
+        glTexCoord2f(0, 1); glVertex2f(0, 0)
+        glEnd()
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
 
-        for bentuk in self.daftar_bentuk:
-            if self.window_clipping:
-                self.gambar_terpotong(bentuk)
-            else:
-                bentuk.gambar()
+    def gambar_scene(self):
+        """Gambar semua bentuk, kotak seleksi dan jendela pemotongan (tanpa teks info dan swap buffer)."""
+        profiler = self.profiler
+        glClear(GL_COLOR_BUFFER_BIT)
+        glLoadIdentity()
+
+        if self.penggambar_vbo and not self.window_clipping:
+            # Semua bentuk dari vertex buffer dalam beberapa draw call.
+            with profiler.fase('bentuk'):
+                self.penggambar_vbo.gambar(self.ids_bentuk())
+            with profiler.fase('seleksi'):
+                self.gambar_kotak_seleksi()
+            return
 
-            if bentuk.terpilih:
-                self.gambar_kotak_seleksi(bentuk)
+        if self.window_clipping and self.backend_potong == 'gpu':
+            with profiler.fase('bentuk'):
+                self.gambar_terpotong_gpu()
+            with profiler.fase('seleksi'):
+                self.gambar_kotak_seleksi()
+            with profiler.fase('jendela'):
+                self.draw_window_clipping()
+            return
 
+        # Semua garis dan poligon dipotong sekaligus dalam panggilan batch, bukan per bentuk.
+        hasil_potong = None
         if self.window_clipping:
-            self.draw_window_clipping()
+            with profiler.fase('potong'):
+                hasil_potong = self.potong_semua_bentuk()
+
+        if self.renderer != 'langsung':
+            # Semua primitif frame ini (termasuk kotak seleksi) dikirim per kelompok keadaan.
+            with profiler.fase('bentuk'):
+                self.isi_daftar_gambar(hasil_potong)
+                self.daftar_gambar.kirim()
+            profiler.tambah('draw_call', self.daftar_gambar.jumlah_draw_call)
+            profiler.tambah('ganti_state', self.daftar_gambar.jumlah_ganti_state)
+            if self.window_clipping:
+                with profiler.fase('jendela'):
+                    self.draw_window_clipping()
+            return
 
-        offset_y = 20
-        for baris in self.display_infoMenu():
-            for bagian in baris.split('\n'):
-                self.gambar_teks(10, offset_y, bagian)
-                offset_y += 17
+        with profiler.fase('bentuk'):
+            for i, bentuk in enumerate(self.daftar_bentuk):
+                if self.window_clipping:
+                    self.gambar_terpotong(bentuk, hasil_potong[i])
+                else:
+                    bentuk.gambar()
 
-        glutSwapBuffers()
+        # Kotak seleksi digambar setelah semua bentuk, dalam satu draw call.
+        with profiler.fase('seleksi'):
+            self.gambar_kotak_seleksi()
 
-    def gambar_terpotong(self, bentuk):
+        if self.window_clipping:
+            with profiler.fase('jendela'):
+                self.draw_window_clipping()
 
+    def isi_daftar_gambar(self, hasil_potong=None):
+        """
+        Isi `daftar_gambar` dengan primitif yang digambar `gambar_scene` per bentuk: bentuk utuh, atau
+        dengan `hasil_potong` (dari `potong_semua_bentuk`) titik di dalam jendela, garis terpotong, dan
+        isi transparan + outline poligon terpotong; lalu kotak seleksi di atas semuanya.
+        """
+        daftar, penyimpanan = self.daftar_gambar, self.penyimpanan
+        ids = self.ids_bentuk()
+        simpul, offset = penyimpanan.simpul_dunia(ids)
+        tipe, ketebalan = penyimpanan.tipe[ids], penyimpanan.ketebalan[ids]
+        titik = tipe == PenyimpananBentuk.TITIK
+        # Kunci 2i untuk isi bentuk ke-i dan 2i + 1 untuk garisnya, agar outline menimpa isinya sendiri.
+        kunci = 2 * np.arange(len(ids)) + 1
+
+        if hasil_potong is None:
+            palet = np.asarray(penyimpanan.palet, dtype=np.float32).reshape(-1, 3)
+            daftar.tambah(MODE_GAMBAR[tipe], simpul, np.diff(offset), kunci, np.where(titik, 2 * ketebalan, ketebalan),
+                          palet[penyimpanan.indeks_warna[ids]])
+        else:
+            x_min, y_min, x_max, y_max = self.window_clipping
+            p = simpul[offset[:-1][titik]]
+            di_dalam = (p[:, 0] >= x_min) & (p[:, 0] <= x_max) & (p[:, 1] >= y_min) & (p[:, 1] <= y_max)
+            daftar.tambah(GL_POINTS, p[di_dalam], np.ones(int(di_dalam.sum())), kunci[titik][di_dalam],
+                          2 * ketebalan[titik][di_dalam], self.warna_potong)
+
+            panjang = np.fromiter((0 if hasil is None else len(hasil) for hasil in hasil_potong), dtype=np.int64,
+                                  count=len(hasil_potong))
+            terlihat = np.flatnonzero(~titik & (panjang > 0))
+            if len(terlihat):
+                simpul_potong = np.concatenate([hasil_potong[i] for i in terlihat.tolist()]).reshape(-1, 2)
+                garis = tipe[terlihat] == PenyimpananBentuk.GARIS
+                poligon = terlihat[~garis]
+                pemilik_poligon = np.repeat(~garis, panjang[terlihat])
+                daftar.tambah(GL_LINES, simpul_potong[~pemilik_poligon], panjang[terlihat[garis]], kunci[terlihat[garis]],
+                              ketebalan[terlihat[garis]], self.warna_potong)
+                simpul_poligon = simpul_potong[pemilik_poligon]
+                daftar.tambah(GL_POLYGON, simpul_poligon, panjang[poligon], kunci[poligon] - 1, 0, self.warna_potong, 0.3)
+                daftar.tambah(GL_LINE_LOOP, simpul_poligon, panjang[poligon], kunci[poligon], ketebalan[poligon],
+                              self.warna_potong)
+
+        kotak = self.kotak_seleksi()
+        if self.kotak_seret:
+            x0, y0, x1, y1 = self.kotak_seret
+            kotak = np.concatenate((kotak, [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]))
+        daftar.tambah(GL_LINE_LOOP, kotak, np.full(len(kotak) // 4, 4), 2 * len(ids) + 1, 2.0, (0.3, 0.5, 0.8), 0.5)
+
+    def potong_semua_bentuk(self):
+        """
+        Potong semua garis serta persegi dan elips terhadap jendela lewat `cache_pemotongan`:
+        hanya bentuk yang memotong sisi jendela yang dipotong (dalam batch), dan hasilnya
+        diingat selama bentuk dan jendela tidak berubah. Mengembalikan list sepanjang
+        `daftar_bentuk`: simpul hasil potong (kosong jika tidak terlihat), atau None untuk titik.
+        """
+        ids = self.ids_bentuk()
+        hasil = [self.penyimpanan.simpul[:0]] * len(self.daftar_bentuk)
+
+        # Bentuk yang kotaknya tidak menyentuh jendela tidak perlu diperiksa sama sekali.
+        self.perbarui_indeks_spasial()
+        terlihat = np.flatnonzero(np.isin(ids, self.indeks_spasial.cari_persegi(*self.window_clipping)))
+        dipotong = self.cache_pemotongan.jumlah_dipotong
+        hasil_potong = self.cache_pemotongan.potong(ids[terlihat], self.window_clipping, self.metode_potong_garis)
+        for i, simpul in zip(terlihat.tolist(), hasil_potong):
+            hasil[i] = simpul
+        self.profiler.tambah('bentuk_dipotong', self.cache_pemotongan.jumlah_dipotong - dipotong)
+        return hasil
+
+    def gambar_terpotong(self, bentuk, hasil_potong=None):
+
+        simpul_layar = bentuk.dapatkan_simpul_hasil_transformasi()
         if bentuk.tipe_bentuk == 'titik':
-            if self.check_titik_di_dalam_jendela(bentuk.simpul[0]):
+            if self.check_titik_di_dalam_jendela(simpul_layar[0]):
                 bentuk.gambar(timpa_warna=self.warna_potong)
             return
 
         if bentuk.tipe_bentuk == 'garis':
-            accept, p1, p2 = self.algoritma_cohen_sutherland(bentuk.simpul[0], bentuk.simpul[1])
-
-            if accept:
-                Garis(p1, p2, self.warna_potong, bentuk.ketebalan).gambar()
+            if hasil_potong is None:
+                accept, p1, p2 = self.algoritma_cohen_sutherland(simpul_layar[0], simpul_layar[1])
+                hasil_potong = (p1, p2) if accept else ()
+
+            if len(hasil_potong):
+                # Langsung digambar, tanpa membuat objek Garis sementara.
+                glColor3fv(self.warna_potong)
+                glLineWidth(bentuk.ketebalan)
+                glBegin(GL_LINES)
+                for v in hasil_potong:
+                    glVertex2f(v[0], v[1])
+                glEnd()
             return
 
         if bentuk.tipe_bentuk in ['persegi', 'elips']:
-            poligon_subjek = bentuk.dapatkan_simpul_hasil_transformasi() if bentuk.tipe_bentuk == 'elips' else bentuk.simpul
-            poligon_hasil_potong = self.algoritma_sutherland_hodgman(poligon_subjek)
+            if hasil_potong is None:
+                hasil_potong = self.algoritma_sutherland_hodgman(simpul_layar)
 
-            if poligon_hasil_potong:
+            if len(hasil_potong):
                 glBegin(GL_POLYGON)
                 glColor4f(self.warna_potong[0], self.warna_potong[1], self.warna_potong[2], 0.3)
-                for v in poligon_hasil_potong:
+                for v in hasil_potong:
+                    glVertex2f(v[0], v[1])
+                glEnd()
+                glColor3fv(self.warna_potong)
+                glLineWidth(bentuk.ketebalan)
+                glBegin(GL_LINE_LOOP)
+                for v in hasil_potong:
                     glVertex2f(v[0], v[1])
                 glEnd()
-                bentuk_temporer = Shape('poligon', self.warna_potong, bentuk.ketebalan)
-                bentuk_temporer.simpul = poligon_hasil_potong
-                bentuk_temporer.gambar()
-
-    def gambar_kotak_seleksi(self, bentuk):
-
-        daftar_simpul = bentuk.dapatkan_simpul_hasil_transformasi() if bentuk.tipe_bentuk == 'elips' else bentuk.simpul
 
-        if not daftar_simpul:
+    def gambar_terpotong_gpu(self):
+        """
+        Seperti `gambar_terpotong` untuk semua bentuk, tetapi pemotongan dilakukan GPU: bentuk yang
+        kotaknya menyentuh jendela dimasukkan utuh (simpul layar dari penyimpanan) ke `daftar_gambar`,
+        yang dikirim per kelompok keadaan dengan empat bidang potong di sisi jendela. Sisi jendela yang
+        berada di dalam persegi/elips (bagian outline poligon hasil potong) digambar lewat stencil:
+        poligon ditandai di stencil, lalu garis jendela hanya digambar di piksel yang bertanda.
+        """
+        x_min, y_min, x_max, y_max = self.window_clipping
+        self.perbarui_indeks_spasial()
+        ids = self.ids_bentuk()
+        ids = ids[np.isin(ids, self.indeks_spasial.cari_persegi(x_min, y_min, x_max, y_max))]
+        if not len(ids):
+            return
+        penyimpanan, daftar = self.penyimpanan, self.daftar_gambar
+        simpul, offset = penyimpanan.simpul_dunia(ids)
+        awal, panjang = offset[:-1], np.diff(offset)
+        tipe, ketebalan = penyimpanan.tipe[ids], penyimpanan.ketebalan[ids]
+        titik, poligon = tipe == PenyimpananBentuk.TITIK, tipe >= PenyimpananBentuk.PERSEGI
+
+        # Urutan dan kunci sama seperti `isi_daftar_gambar`: isi transparan poligon tepat di bawah outline-nya.
+        kunci = 2 * np.arange(len(ids)) + 1
+        daftar.tambah(MODE_GAMBAR[tipe], simpul, panjang, kunci, np.where(titik, 2 * ketebalan, ketebalan),
+                      self.warna_potong)
+        daftar.tambah(GL_POLYGON, simpul[indeks_gabungan(awal[poligon], panjang[poligon])], panjang[poligon],
+                      kunci[poligon] - 1, 0, self.warna_potong, 0.3)
+        bidang = ((1, 0, 0, -x_min), (-1, 0, 0, x_max), (0, 1, 0, -y_min), (0, -1, 0, y_max))
+        for i, persamaan in enumerate(bidang):
+            glClipPlane(GL_CLIP_PLANE0 + i, persamaan)
+            glEnable(GL_CLIP_PLANE0 + i)
+        daftar.kirim()
+        for i in range(len(bidang)):
+            glDisable(GL_CLIP_PLANE0 + i)
+        self.profiler.tambah('draw_call', daftar.jumlah_draw_call)
+        self.profiler.tambah('ganti_state', daftar.jumlah_ganti_state)
+
+        # Hanya poligon yang melewati sisi jendela yang punya outline di sepanjang sisi jendela.
+        kotak = penyimpanan.batas(ids)
+        melewati_sisi = poligon & ((kotak[:, 0] < x_min) | (kotak[:, 1] < y_min)
+                                   | (kotak[:, 2] > x_max) | (kotak[:, 3] > y_max))
+        if melewati_sisi.any():
+            self.gambar_sisi_jendela_stencil(simpul, awal, panjang, kotak, ketebalan, melewati_sisi)
+        self.profiler.tambah('poligon_stencil', int(melewati_sisi.sum()))
+
+    def gambar_sisi_jendela_stencil(self, simpul, awal, panjang, kotak, ketebalan, melewati_sisi):
+        """
+        Garis jendela di dalam poligon `melewati_sisi` (simpul layar terkemas), per ketebalan. Garis hanya
+        menyentuh piksel sejauh setengah ketebalannya dari sisi jendela, jadi stencil ditandai per sisi di
+        jalur selebar itu (scissor) saja, dan hanya oleh poligon yang kotaknya menyentuh jalur tersebut;
+        poligon utuh bisa jauh lebih besar dari jendela, dan merasterisasinya di seluruh jendela mahal.
+        """
+        x_min, y_min, x_max, y_max = self.window_clipping
+        tepi = math.ceil(float(ketebalan[melewati_sisi].max()) / 2) + 1
+        awal, panjang = awal.astype(np.int32), panjang.astype(np.int32)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_DOUBLE, 0, simpul)
+        glEnable(GL_SCISSOR_TEST)
+        glEnable(GL_STENCIL_TEST)
+        for (x0, y0), (x1, y1) in (((x_min, y_min), (x_max, y_min)), ((x_max, y_min), (x_max, y_max)),
+                                   ((x_min, y_max), (x_max, y_max)), ((x_min, y_min), (x_min, y_max))):
+            kiri, atas = math.floor(x0) - tepi, math.floor(y0) - tepi
+            kanan, bawah = math.ceil(x1) + tepi, math.ceil(y1) + tepi
+            di_jalur = melewati_sisi & (kotak[:, 0] <= kanan) & (kotak[:, 2] >= kiri) & (kotak[:, 1] <= bawah) & (kotak[:, 3] >= atas)
+            if not di_jalur.any():
+                continue
+            glScissor(kiri, self.tinggi - bawah, kanan - kiri, bawah - atas)
+            for nilai in np.unique(ketebalan[di_jalur]).tolist():
+                kelompok = di_jalur & (ketebalan == nilai)
+                glClear(GL_STENCIL_BUFFER_BIT)
+                glStencilFunc(GL_ALWAYS, 1, 0xFF)
+                glStencilOp(GL_KEEP, GL_KEEP, GL_REPLACE)
+                glColorMask(GL_FALSE, GL_FALSE, GL_FALSE, GL_FALSE)
+                glMultiDrawArrays(GL_POLYGON, awal[kelompok], panjang[kelompok], int(kelompok.sum()))
+                glColorMask(GL_TRUE, GL_TRUE, GL_TRUE, GL_TRUE)
+                glStencilFunc(GL_EQUAL, 1, 0xFF)
+                glStencilOp(GL_KEEP, GL_KEEP, GL_KEEP)
+                glColor3fv(self.warna_potong)
+                glLineWidth(nilai)
+                glBegin(GL_LINES)
+                glVertex2f(x0, y0); glVertex2f(x1, y1)
+                glEnd()
+        glDisable(GL_STENCIL_TEST)
+        glDisable(GL_SCISSOR_TEST)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def kotak_seleksi(self):
+        """Simpul (4k, 2) kotak seleksi semua bentuk terpilih (kotak pembatas diperbesar 5 piksel)."""
+        ids = self.ids_terpilih[self.penyimpanan.panjang[self.ids_terpilih] > 0]
+        min_x, min_y, max_x, max_y = (self.penyimpanan.batas(ids) + (-5, -5, 5, 5)).T
+        return np.stack((np.column_stack((min_x, min_y)), np.column_stack((max_x, min_y)),
+                         np.column_stack((max_x, max_y)), np.column_stack((min_x, max_y))), axis=1).reshape(-1, 2)
+
+    def gambar_kotak_seleksi(self):
+        """Kotak seleksi semua bentuk terpilih dan kotak seret (jika ada) dalam satu draw call."""
+        simpul = self.kotak_seleksi()
+        if self.kotak_seret:
+            x0, y0, x1, y1 = self.kotak_seret
+            simpul = np.concatenate((simpul, [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]))
+        if not len(simpul):
             return
-
-        koordinat_x = [s[0] for s in daftar_simpul]
-        koordinat_y = [s[1] for s in daftar_simpul]
-        min_x, max_x, min_y, max_y = min(koordinat_x), max(koordinat_x), min(koordinat_y), max(koordinat_y)
 
         glColor4f(0.3, 0.5, 0.8, 0.5);
         glLineWidth(2.0)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(min_x - 5, min_y - 5);
-        glVertex2f(max_x + 5, min_y - 5)
-        glVertex2f(max_x + 5, max_y + 5);
-        glVertex2f(min_x - 5, max_y + 5)
-        glEnd()
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_DOUBLE, 0, np.ascontiguousarray(simpul))
+        jumlah = len(simpul) // 4
+        glMultiDrawArrays(GL_LINE_LOOP, np.arange(0, 4 * jumlah, 4, dtype=np.int32), np.full(jumlah, 4, dtype=np.int32), jumlah)
+        glDisableClientState(GL_VERTEX_ARRAY)
 
     def draw_window_clipping(self):
         x_min, y_min, x_max, y_max = self.window_clipping
@@ -357,6 +892,11 @@ class Main:
         glLoadIdentity()
 
     def shortcut_keyboard(self, tombol, x, y):
+        if len(self.ids_terpilih) and tombol in TOMBOL_ROTASI:
+            self.masukan.transformasi('rotasi', TOMBOL_ROTASI[tombol])
+            return
+        # Event lain bisa mengganti bentuk terpilih atau mode: terapkan dulu perubahan yang tertunda.
+        self.terapkan_masukan()
         teks_tombol = tombol.decode("utf-8").lower()
 
         if teks_tombol in self.pilihan_mode:
@@ -367,85 +907,68 @@ class Main:
         elif teks_tombol == 'c':
             self.indeks_warna = (self.indeks_warna + 1) % len(self.daftar_warna)
             self.warna_sekarang = self.daftar_warna[self.indeks_warna]
-            if self.bentuk_terpilih: self.bentuk_terpilih.warna = self.warna_sekarang
+            if len(self.ids_terpilih):
+                self.penyimpanan.indeks_warna[self.ids_terpilih] = self.penyimpanan.indeks_palet(self.warna_sekarang)
 
         elif tombol == b'+' or tombol == b'=':
             self.ketebalan_sekarang = min(20.0, self.ketebalan_sekarang + 0.5)
-            if self.bentuk_terpilih: self.bentuk_terpilih.ketebalan = self.ketebalan_sekarang
+            self.penyimpanan.ketebalan[self.ids_terpilih] = self.ketebalan_sekarang
 
         elif tombol == b'-' or tombol == b'_':
             self.ketebalan_sekarang = max(1.0, self.ketebalan_sekarang - 0.5)
-            if self.bentuk_terpilih: self.bentuk_terpilih.ketebalan = self.ketebalan_sekarang
+            self.penyimpanan.ketebalan[self.ids_terpilih] = self.ketebalan_sekarang
+
+        elif teks_tombol == 'p':
+            # Tampilkan/sembunyikan overlay profiler (profiler diaktifkan saat pertama kali dibuka).
+            self.profiler.aktif = True
+            self.profiler.overlay = not self.profiler.overlay
+
+        elif teks_tombol == 'k':
+            self.simpan_scene(self.path_scene)
+            print(f"Scene disimpan ke {self.path_scene}")
 
         elif teks_tombol == 'x':
-            self.daftar_bentuk.clear();
-            self.bentuk_terpilih = None;
-            self.window_clipping = None
+            self.kosongkan_scene()
 
         elif ord(tombol) == 27:
-            if self.bentuk_terpilih: self.bentuk_terpilih.terpilih = False; self.bentuk_terpilih = None
+            self.ids_terpilih = self.ids_terpilih[:0]
             self.titik_sementara = []
 
             if 'GAMBAR' in self.mode_sekarang or 'TENTUKAN' in self.mode_sekarang: self.mode_sekarang = 'PILIH'
 
-        if self.bentuk_terpilih:
-            if tombol == b'[' or tombol == b'{':
-                self.terapkan_transformasi(self.bentuk_terpilih, 'rotasi', -5)
-
-            elif tombol == b']' or tombol == b'}':
-                self.terapkan_transformasi(self.bentuk_terpilih, 'rotasi', 5)
-
-        glutPostRedisplay()
+        self.masukan.catat_event()
 
     def shortcut_keyboard2(self, tombol, x, y):
-        if self.bentuk_terpilih:
-            if tombol == GLUT_KEY_UP:
-                self.terapkan_transformasi(self.bentuk_terpilih, 'translasi', (0, -5))
-
-            elif tombol == GLUT_KEY_DOWN:
-                self.terapkan_transformasi(self.bentuk_terpilih, 'translasi', (0, 5))
-
-            elif tombol == GLUT_KEY_LEFT:
-                self.terapkan_transformasi(self.bentuk_terpilih, 'translasi', (-5, 0))
-
-            elif tombol == GLUT_KEY_RIGHT:
-                self.terapkan_transformasi(self.bentuk_terpilih, 'translasi', (5, 0))
-
-            elif tombol == GLUT_KEY_PAGE_UP:
-                self.terapkan_transformasi(self.bentuk_terpilih, 'skala', 1.05)
-
-            elif tombol == GLUT_KEY_PAGE_DOWN:
-                self.terapkan_transformasi(self.bentuk_terpilih, 'skala', 0.95)
-
-        glutPostRedisplay()
+        if len(self.ids_terpilih) and tombol in TOMBOL_TRANSFORMASI:
+            self.masukan.transformasi(*TOMBOL_TRANSFORMASI[tombol])
+        else:
+            self.masukan.catat_event()
 
     def mouse(self, tombol, status, x, y):
 
+        self.terapkan_masukan()
         if tombol == GLUT_LEFT_BUTTON:
             if status == GLUT_DOWN:
                 if self.window_clipping and self.check_titik_di_dalam_jendela((x, y)):
                     self.drag_window = True;
                     self.posisi_awal_geser = (x, y);
-                    glutPostRedisplay();
+                    self.masukan.catat_event();
                     return
 
                 if self.mode_sekarang == 'PILIH':
-                    if self.bentuk_terpilih: self.bentuk_terpilih.terpilih = False
-                    self.bentuk_terpilih = None
-
-                    for bentuk in reversed(self.daftar_bentuk):
-                        simpul = bentuk.dapatkan_simpul_hasil_transformasi() if bentuk.tipe_bentuk == 'elips' else bentuk.simpul
-                        koordinat_x = [s[0] for s in simpul];
-                        koordinat_y = [s[1] for s in simpul]
-
-                        if not (min(koordinat_x) < x < max(koordinat_x) and min(koordinat_y) < y < max(
-                            koordinat_y)): continue
-                        self.bentuk_terpilih = bentuk;
-                        bentuk.terpilih = True;
-                        break
+                    # Shift+klik menambah/membuang bentuk dari seleksi; klik di tempat kosong memulai seleksi kotak.
+                    tambah = bool(glutGetModifiers() & GLUT_ACTIVE_SHIFT)
+                    bentuk = self.cari_bentuk_di(x, y)
+                    if bentuk is None:
+                        self.kotak_seret = (x, y, x, y)
+                        self.tambah_seleksi = tambah
+                    elif tambah:
+                        self.ids_terpilih = np.setxor1d(self.ids_terpilih, [bentuk.id])
+                    else:
+                        self.ids_terpilih = np.array([bentuk.id], dtype=np.int64)
 
                 elif self.mode_sekarang == 'GAMBAR_TITIK':
-                    self.daftar_bentuk.append(Titik((x, y), self.warna_sekarang, self.ketebalan_sekarang))
+                    self.tambah_bentuk(Titik((x, y), self.warna_sekarang, self.ketebalan_sekarang, self.penyimpanan))
 
                 elif 'GAMBAR' in self.mode_sekarang:
                     self.titik_sementara.append((x, y))
@@ -454,15 +977,15 @@ class Main:
                         p1, p2 = self.titik_sementara[0], self.titik_sementara[1]
 
                         if self.mode_sekarang == 'GAMBAR_GARIS':
-                            self.daftar_bentuk.append(Garis(p1, p2, self.warna_sekarang, self.ketebalan_sekarang))
+                            self.tambah_bentuk(Garis(p1, p2, self.warna_sekarang, self.ketebalan_sekarang, self.penyimpanan))
 
                         elif self.mode_sekarang == 'GAMBAR_PERSEGI':
-                            self.daftar_bentuk.append(Persegi(p1, p2, self.warna_sekarang, self.ketebalan_sekarang))
+                            self.tambah_bentuk(Persegi(p1, p2, self.warna_sekarang, self.ketebalan_sekarang, self.penyimpanan))
 
                         elif self.mode_sekarang == 'GAMBAR_ELIPS':
                             rx = abs(p2[0] - p1[0]);
                             ry = abs(p2[1] - p1[1])
-                            self.daftar_bentuk.append(Elips(p1, rx, ry, self.warna_sekarang, self.ketebalan_sekarang))
+                            self.tambah_bentuk(Elips(p1, rx, ry, self.warna_sekarang, self.ketebalan_sekarang, self.penyimpanan))
                         self.titik_sementara = []
 
                 elif self.mode_sekarang == 'TENTUKAN_JENDELA_AWAL':
@@ -478,49 +1001,223 @@ class Main:
 
             elif status == GLUT_UP:
                 if self.drag_window: self.drag_window = False; self.posisi_awal_geser = None
+                if self.kotak_seret: self.pilih_dalam_kotak(self.kotak_seret, self.tambah_seleksi); self.kotak_seret = None
+
+        self.masukan.catat_event()
+
+    def kosongkan_scene(self):
+        self.daftar_bentuk.clear();
+        self.penyimpanan.kosongkan();
+        self.indeks_spasial.kosongkan();
+        self.indeks_spasial_kotor.clear();
+        self.cache_pemotongan.kosongkan();
+        if self.penggambar_vbo: self.penggambar_vbo.kosongkan();
+        self.ids_terpilih = self.ids_terpilih[:0];
+        self.window_clipping = None
 
-        glutPostRedisplay()
+    def simpan_scene(self, path):
+        """Simpan scene sebagai JSON jika `path` berakhiran .json, selain itu dalam format biner."""
+        if path.lower().endswith('.json'):
+            self.simpan_scene_json(path)
+        else:
+            self.simpan_scene_biner(path)
+
+    def muat_scene(self, path):
+        """Ganti scene (dan ukuran kanvas) dengan isi file dari `simpan_scene`."""
+        if path.lower().endswith('.json'):
+            self.muat_scene_json(path)
+        else:
+            self.muat_scene_biner(path)
+
+    def simpan_scene_biner(self, path):
+        """Format kolom biner (lihat `PenyimpananBentuk.simpan_biner`), jauh lebih ringkas dan cepat dari JSON."""
+        meta = {'ukuran': [self.lebar, self.tinggi], 'jendela': self.window_clipping}
+        self.penyimpanan.simpan_biner(path, self.ids_bentuk(), meta)
+
+    def muat_scene_biner(self, path):
+        """
+        Kolom-kolom penyimpanan dipetakan langsung dari file (memory map) dan objek bentuk baru
+        dibuat saat diakses, jadi membuka scene besar hampir tidak bergantung pada ukurannya.
+        Indeks spasial dibangun saat pertama kali dibutuhkan.
+        """
+        self.kosongkan_scene()
+        meta = self.penyimpanan.muat_biner(path)
+        self.daftar_bentuk.atur_ids(np.arange(self.penyimpanan.jumlah_bentuk))
+        self.lebar, self.tinggi = meta.get('ukuran', (self.lebar, self.tinggi))
+        jendela = meta.get('jendela')
+        self.window_clipping = tuple(jendela) if jendela else None
+
+    def simpan_scene_json(self, path):
+        """
+        Simpan semua bentuk dan jendela pemotongan ke file JSON. Bentuk selain elips disimpan
+        sebagai simpul asli + matriks transformasinya, elips sebagai pusat, radius dan sudut.
+        """
+        daftar = []
+        for bentuk in self.daftar_bentuk:
+            data = {'tipe': bentuk.tipe_bentuk, 'warna': list(bentuk.warna), 'ketebalan': bentuk.ketebalan}
+            if bentuk.tipe_bentuk == 'elips':
+                data.update(pusat=list(bentuk.pusat), radius=[float(bentuk.radius_x), float(bentuk.radius_y)],
+                            sudut=float(bentuk.sudut))
+            else:
+                data.update(simpul=bentuk.simpul.tolist(), matriks=self.penyimpanan.matriks[bentuk.id].tolist())
+            daftar.append(data)
+        with open(path, 'w') as berkas:
+            json.dump({'versi': 1, 'ukuran': [self.lebar, self.tinggi], 'jendela': self.window_clipping,
+                       'bentuk': daftar}, berkas)
+
+    def muat_scene_json(self, path):
+        with open(path) as berkas:
+            data = json.load(berkas)
+        self.kosongkan_scene()
+        self.lebar, self.tinggi = data.get('ukuran', (self.lebar, self.tinggi))
+        for data_bentuk in data['bentuk']:
+            tipe, warna, ketebalan = data_bentuk['tipe'], tuple(data_bentuk['warna']), data_bentuk['ketebalan']
+            if tipe == 'elips':
+                bentuk = Elips(tuple(data_bentuk['pusat']), *data_bentuk['radius'], warna, ketebalan, self.penyimpanan)
+                bentuk.sudut = data_bentuk['sudut']
+            else:
+                simpul = data_bentuk['simpul']
+                if tipe == 'titik':
+                    bentuk = Titik(simpul[0], warna, ketebalan, self.penyimpanan)
+                elif tipe == 'garis':
+                    bentuk = Garis(simpul[0], simpul[1], warna, ketebalan, self.penyimpanan)
+                elif tipe == 'persegi':
+                    bentuk = Persegi(simpul[0], simpul[2], warna, ketebalan, self.penyimpanan)
+                else:
+                    raise ValueError(f"Tipe bentuk tidak dikenal: {tipe}")
+                # Simpul asli dipulihkan apa adanya, lalu matriksnya (simpul baru berawal dari identitas).
+                bentuk.simpul = simpul
+                self.penyimpanan.gabung_matriks(bentuk.id, np.vstack((data_bentuk['matriks'], (0, 0, 1))))
+            self.tambah_bentuk(bentuk)
+        jendela = data.get('jendela')
+        self.window_clipping = tuple(jendela) if jendela else None
+
+    def tambah_bentuk(self, bentuk):
+        self.daftar_bentuk.append(bentuk)
+        self.indeks_spasial.sisipkan(bentuk.id, bentuk.get_batas())
+
+    def ids_bentuk(self):
+        """Array id `daftar_bentuk` sesuai urutan gambar."""
+        return self.daftar_bentuk.ids()
+
+    def perbarui_indeks_spasial(self):
+        """
+        Perbarui kotak bentuk yang ditransformasi sejak pencarian terakhir, dan bangun ulang
+        indeks jika `daftar_bentuk` diubah tanpa lewat `tambah_bentuk` (mis. setelah scene dimuat).
+        """
+        if self.indeks_spasial_kotor:
+            kotor = np.fromiter(self.indeks_spasial_kotor, dtype=np.int64, count=len(self.indeks_spasial_kotor))
+            kotor = kotor[kotor < self.penyimpanan.jumlah_bentuk]
+            self.indeks_spasial.perbarui_banyak(kotor, self.penyimpanan.batas(kotor))
+            self.indeks_spasial_kotor.clear()
+        if len(self.indeks_spasial) == len(self.daftar_bentuk):
+            return
+        ids = self.ids_bentuk()
+        self.indeks_spasial.bangun(ids, self.penyimpanan.batas(ids))
+
+    def cari_bentuk_di(self, x, y):
+        """
+        Bentuk paling atas yang dikenai (x, y), atau None. Kandidat diambil dari kotak pembatas
+        (diperbesar ketebalan terbesar + toleransi), lalu diuji tepat sekaligus (pemilihan.py).
+        """
+        self.perbarui_indeks_spasial()
+        jarak = float(self.penyimpanan.ketebalan[:self.penyimpanan.jumlah_bentuk].max(initial=0)) + TOLERANSI_KENA
+        kandidat = self.indeks_spasial.cari_titik(x, y, jarak)
+        kena = kandidat[uji_kena(self.penyimpanan, kandidat, x, y)]
+        return self.daftar_bentuk.bentuk(int(kena[0])) if len(kena) else None
 
     def geser_mouse(self, x, y):
 
         if self.drag_window and self.window_clipping:
-            dx, dy = x - self.posisi_awal_geser[0], y - self.posisi_awal_geser[1]
-            x_min, y_min, x_max, y_max = self.window_clipping
-            self.window_clipping = (x_min + dx, y_min + dy, x_max + dx, y_max + dy)
+            # Hanya dijumlahkan; jendela digeser sekali di awal frame berikutnya (terapkan_masukan).
+            self.masukan.geser(x - self.posisi_awal_geser[0], y - self.posisi_awal_geser[1])
             self.posisi_awal_geser = (x, y)
+        elif self.kotak_seret:
+            self.kotak_seret = self.kotak_seret[:2] + (x, y)
+            self.masukan.catat_event()
+
+    def terapkan_masukan(self):
+        """Terapkan perubahan gabungan dari `masukan`: satu geseran jendela dan satu transformasi per jenis."""
+        (geser_x, geser_y), translasi, rotasi, skala = self.masukan.ambil()
+        if (geser_x or geser_y) and self.window_clipping:
+            x_min, y_min, x_max, y_max = self.window_clipping
+            self.window_clipping = (x_min + geser_x, y_min + geser_y, x_max + geser_x, y_max + geser_y)
+        if len(self.ids_terpilih):
+            if skala != 1.0:
+                self.terapkan_transformasi_terpilih('skala', skala)
+            if rotasi:
+                self.terapkan_transformasi_terpilih('rotasi', rotasi)
+            if translasi != (0.0, 0.0):
+                self.terapkan_transformasi_terpilih('translasi', translasi)
+
+    def pilih_dalam_kotak(self, kotak, tambah=False):
+        """Pilih bentuk yang kotak pembatasnya berada utuh di dalam `kotak`; dengan `tambah` digabung ke seleksi."""
+        x0, y0, x1, y1 = kotak
+        x_min, y_min, x_max, y_max = min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+        self.perbarui_indeks_spasial()
+        kandidat = self.indeks_spasial.cari_persegi(x_min, y_min, x_max, y_max)
+        batas = self.penyimpanan.batas(kandidat)
+        di_dalam = kandidat[(batas[:, 0] >= x_min) & (batas[:, 1] >= y_min) & (batas[:, 2] <= x_max) & (batas[:, 3] <= y_max)]
+        self.ids_terpilih = np.union1d(self.ids_terpilih, di_dalam) if tambah else di_dalam
+
+    def terapkan_transformasi_terpilih(self, tipe_transformasi, nilai):
+        """
+        Transformasi semua bentuk terpilih terhadap pusat bersamanya (rata-rata titik pusat bentuk)
+        dengan satu perkalian matriks di `penyimpanan`, bukan loop per bentuk.
+        """
+        ids = self.ids_terpilih
+        if len(ids) == 1:
+            self.terapkan_transformasi(self.daftar_bentuk.bentuk(int(ids[0])), tipe_transformasi, nilai)
+            return
+        pusat = tuple(self.penyimpanan.titik_pusat(ids).mean(axis=0))
 
-            glutPostRedisplay()
+        if tipe_transformasi == 'translasi':
+            matriks_total = translasi_2d(*nilai)
+        elif tipe_transformasi == 'rotasi':
+            matriks_total = rotasi_2d(nilai, pusat)
+        elif tipe_transformasi == 'skala':
+            matriks_total = skala_2d(nilai, nilai, pusat)
+        else:
+            matriks_total = np.identity(3)
+        self.penyimpanan.transformasi(ids, matriks_total)
+
+        if tipe_transformasi == 'skala':
+            elips = ids[self.penyimpanan.tipe[ids] == PenyimpananBentuk.ELIPS]
+            self.penyimpanan.radius[elips] *= nilai
+            # Simpul elips dibuat ulang hanya jika jumlah segmennya berubah (seperti `Elips._sesuaikan_segmen`).
+            panjang = self.penyimpanan.panjang[elips]
+            jumlah_segmen = jumlah_segmen_elips_batch(self.penyimpanan.radius[elips])
+            berubah = (panjang > 0) & (panjang != jumlah_segmen)
+            self.penyimpanan.atur_simpul_banyak(elips[berubah], lingkaran_satuan_banyak(jumlah_segmen[berubah]),
+                                                jumlah_segmen[berubah])
+        self.indeks_spasial_kotor.update(ids.tolist())
 
     def terapkan_transformasi(self, bentuk, tipe_transformasi, nilai):
-        pusat_x, pusat_y = bentuk.get_titikPusat()
-
-        ke_asal = np.array([[1, 0, -pusat_x], [0, 1, -pusat_y], [0, 0, 1]])
-        dari_asal = np.array([[1, 0, pusat_x], [0, 1, pusat_y], [0, 0, 1]])
-
-        matriks_total = np.identity(3)
+        # Matriks gabungan (ke asal -> transformasi -> kembali) dari modul transformasi, lalu hanya
+        # dikalikan ke matriks bentuk; simpul dan indeks spasial diperbarui saat dibutuhkan.
+        pusat = bentuk.get_titikPusat()
 
         if tipe_transformasi == 'translasi':
             dx, dy = nilai
-            matriks_total = np.array([[1, 0, dx], [0, 1, dy], [0, 0, 1]])
+            matriks_total = translasi_2d(dx, dy)
 
         elif tipe_transformasi == 'rotasi':
-            sudut = np.deg2rad(nilai)
-            cos_s, sin_s = np.cos(sudut), np.sin(sudut)
-            rotasi = np.array([[cos_s, -sin_s, 0], [sin_s, cos_s, 0], [0, 0, 1]])
-
-            matriks_total = dari_asal @ rotasi @ ke_asal
+            matriks_total = rotasi_2d(nilai, pusat)
 
         elif tipe_transformasi == 'skala':
             skala_x = skala_y = nilai
-
-            penskalaan = np.array([[skala_x, 0, 0], [0, skala_y, 0], [0, 0, 1]])
-            matriks_total = dari_asal @ penskalaan @ ke_asal
+            matriks_total = skala_2d(skala_x, skala_y, pusat)
 
             if bentuk.tipe_bentuk == 'elips':
                 bentuk.radius_x *= skala_x;
                 bentuk.radius_y *= skala_y
 
+        else:
+            matriks_total = np.identity(3)
+
         bentuk.transformasi(matriks_total)
+        if bentuk.id in self.indeks_spasial:
+            self.indeks_spasial_kotor.add(bentuk.id)
 
     def hitung_outCode(self, p):
         x, y = p
@@ -592,6 +1289,12 @@ class Main:
                 x2, y2 = x, y;
                 outCode2 = self.hitung_outCode((x2, y2))
 
+    def algoritma_garis_batch(self, segmen):
+        """Potong banyak garis (N, 2, 2) sekaligus dengan metode `self.metode_potong_garis`."""
+        if self.pemotong_paralel:
+            return self.pemotong_paralel.potong_garis(segmen, self.window_clipping, self.metode_potong_garis)
+        return potong_garis_batch(segmen, self.window_clipping, self.metode_potong_garis)
+
     def algoritma_sutherland_hodgman(self, poligon_subjek):
         list_titikHasil = poligon_subjek
 
@@ -599,7 +1302,7 @@ class Main:
             list_titikInput = list_titikHasil
             list_titikHasil = []
 
-            if not list_titikInput: return []
+            if not len(list_titikInput): return []
 
             titik_awal = list_titikInput[-1]
 
@@ -617,6 +1320,12 @@ class Main:
 
         return list_titikHasil
 
+    def algoritma_sutherland_hodgman_batch(self, simpul, offset):
+        """Sutherland-Hodgman untuk banyak poligon terkemas (lihat `pemotongan.py`)."""
+        if self.pemotong_paralel:
+            return self.pemotong_paralel.potong_poligon(simpul, offset, self.window_clipping)
+        return sutherland_hodgman_batch(simpul, offset, self.window_clipping)
+
     def _apakah_diDalam_batas(self, p, sisi):
         """Helper untuk Sutherland-Hodgman: ."""
         x_min, y_min, x_max, y_max = self.window_clipping
@@ -656,7 +1365,14 @@ class Main:
     def run(self):
 
         glutInit(sys.argv)
-        glutInitDisplayMode(GLUT_RGBA | GLUT_DOUBLE)
+        # Depth hanya dibutuhkan DaftarGambar (urutan gambar lewat depth buffer); stencil hanya untuk
+        # backend pemotongan 'gpu' (sisi jendela di dalam poligon).
+        mode_tampilan = GLUT_RGBA | GLUT_DOUBLE
+        if self.renderer != 'langsung' or self.backend_potong == 'gpu':
+            mode_tampilan |= GLUT_DEPTH
+        if self.backend_potong == 'gpu':
+            mode_tampilan |= GLUT_STENCIL
+        glutInitDisplayMode(mode_tampilan)
         glutInitWindowSize(self.lebar, self.tinggi)
         glutInitWindowPosition(100, 100)
         glutCreateWindow(self.header_primaryWindow)
@@ -673,5 +1389,25 @@ class Main:
 
 
 if __name__ == "__main__":
-    app = Main()
+    parser = argparse.ArgumentParser(description="Modul A: objek 2D, transformasi dan clipping")
+    parser.add_argument('--renderer', choices=Main.RENDERER, default='langsung',
+                        help="daftar = draw list per kelompok keadaan, langsung = immediate mode per bentuk,"
+                             " vbo = vertex buffer (retained mode)")
+    parser.add_argument('--profil', action='store_true', help="aktifkan profiler frame sejak awal")
+    parser.add_argument('--profil-keluaran', help="tulis waktu fase per frame ke file .csv atau .jsonl")
+    parser.add_argument('--scene', help="muat scene (.json atau biner) saat mulai; tombol k menyimpan ke file yang sama")
+    parser.add_argument('--pekerja-potong', type=int, default=1,
+                        help="jumlah proses untuk memotong scene yang sangat besar (1 = tanpa proses tambahan)")
+    parser.add_argument('--potong', choices=Main.BACKEND_POTONG, default='cpu',
+                        help="cpu = tampilkan hasil pemotongan CPU, gpu = bidang potong OpenGL + stencil")
+    args = parser.parse_args()
+
+    sink = buat_sink(args.profil_keluaran) if args.profil_keluaran else None
+    app = Main(renderer=args.renderer, profiler=Profiler(aktif=args.profil or sink is not None, sink=sink),
+               pekerja_potong=args.pekerja_potong, backend_potong=args.potong)
+    atexit.register(app.cetak_latensi)
+    if args.scene:
+        app.path_scene = args.scene
+        if os.path.exists(args.scene):
+            app.muat_scene(args.scene)
     app.run()
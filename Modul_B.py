@@ -1,8 +1,28 @@
+import argparse
+
+import numpy as np
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+from mesh import Mesh, baca_mesh
+from pengatur_frame import PengaturFrame
+from profiler import Profiler, buat_sink
+from renderer_mesh import PenggambarInstans, PenggambarMesh
+from scene_instans import SceneInstans
+from transformasi import (QUATERNION_IDENTITAS, kali_quaternion, matriks_model, matriks_perspektif,
+                          normalkan_quaternion, quaternion_seret, quaternion_sumbu_sudut, untuk_gl)
+
+JUDUL = "Modul B: Objek 3D Kubus dengan Penskalaan"
+MODE_LOOP = ('event', 'kontinu')
+KECEPATAN_PUTAR = 45.0  # derajat per detik saat putar otomatis
+WARNA_KUBUS = (0.8, 0.4, 0.2)
+
+# Event yang mengharuskan frame digambar ulang meskipun tidak ada transformasi yang berubah.
+EVENT_GAMBAR_ULANG = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED,
+                      pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
 titik_sudut=(
     (1, -1, -1),
     (1, 1, -1),
@@ -33,14 +53,25 @@ normals=(
 )
 
 
-def draw_cube():
-    """Menggambar kubus berdasarkan vertices, surfaces, dan normals."""
-    glBegin(GL_QUADS)
-    for i, surface in enumerate(sisi):
-        glNormal3fv(normals[i])  # Terapkan normal untuk sisi saat ini
-        for vertex_index in surface:
-            glVertex3fv(titik_sudut[vertex_index])
-    glEnd()
+def mesh_kubus():
+    """Kubus dari vertices, surfaces, dan normals sebagai mesh flat-shaded (normal per sisi)."""
+    return Mesh.dari_sisi(titik_sudut, sisi, normals)
+
+
+MESH_BAWAAN = {'kubus': mesh_kubus}
+
+
+def muat_mesh(nama):
+    """Mesh bawaan menurut nama, atau dari file .obj/.ply."""
+    if nama in MESH_BAWAAN:
+        return MESH_BAWAAN[nama]()
+    # Mesh dari file dipusatkan dan diskalakan seukuran kubus agar pas dengan kamera.
+    return baca_mesh(nama).dinormalkan()
+
+
+def scene_acak(mesh, jumlah, seed=0):
+    # Kepadatan kira-kira satu instans per satuan volume.
+    return SceneInstans.acak(mesh, jumlah, luas=max(5.0, 0.5 * jumlah ** (1 / 3)), seed=seed)
 
 
 def setup_lighting():
@@ -71,37 +102,97 @@ def setup_lighting():
     glShadeModel(GL_SMOOTH)
 
 
-def main():
-    pygame.init()
-    display=(1024, 768)
-    pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
-    pygame.display.set_caption("Modul B: Objek 3D Kubus dengan Penskalaan")
+def bidang_jauh(scene=None):
+    # Bidang jauh diperbesar agar scene instans yang luas tetap terlihat.
+    return 50.0 if scene is None else max(50.0, 4 * float(np.abs(scene.posisi).max(initial=0)))
 
+
+def siapkan_gl(aspek, jauh=50.0):
+    """Depth test, pencahayaan dan proyeksi perspektif; mengembalikan matriks proyeksinya (untuk culling)."""
     glEnable(GL_DEPTH_TEST)
     setup_lighting()
-
     glMatrixMode(GL_PROJECTION)
-    gluPerspective(45, (display[0] / display[1]), 0.1, 50.0)
+    glLoadIdentity()
+    gluPerspective(45, aspek, 0.1, jauh)
     glMatrixMode(GL_MODELVIEW)
+    return matriks_perspektif(45, aspek, 0.1, jauh)
+
+
+def judul_profiler(profiler):
+    """Ringkasan p50/p95 per fase untuk judul jendela (pygame tidak punya overlay teks di konteks OpenGL)."""
+    bagian = []
+    for nama in ('total', 'event', 'transformasi', 'gambar', 'flip'):
+        p50, p95, _ = profiler.persentil(nama)
+        bagian.append(f"{nama} {p50:.2f}/{p95:.2f}")
+    return f"{JUDUL} | ms p50/p95: " + ", ".join(bagian)
+
+
+def tampilkan_statistik(pengatur):
+    statistik=pengatur.statistik()
+    print(f"Frame: {statistik['frame']}, terlewat: {statistik['frame_terlewat']}, "
+          f"idle: {statistik['waktu_idle']:.1f} s ({statistik['rasio_idle']:.0%})")
+
+
+def main(profiler=None, mode_loop='event', fps=60, mesh=None, scene=None):
+    """
+    mode_loop 'kontinu' menggambar terus-menerus seperti semula. Mode 'event' hanya
+    menggambar ulang saat input atau animasi mengubah keadaan, menunggu event
+    tanpa memakai CPU saat diam, dan memutar kubus otomatis (tombol R) dengan
+    langkah waktu tetap dan target `fps`. `mesh` (default: kubus) digambar dari VBO/IBO.
+    Jika `scene` (SceneInstans) diberikan, semua instansnya digambar dengan instancing
+    setelah instans di luar frustum kamera dibuang.
+    """
+    profiler=Profiler() if profiler is None else profiler
+    pengatur=PengaturFrame(fps)
+    profiler.daftarkan_penghitung('frame_terlewat', lambda: pengatur.frame_terlewat)
+
+    pygame.init()
+    display=(1024, 768)
+    pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
+    pygame.display.set_caption(JUDUL)
+
+    proyeksi=siapkan_gl(display[0] / display[1], bidang_jauh(scene))
+    if scene is None:
+        penggambar=PenggambarMesh(mesh_kubus() if mesh is None else mesh)
+    else:
+        penggambar=PenggambarInstans(scene)
+        profiler.daftarkan_penghitung('instans_digambar', lambda: penggambar.jumlah_digambar)
+        profiler.daftarkan_penghitung('instans_dibuang', lambda: penggambar.jumlah_dibuang)
 
     # Variabel untuk transformasi
     translate_x, translate_y, translate_z=0.0, 0.0, -10.0
-    rotate_x, rotate_y=0, 0
+    orientasi=QUATERNION_IDENTITAS  # rotasi kubus sebagai quaternion (w, x, y, z)
     scale_factor=1.0  # Variabel untuk skala
 
     # Variabel untuk rotasi dengan mouse drag
     mouse_down=False
     last_mouse_pos=(0, 0)
 
+    putar_otomatis=False
+    kotor=True  # True jika keadaan berubah sejak frame terakhir digambar
+
     # Game loop
     while True:
-        for event in pygame.event.get():
+        if mode_loop == 'event' and not kotor and not putar_otomatis:
+            # Tidak ada yang perlu digambar: blokir sampai event berikutnya (CPU idle).
+            daftar_event=[pengatur.tunggu_event(pygame.event.wait)]
+        else:
+            daftar_event=[]
+        with profiler.fase('event'):
+            daftar_event+=pygame.event.get()
+        profiler.tambah('event', len(daftar_event))
+        for event in daftar_event:
             if event.type == pygame.QUIT:
+                tampilkan_statistik(pengatur)
                 pygame.quit()
                 return
 
+            if event.type in EVENT_GAMBAR_ULANG:
+                kotor=True
+
             # --- 2. Transformasi Objek 3D ---
             if event.type == pygame.KEYDOWN:
+                kotor=True
                 # Translasi dengan Keyboard
                 if event.key == pygame.K_LEFT:
                     translate_x-=0.5
@@ -124,6 +215,21 @@ def main():
                     if scale_factor < 0.1:  # Mencegah skala menjadi nol atau negatif
                         scale_factor=0.1
 
+                # Profiler: ringkasan waktu fase di judul jendela
+                if event.key == pygame.K_p:
+                    profiler.aktif=True
+                    profiler.overlay=not profiler.overlay
+                    if not profiler.overlay:
+                        pygame.display.set_caption(JUDUL)
+
+                # Putar otomatis: animasi dengan langkah waktu tetap
+                if event.key == pygame.K_r:
+                    putar_otomatis=not putar_otomatis
+                    if putar_otomatis:
+                        pengatur.mulai_ulang()
+                    else:
+                        pengatur.berhenti()
+
             # Rotasi Mouse
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Tombol kiri mouse ditekan
@@ -136,28 +242,69 @@ def main():
             if event.type == pygame.MOUSEMOTION:
                 if mouse_down:
                     dx, dy=event.pos[0] - last_mouse_pos[0], event.pos[1] - last_mouse_pos[1]
-                    rotate_y+=dx * 0.4
-                    rotate_x+=dy * 0.4
+                    # Putar terhadap sumbu layar yang tegak lurus arah seretan (tanpa gimbal lock).
+                    orientasi=normalkan_quaternion(kali_quaternion(quaternion_seret(dx, dy, 0.4), orientasi))
                     last_mouse_pos=event.pos
+                    kotor=True
+
+        if putar_otomatis:
+            # Berputar terhadap sumbu y milik kubus sendiri.
+            sudut=pengatur.langkah_simulasi() * pengatur.langkah_tetap * KECEPATAN_PUTAR
+            orientasi=normalkan_quaternion(kali_quaternion(orientasi, quaternion_sumbu_sudut((0, 1, 0), sudut)))
+            kotor=True
 
-        # Membersihkan buffer
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()  # Mereset matriks transformasi ke posisi awal setiap frame
+        if mode_loop == 'event' and not kotor:
+            continue
 
-        # --- 4. Kamera dan Perspektif ---
-        # Terapkan transformasi dalam urutan: Translasi -> Rotasi -> Skala
-        glTranslatef(translate_x, translate_y, translate_z)
-        glRotatef(rotate_x, 1, 0, 0)
-        glRotatef(rotate_y, 0, 1, 0)
-        glScalef(scale_factor, scale_factor, scale_factor)  # Terapkan penskalaan
+        with profiler.fase('transformasi'):
+            # Membersihkan buffer
+            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-        glColor3f(0.8, 0.4, 0.2)  # warna kubus
-        draw_cube()
+            # --- 4. Kamera dan Perspektif ---
+            # Matriks modelview disusun di NumPy dalam urutan: Translasi -> Rotasi -> Skala,
+            # lalu dimuat sekaligus menggantikan glLoadIdentity/glTranslatef/glRotatef/glScalef.
+            modelview=matriks_model((translate_x, translate_y, translate_z), orientasi, scale_factor)
+            glLoadMatrixf(untuk_gl(modelview))
+
+        with profiler.fase('gambar'):
+            if scene is not None:
+                # Mode scene: matriks yang sama dipakai sebagai kamera dan untuk culling.
+                penggambar.gambar(proyeksi @ modelview)
+            else:
+                glColor3f(*WARNA_KUBUS)
+                penggambar.gambar()
 
         # Update display
-        pygame.display.flip()
-        pygame.time.wait(10)
+        with profiler.fase('flip'):
+            pygame.display.flip()
+        pengatur.frame_selesai()
+        profiler.akhir_frame()
+        if profiler.overlay and profiler.nomor_frame % 30 == 0:
+            pygame.display.set_caption(judul_profiler(profiler))
+        kotor=False
+
+        if mode_loop == 'kontinu':
+            pygame.time.wait(10)
+        elif putar_otomatis:
+            pengatur.tunggu_frame()
 
 
 if __name__ == "__main__":
-    main()
+    parser=argparse.ArgumentParser(description="Modul B: objek 3D kubus")
+    parser.add_argument('--loop', choices=MODE_LOOP, default='event',
+                        help="event = gambar ulang hanya saat ada perubahan, kontinu = gambar terus-menerus")
+    parser.add_argument('--fps', type=float, default=60, help="target FPS saat animasi berjalan")
+    parser.add_argument('--mesh', default='kubus',
+                        help="mesh bawaan (" + ", ".join(MESH_BAWAAN) + ") atau path file .obj/.ply")
+    parser.add_argument('--instans', type=int, default=0,
+                        help="mode scene: gambar sejumlah instans mesh acak dengan instancing dan frustum culling")
+    parser.add_argument('--profil', action='store_true', help="aktifkan profiler frame sejak awal")
+    parser.add_argument('--profil-keluaran', help="tulis waktu fase per frame ke file .csv atau .jsonl")
+    args=parser.parse_args()
+
+    mesh=muat_mesh(args.mesh)
+    scene=scene_acak(mesh, args.instans) if args.instans else None
+
+    sink=buat_sink(args.profil_keluaran) if args.profil_keluaran else None
+    main(Profiler(aktif=args.profil or sink is not None, sink=sink), mode_loop=args.loop, fps=args.fps,
+         mesh=mesh, scene=scene)
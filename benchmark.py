@@ -0,0 +1,1212 @@
+"""
+Benchmark headless untuk inti Modul_A dan Modul_B (tanpa membuka jendela GLUT/pygame).
+
+Jalankan: python benchmark.py (tambahkan --gl untuk benchmark render lewat konteks EGL/OSMesa)
+
+Suite terukur dengan keluaran JSON dan deteksi regresi:
+    python benchmark.py --suite --ukuran 1000 10000 100000 1000000 --keluaran baseline.json
+    python benchmark.py --suite --baseline baseline.json   # kode keluar 1 jika ada regresi
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from konteks_headless import siapkan_platform
+
+if '--gl' in sys.argv:
+    # Platform PyOpenGL harus dipilih sebelum Modul_A meng-import OpenGL.
+    siapkan_platform()
+
+from Modul_A import (JUMLAH_SEGMEN_MAKS, Main, Shape, Titik, Garis, Persegi, Elips, jumlah_segmen_elips,
+                     lingkaran_satuan)
+from mesh import baca_mesh, normal_halus
+from pemilihan import uji_kena
+from pemotongan import kemas_poligon, pecah_poligon, potong_garis_batch, sutherland_hodgman_batch
+from penyimpanan_bentuk import PenyimpananBentuk
+from transformasi import rotasi_2d, skala_2d, translasi_2d
+
+
+def buat_poligon_acak(jumlah, seed=0, lebar=1280, tinggi=720, penyimpanan=None):
+    """Scene sintetis berisi campuran Persegi dan Elips dengan posisi acak (seeded)."""
+    penyimpanan = PenyimpananBentuk() if penyimpanan is None else penyimpanan
+    rng = np.random.default_rng(seed)
+    daftar_bentuk = []
+    for i in range(jumlah):
+        x, y = rng.uniform(0, lebar), rng.uniform(0, tinggi)
+        if i % 2 == 0:
+            lebar_bentuk, tinggi_bentuk = rng.uniform(5, 200, size=2)
+            daftar_bentuk.append(Persegi((x, y), (x + lebar_bentuk, y + tinggi_bentuk), (0, 0, 1), 2.0, penyimpanan))
+        else:
+            elips = Elips((x, y), rng.uniform(5, 150), rng.uniform(5, 150), (1, 0, 0), 2.0, penyimpanan)
+            elips.sudut = rng.uniform(0, 360)
+            daftar_bentuk.append(elips)
+    return daftar_bentuk
+
+
+def simpul_dunia(bentuk):
+    return bentuk.dapatkan_simpul_hasil_transformasi()
+
+
+def benchmark_sutherland_hodgman(daftar_ukuran=(1000, 10000, 100000), batas_per_bentuk=10000, seed=0):
+    """
+    Bandingkan `algoritma_sutherland_hodgman` (per bentuk) dengan versi batch.
+    Versi per bentuk hanya diukur pada maksimal `batas_per_bentuk` bentuk karena lambat.
+    """
+    app = Main()
+    app.window_clipping = (320, 180, 960, 540)
+
+    for jumlah in daftar_ukuran:
+        daftar_poligon = [simpul_dunia(b) for b in buat_poligon_acak(jumlah, seed)]
+        simpul, offset = kemas_poligon(daftar_poligon)
+
+        # Versi per bentuk diberi list tuple seperti sebelum ada PenyimpananBentuk.
+        sampel = [[tuple(v) for v in p.tolist()] for p in daftar_poligon[:batas_per_bentuk]]
+        mulai = time.perf_counter()
+        hasil_per_bentuk = [app.algoritma_sutherland_hodgman(p) for p in sampel]
+        waktu_per_bentuk = time.perf_counter() - mulai
+
+        mulai = time.perf_counter()
+        simpul_hasil, offset_hasil = app.algoritma_sutherland_hodgman_batch(simpul, offset)
+        waktu_batch = time.perf_counter() - mulai
+
+        # Hasil batch harus sama dengan hasil per bentuk.
+        for hasil_a, hasil_b in zip(hasil_per_bentuk, pecah_poligon(simpul_hasil, offset_hasil)):
+            assert np.array_equal(np.asarray(hasil_a, dtype=np.float64).reshape(-1, 2), hasil_b)
+
+        print(f"sutherland_hodgman n={jumlah:>7}: per-bentuk {len(sampel) / waktu_per_bentuk:>12,.0f} poligon/s"
+              f" | batch {jumlah / waktu_batch:>12,.0f} poligon/s")
+
+
+def buat_segmen_acak(jumlah, seed=0, lebar=1280, tinggi=720):
+    """Array segmen (N, 2, 2) acak (seeded), sebagian keluar dari layar."""
+    rng = np.random.default_rng(seed)
+    return rng.uniform((-200, -200), (lebar + 200, tinggi + 200), size=(jumlah, 2, 2))
+
+
+def benchmark_cohen_sutherland(daftar_ukuran=(1000, 10000, 100000), batas_per_bentuk=10000, seed=0):
+    """
+    Bandingkan `algoritma_cohen_sutherland` (per garis) dengan `potong_garis_batch`
+    (Cohen-Sutherland dan Liang-Barsky). Versi batch Cohen-Sutherland harus identik
+    dengan versi per garis, Liang-Barsky hanya boleh berbeda karena pembulatan.
+    """
+    app = Main()
+    app.window_clipping = (320, 180, 960, 540)
+
+    for jumlah in daftar_ukuran:
+        segmen = buat_segmen_acak(jumlah, seed)
+
+        sampel = [(tuple(s[0]), tuple(s[1])) for s in segmen[:batas_per_bentuk]]
+        mulai = time.perf_counter()
+        hasil_per_garis = [app.algoritma_cohen_sutherland(p1, p2) for p1, p2 in sampel]
+        waktu_per_garis = time.perf_counter() - mulai
+
+        teks = f"garis n={jumlah:>7}: per-garis {len(sampel) / waktu_per_garis:>12,.0f} garis/s"
+        for metode in ('cohen_sutherland', 'liang_barsky'):
+            mulai = time.perf_counter()
+            hasil, diterima = potong_garis_batch(segmen, app.window_clipping, metode)
+            waktu = time.perf_counter() - mulai
+
+            for (terima, p1, p2), seg, terima_batch in zip(hasil_per_garis, hasil, diterima):
+                assert terima == terima_batch
+                if terima and metode == 'cohen_sutherland':
+                    assert np.array_equal((p1, p2), seg)
+                elif terima:
+                    assert np.allclose((p1, p2), seg)
+            teks += f" | {metode} {waktu * 1000:>8.2f} ms"
+        print(teks)
+
+
+class _BentukLama:
+    """Tata letak bentuk sebelum ada PenyimpananBentuk: atribut di __dict__ dan list tuple simpul."""
+
+    def __init__(self, bentuk):
+        self.tipe_bentuk = bentuk.tipe_bentuk
+        self.warna = tuple(bentuk.warna)
+        self.ketebalan = float(bentuk.ketebalan)
+        self.terpilih = False
+        self.simpul = [(float(x), float(y)) for x, y in bentuk.simpul]
+        if bentuk.tipe_bentuk == 'elips':
+            self.pusat = tuple(float(v) for v in bentuk.pusat)
+            self.radius_x, self.radius_y, self.sudut = float(bentuk.radius_x), float(bentuk.radius_y), float(bentuk.sudut)
+
+
+def ukuran_objek(objek, sudah=None):
+    """Ukuran rekursif objek Python dalam byte (objek bersama seperti string tipe dihitung sekali)."""
+    sudah = set() if sudah is None else sudah
+    if id(objek) in sudah:
+        return 0
+    sudah.add(id(objek))
+    ukuran = sys.getsizeof(objek)
+    if isinstance(objek, (list, tuple)):
+        ukuran += sum(ukuran_objek(o, sudah) for o in objek)
+    elif hasattr(objek, '__dict__'):
+        ukuran += ukuran_objek(vars(objek), sudah)
+    elif isinstance(objek, dict):
+        ukuran += sum(ukuran_objek(k, sudah) + ukuran_objek(v, sudah) for k, v in objek.items())
+    return ukuran
+
+
+def benchmark_penyimpanan(jumlah=100000, seed=0):
+    """Memori per bentuk sebelum/sesudah PenyimpananBentuk, serta transformasi/pusat/batas per bentuk vs batch."""
+    penyimpanan = PenyimpananBentuk()
+    rng = np.random.default_rng(seed)
+    daftar_bentuk = buat_poligon_acak(jumlah // 2, seed, penyimpanan=penyimpanan)
+    for x, y, dx, dy in rng.uniform(0, 720, size=(jumlah - len(daftar_bentuk), 4)):
+        if len(daftar_bentuk) % 2:
+            daftar_bentuk.append(Garis((x, y), (x + dx, y + dy), (0, 0, 0), 2.0, penyimpanan))
+        else:
+            daftar_bentuk.append(Titik((x, y), (0, 0, 0), 2.0, penyimpanan))
+
+    sudah, bentuk_lama = set(), [_BentukLama(b) for b in daftar_bentuk]
+    byte_lama = sum(ukuran_objek(b, sudah) for b in bentuk_lama) / jumlah
+    byte_view = sum(ukuran_objek(b) for b in daftar_bentuk[:1000]) / 1000
+    print(f"memori n={jumlah}: list tuple {byte_lama:,.0f} B/bentuk | penyimpanan "
+          f"{penyimpanan.byte_per_bentuk():,.0f} B/bentuk (+ view {byte_view:,.0f} B)")
+
+    ids = np.arange(jumlah)
+    geser = np.array([[1, 0, 5], [0, 1, -5], [0, 0, 1]], dtype=np.float64)
+    for nama, per_bentuk, batch in (
+            ('transformasi', lambda: [b.transformasi(geser) for b in daftar_bentuk if b.tipe_bentuk != 'elips'],
+             lambda: penyimpanan.transformasi(ids[penyimpanan.tipe[:jumlah] != PenyimpananBentuk.ELIPS], geser)),
+            ('titik_pusat', lambda: [b.get_titikPusat() for b in daftar_bentuk], lambda: penyimpanan.titik_pusat(ids)),
+            ('batas', lambda: [b.get_batas() for b in daftar_bentuk], lambda: penyimpanan.batas(ids))):
+        mulai = time.perf_counter()
+        per_bentuk()
+        waktu_per_bentuk = time.perf_counter() - mulai
+        mulai = time.perf_counter()
+        batch()
+        waktu_batch = time.perf_counter() - mulai
+        print(f"{nama:>12} n={jumlah}: per-bentuk {waktu_per_bentuk * 1000:>9.1f} ms | batch {waktu_batch * 1000:>7.1f} ms")
+
+
+def benchmark_picking(jumlah=100000, jumlah_klik=200, seed=0, skala_kanvas=10):
+    """
+    Latensi picking: scan linear semua bentuk (cara lama) vs `IndeksSpasial`.
+    Bentuk disebar di kanvas `skala_kanvas` kali ukuran jendela sehingga sebagian klik
+    mengenai ruang kosong (kasus terburuk scan linear).
+    """
+    app = Main()
+    lebar, tinggi = app.lebar * skala_kanvas, app.tinggi * skala_kanvas
+    for bentuk in buat_poligon_acak(jumlah, seed, lebar, tinggi, penyimpanan=app.penyimpanan):
+        app.daftar_bentuk.append(bentuk)
+
+    mulai = time.perf_counter()
+    app.perbarui_indeks_spasial()
+    waktu_bangun = time.perf_counter() - mulai
+
+    klik = np.random.default_rng(seed + 1).uniform((0, 0), (lebar, tinggi), size=(jumlah_klik, 2))
+    kotak = app.penyimpanan.batas(np.arange(jumlah))
+
+    def scan_linear(x, y):
+        # Sama seperti loop `reversed(self.daftar_bentuk)` sebelumnya, dengan kotak yang sudah dihitung.
+        for i in range(jumlah - 1, -1, -1):
+            min_x, min_y, max_x, max_y = kotak[i]
+            if min_x < x < max_x and min_y < y < max_y:
+                return app.daftar_bentuk[i]
+        return None
+
+    sampel_linear = klik[:20]
+    mulai = time.perf_counter()
+    hasil_linear = [scan_linear(x, y) for x, y in sampel_linear]
+    waktu_linear = (time.perf_counter() - mulai) / len(sampel_linear)
+
+    mulai = time.perf_counter()
+    hasil_indeks = [next(iter(app.indeks_spasial.cari_titik(x, y)), None) for x, y in klik]
+    waktu_indeks = (time.perf_counter() - mulai) / len(klik)
+    assert [bentuk and bentuk.id for bentuk in hasil_linear] == hasil_indeks[:len(sampel_linear)]
+
+    # Uji kena tepat (kandidat dari indeks) harus sama dengan uji tepat semua bentuk.
+    mulai = time.perf_counter()
+    hasil_tepat = [app.cari_bentuk_di(x, y) for x, y in klik]
+    waktu_tepat = (time.perf_counter() - mulai) / len(klik)
+    for (x, y), bentuk in list(zip(klik, hasil_tepat))[:len(sampel_linear)]:
+        kena = np.flatnonzero(uji_kena(app.penyimpanan, np.arange(jumlah), x, y))
+        assert (bentuk and bentuk.id) == (int(kena[-1]) if len(kena) else None)
+
+    bentuk = app.daftar_bentuk[0]
+    mulai = time.perf_counter()
+    for _ in range(100):
+        app.terapkan_transformasi(bentuk, 'translasi', (5, 0))
+    waktu_perbarui = (time.perf_counter() - mulai) / 100
+
+    print(f"picking n={jumlah}: bangun indeks {waktu_bangun * 1000:.0f} ms | linear {waktu_linear * 1000:.3f} ms/klik"
+          f" | indeks {waktu_indeks * 1000:.3f} ms/klik | tepat {waktu_tepat * 1000:.3f} ms/klik"
+          f" | transformasi+perbarui {waktu_perbarui * 1000:.3f} ms")
+
+
+def benchmark_uji_kena(jumlah=100000, jumlah_klik=2000, seed=0, skala_kanvas=10):
+    """
+    Picking tepat (`cari_bentuk_di`) di scene campuran titik/garis/persegi/elips: waktu per klik,
+    dan berapa klik yang dengan picking kotak pembatas lama memilih bentuk yang tidak dikenai.
+    """
+    lebar, tinggi = 1280 * skala_kanvas, 720 * skala_kanvas
+    app = buat_scene_campuran(jumlah, seed, lebar, tinggi)
+    app.perbarui_indeks_spasial()
+    klik = np.random.default_rng(seed + 1).uniform((0, 0), (lebar, tinggi), size=(jumlah_klik, 2))
+
+    mulai = time.perf_counter()
+    hasil = [app.cari_bentuk_di(x, y) for x, y in klik]
+    waktu = (time.perf_counter() - mulai) / len(klik)
+    hasil_kotak = [next(iter(app.indeks_spasial.cari_titik(x, y)), None) for x, y in klik]
+
+    salah_kotak = sum(id_kotak is not None and not uji_kena(app.penyimpanan, [id_kotak], x, y)[0]
+                      for (x, y), id_kotak in zip(klik, hasil_kotak))
+    tipe = [bentuk.tipe_bentuk for bentuk in hasil if bentuk is not None]
+    print(f"uji kena n={jumlah}: {waktu * 1000:.3f} ms/klik | {len(tipe)} klik kena"
+          f" ({', '.join(f'{nama} {tipe.count(nama)}' for nama in ('titik', 'garis', 'persegi', 'elips'))})"
+          f" | kotak pembatas salah pilih {salah_kotak}")
+
+
+def benchmark_seret_jendela(jumlah=50000, jumlah_langkah=40, seed=0, skala_kanvas=4):
+    """
+    Geser jendela pemotongan bolak-balik di atas scene besar: pemotongan ulang semua bentuk
+    yang terlihat setiap langkah (cara lama) vs `CachePemotongan` (hanya bentuk yang memotong
+    sisi jendela yang dipotong, hasil diingat per jendela). Hasil keduanya harus sama.
+    """
+    app = Main()
+    lebar, tinggi = app.lebar * skala_kanvas, app.tinggi * skala_kanvas
+    for bentuk in buat_poligon_acak(jumlah, seed, lebar, tinggi, penyimpanan=app.penyimpanan):
+        app.tambah_bentuk(bentuk)
+    ids = np.array([bentuk.id for bentuk in app.daftar_bentuk])
+
+    def potong_ulang_semua():
+        # Sama seperti `potong_semua_bentuk` sebelum ada cache: semua bentuk terlihat dipotong setiap frame.
+        terlihat = ids[np.isin(ids, app.indeks_spasial.cari_persegi(*app.window_clipping))]
+        return pecah_poligon(*app.algoritma_sutherland_hodgman_batch(*app.penyimpanan.simpul_dunia(terlihat)))
+
+    # Jendela 640x360 digeser 8 piksel per event mouse ke kanan, lalu kembali ke posisi awal.
+    langkah = list(range(jumlah_langkah)) + list(range(jumlah_langkah - 1, -1, -1))
+    daftar_jendela = [(1000.0 + 8 * i, 800.0, 1640.0 + 8 * i, 1160.0) for i in langkah]
+    app.perbarui_indeks_spasial()
+
+    mulai = time.perf_counter()
+    for app.window_clipping in daftar_jendela:
+        hasil_lama = potong_ulang_semua()
+    waktu_lama = (time.perf_counter() - mulai) / len(daftar_jendela)
+
+    mulai = time.perf_counter()
+    for app.window_clipping in daftar_jendela:
+        hasil_baru = app.potong_semua_bentuk()
+    waktu_baru = (time.perf_counter() - mulai) / len(daftar_jendela)
+
+    hasil_lama = [poligon for poligon in hasil_lama if len(poligon)]
+    hasil_baru = [poligon for poligon in hasil_baru if len(poligon)]
+    assert len(hasil_lama) == len(hasil_baru) and all(map(np.array_equal, hasil_lama, hasil_baru))
+
+    statistik = app.cache_pemotongan.statistik()
+    print(f"seret jendela n={jumlah}: potong ulang {waktu_lama * 1000:.1f} ms/event"
+          f" | inkremental {waktu_baru * 1000:.1f} ms/event"
+          f" (dalam {statistik['dalam']}, dipotong {statistik['dipotong']}, memo hit {statistik['memo_hit']})")
+
+
+def benchmark_transformasi_tertunda(jumlah_simpul=100000, jumlah_event=360, seed=0):
+    """
+    Biaya per event tombol (rotasi 1 derajat) pada satu polyline besar: simpul dikalikan
+    setiap event (cara lama) vs hanya matriks gabungan yang dikalikan. Juga galat setelah
+    `jumlah_event` rotasi (total 360 derajat, harus kembali ke posisi awal).
+    """
+    app = Main()
+    sudut = np.random.default_rng(seed).uniform(0, 2 * np.pi, jumlah_simpul)
+    simpul_awal = np.column_stack((640 + 300 * np.cos(sudut), 360 + 200 * np.sin(sudut)))
+    polyline = Shape('poligon', (0, 0, 0), 1.0, app.penyimpanan)
+    polyline.simpul = simpul_awal
+    app.tambah_bentuk(polyline)
+
+    simpul_lama = simpul_awal.copy()
+    mulai = time.perf_counter()
+    for _ in range(jumlah_event):
+        # Cara lama: pusat dari semua simpul, lalu semua simpul dikalikan matriks per event.
+        pusat_x, pusat_y = simpul_lama.mean(axis=0)
+        ke_asal = np.array([[1, 0, -pusat_x], [0, 1, -pusat_y], [0, 0, 1]])
+        dari_asal = np.array([[1, 0, pusat_x], [0, 1, pusat_y], [0, 0, 1]])
+        cos_s, sin_s = np.cos(np.deg2rad(360 / jumlah_event)), np.sin(np.deg2rad(360 / jumlah_event))
+        matriks = dari_asal @ np.array([[cos_s, -sin_s, 0], [sin_s, cos_s, 0], [0, 0, 1]]) @ ke_asal
+        simpul_lama = simpul_lama @ matriks[:2, :2].T + matriks[:2, 2]
+    waktu_lama = (time.perf_counter() - mulai) / jumlah_event
+
+    mulai = time.perf_counter()
+    for _ in range(jumlah_event):
+        app.terapkan_transformasi(polyline, 'rotasi', 360 / jumlah_event)
+    waktu_baru = (time.perf_counter() - mulai) / jumlah_event
+
+    mulai = time.perf_counter()
+    simpul_baru = polyline.dapatkan_simpul_hasil_transformasi()
+    waktu_hitung = time.perf_counter() - mulai
+
+    print(f"transformasi tertunda {jumlah_simpul} simpul: lama {waktu_lama * 1e6:.0f} us/event"
+          f" | baru {waktu_baru * 1e6:.0f} us/event (+ {waktu_hitung * 1000:.1f} ms sekali saat simpul dibutuhkan)"
+          f" | galat {jumlah_event}x{360 / jumlah_event:g} derajat: lama {np.abs(simpul_lama - simpul_awal).max():.2e}"
+          f" baru {np.abs(simpul_baru - simpul_awal).max():.2e}")
+
+
+def benchmark_elips_adaptif(jumlah=20000, jumlah_frame=3, seed=0, gl=False):
+    """
+    Scene berisi banyak elips kecil: jumlah simpul dan waktu per frame dengan 72 segmen
+    tetap (cara lama) vs jumlah segmen adaptif menurut radius di layar.
+    Waktu render immediate mode hanya diukur jika `gl` (konteks headless).
+    """
+    print("segmen elips per radius: " + ", ".join(
+        f"r={radius}: {jumlah_segmen_elips(radius, radius)}" for radius in (3, 10, 30, 100, 300, 1000, 3000)))
+
+    konteks = None
+    if gl:
+        from OpenGL.GL import glFinish
+        from konteks_headless import KonteksHeadless
+        konteks = KonteksHeadless(1280, 720)
+    try:
+        app = Main()
+        if konteks:
+            app.inisialisasi_gl()
+        rng = np.random.default_rng(seed)
+        for x, y, radius_x, radius_y in rng.uniform((0, 0, 2, 2), (1280, 720, 12, 12), size=(jumlah, 4)):
+            app.tambah_bentuk(Elips((x, y), radius_x, radius_y, (0, 0.5, 0), 1.0, app.penyimpanan))
+        ids = app.ids_bentuk()
+        segmen_adaptif = app.penyimpanan.panjang[ids].copy()
+
+        for nama, segmen in (('adaptif', None), ('72 tetap', 72)):
+            if segmen:
+                for id_bentuk in ids.tolist():
+                    app.penyimpanan.atur_simpul(id_bentuk, lingkaran_satuan(segmen))
+
+            mulai = time.perf_counter()
+            for _ in range(jumlah_frame):
+                app.penyimpanan.tandai_berubah(ids)
+                app.penyimpanan.simpul_dunia(ids)
+            waktu_simpul = (time.perf_counter() - mulai) / jumlah_frame
+
+            keterangan = ''
+            if konteks:
+                mulai = time.perf_counter()
+                for _ in range(jumlah_frame):
+                    app.gambar_scene()
+                glFinish()
+                keterangan = f" | render langsung {(time.perf_counter() - mulai) / jumlah_frame * 1000:.0f} ms/frame"
+            print(f"elips kecil n={jumlah} {nama:>8}: {int(app.penyimpanan.panjang[ids].sum()):>9} simpul"
+                  f" | simpul layar {waktu_simpul * 1000:.1f} ms{keterangan}")
+    finally:
+        if konteks:
+            konteks.tutup()
+    print(f"segmen adaptif per elips: min {segmen_adaptif.min()} rata-rata {segmen_adaptif.mean():.1f} maks {segmen_adaptif.max()}")
+
+
+def benchmark_cache(jumlah=10000, seed=0):
+    """
+    Simulasikan beberapa frame scene statis (pemotongan batch + kotak seleksi + picking)
+    dan laporkan hit/miss cache geometri per frame. Frame setelah yang pertama harus 0 miss.
+    """
+    app = Main()
+    app.window_clipping = (320, 180, 960, 540)
+    for bentuk in buat_poligon_acak(jumlah, seed, penyimpanan=app.penyimpanan):
+        app.tambah_bentuk(bentuk)
+    app.ids_terpilih = app.ids_bentuk()[::10]
+
+    def frame():
+        app.potong_semua_bentuk()
+        app.kotak_seleksi()
+        app.cari_bentuk_di(640, 360)
+
+    for nomor in range(3):
+        hit, miss = app.penyimpanan.cache_hit, app.penyimpanan.cache_miss
+        mulai = time.perf_counter()
+        if nomor == 2:
+            # Satu bentuk berubah: hanya bentuk itu yang dihitung ulang.
+            app.terapkan_transformasi(app.daftar_bentuk[1], 'rotasi', 5)
+        frame()
+        waktu = time.perf_counter() - mulai
+        print(f"cache frame {nomor} n={jumlah}: {app.penyimpanan.cache_hit - hit:>7} hit"
+              f" {app.penyimpanan.cache_miss - miss:>7} miss | {waktu * 1000:7.1f} ms")
+
+    elips = app.daftar_bentuk[1]
+    mulai = time.perf_counter()
+    for _ in range(1000):
+        elips.dapatkan_simpul_hasil_transformasi()
+    waktu_hit = (time.perf_counter() - mulai) / 1000
+    mulai = time.perf_counter()
+    for _ in range(1000):
+        app.penyimpanan.tandai_berubah(elips.id)
+        elips.dapatkan_simpul_hasil_transformasi()
+    waktu_miss = (time.perf_counter() - mulai) / 1000
+    print(f"dapatkan_simpul_hasil_transformasi: hit {waktu_hit * 1e6:.1f} us | miss {waktu_miss * 1e6:.1f} us")
+
+
+def benchmark_renderer_vbo(jumlah=10000, jumlah_frame=5, seed=0, lebar=1280, tinggi=720):
+    """
+    Bandingkan renderer immediate mode dengan PenggambarVBO di konteks headless:
+    waktu per frame dan jumlah piksel yang berbeda antara kedua gambar.
+    """
+    from OpenGL.GL import glFinish
+    from konteks_headless import KonteksHeadless
+
+    konteks = KonteksHeadless(lebar, tinggi)
+    gambar = {}
+    try:
+        for renderer in Main.RENDERER:
+            app = Main(renderer=renderer)
+            app.inisialisasi_gl()
+            for bentuk in buat_poligon_acak(jumlah, seed, lebar, tinggi, penyimpanan=app.penyimpanan):
+                app.tambah_bentuk(bentuk)
+
+            app.gambar_scene()
+            glFinish()
+            gambar[renderer] = konteks.baca_piksel()
+
+            mulai = time.perf_counter()
+            for nomor in range(jumlah_frame):
+                # Satu bentuk berubah per frame: renderer VBO hanya mengunggah ulang rentang bentuk itu.
+                app.terapkan_transformasi(app.daftar_bentuk[nomor % len(app.daftar_bentuk)], 'translasi', (1, 0))
+                app.gambar_scene()
+            glFinish()
+            waktu = (time.perf_counter() - mulai) / jumlah_frame
+            keterangan = ''
+            if app.penggambar_vbo:
+                keterangan = (f" | {app.penggambar_vbo.jumlah_draw_call // (jumlah_frame + 1)} draw call/frame,"
+                              f" {app.penggambar_vbo.jumlah_simpul_unggah} simpul diunggah")
+            print(f"render {renderer:>8} n={jumlah:>7}: {waktu * 1000:8.2f} ms/frame{keterangan}")
+    finally:
+        konteks.tutup()
+
+    for renderer in Main.RENDERER:
+        if renderer != 'langsung':
+            selisih = np.abs(gambar['langsung'].astype(np.int16) - gambar[renderer]).max(axis=2)
+            print(f"render {renderer} vs langsung: {np.count_nonzero(selisih)} piksel berbeda"
+                  f" dari {np.count_nonzero((gambar['langsung'][..., :3] != 255).any(axis=2))} piksel bentuk")
+
+
+# ============================================================================ suite
+
+def buat_grid_mesh(sisi_grid, seed=0):
+    """Permukaan grid bergelombang: (sisi_grid + 1)^2 simpul dan 2 * sisi_grid^2 segitiga."""
+    rng = np.random.default_rng(seed)
+    x, y = np.meshgrid(np.linspace(-1, 1, sisi_grid + 1), np.linspace(-1, 1, sisi_grid + 1))
+    z = 0.1 * np.sin(4 * x) * np.cos(4 * y) + rng.normal(0, 1e-3, x.shape)
+    simpul = np.stack((x, y, z), axis=-1).reshape(-1, 3).astype(np.float32)
+
+    baris = np.arange(sisi_grid + 1)
+    kiri_atas = (baris[:-1, None] * (sisi_grid + 1) + baris[None, :-1]).ravel()
+    a, b, c, d = kiri_atas, kiri_atas + 1, kiri_atas + sisi_grid + 2, kiri_atas + sisi_grid + 1
+    indeks = np.concatenate((np.stack((a, b, c), 1), np.stack((a, c, d), 1)))
+    return simpul, indeks
+
+
+def tulis_mesh(path, simpul, indeks, format_berkas):
+    """Tulis mesh ke 'obj', 'ply_ascii' atau 'ply_biner' (untuk benchmark pembaca)."""
+    with open(path, 'wb') as berkas:
+        if format_berkas == 'obj':
+            berkas.write((("v %.6f %.6f %.6f\n" * len(simpul)) % tuple(simpul.ravel().tolist())).encode())
+            berkas.write((("f %d %d %d\n" * len(indeks)) % tuple((indeks + 1).ravel().tolist())).encode())
+            return
+        biner = format_berkas == 'ply_biner'
+        berkas.write((f"ply\nformat {'binary_little_endian' if biner else 'ascii'} 1.0\n"
+                      f"element vertex {len(simpul)}\nproperty float x\nproperty float y\nproperty float z\n"
+                      f"element face {len(indeks)}\nproperty list uchar int vertex_indices\nend_header\n").encode())
+        if biner:
+            berkas.write(simpul.astype('<f4').tobytes())
+            sisi = np.empty(len(indeks), dtype=[('n', 'u1'), ('i', '<i4', (3,))])
+            sisi['n'], sisi['i'] = 3, indeks
+            berkas.write(sisi.tobytes())
+        else:
+            berkas.write((("%.6f %.6f %.6f\n" * len(simpul)) % tuple(simpul.ravel().tolist())).encode())
+            berkas.write((("3 %d %d %d\n" * len(indeks)) % tuple(indeks.ravel().tolist())).encode())
+
+
+def benchmark_mesh(sisi_grid=1000, seed=0):
+    """Throughput pembaca mesh (MB/s, segitiga/s) untuk OBJ, PLY ascii dan PLY biner, serta waktu normal halus."""
+    simpul, indeks = buat_grid_mesh(sisi_grid, seed)
+    with tempfile.TemporaryDirectory() as direktori:
+        for format_berkas in ('obj', 'ply_ascii', 'ply_biner'):
+            path = os.path.join(direktori, 'grid.' + ('obj' if format_berkas == 'obj' else 'ply'))
+            tulis_mesh(path, simpul, indeks, format_berkas)
+            ukuran_mb = os.path.getsize(path) / 2 ** 20
+
+            mulai = time.perf_counter()
+            mesh = baca_mesh(path)
+            waktu = time.perf_counter() - mulai
+            assert mesh.jumlah_segitiga == len(indeks) and np.array_equal(mesh.indeks, indeks)
+            assert np.allclose(mesh.simpul, simpul, atol=1e-5)
+            print(f"mesh {format_berkas:>9}: {len(indeks):>8} segitiga, {ukuran_mb:6.1f} MB"
+                  f" | {waktu:.2f} s | {ukuran_mb / waktu:6.1f} MB/s | {len(indeks) / waktu / 1e6:.2f} juta segitiga/s")
+            os.remove(path)
+
+    mulai = time.perf_counter()
+    normal_halus(simpul, indeks)
+    print(f"normal halus {len(indeks)} segitiga: {(time.perf_counter() - mulai) * 1000:.0f} ms")
+
+
+def benchmark_matriks_batch(jumlah=1000000, jumlah_loop=10000, seed=0):
+    """Matriks model dan normal untuk `jumlah` objek dalam satu panggilan vs loop Python per objek."""
+    from transformasi import matriks_model, matriks_normal, quaternion_acak
+
+    rng = np.random.default_rng(seed)
+    posisi = rng.uniform(-10, 10, size=(jumlah, 3)).astype(np.float32)
+    orientasi = quaternion_acak(jumlah, rng).astype(np.float32)
+    skala = rng.uniform(0.1, 2, size=jumlah).astype(np.float32)
+
+    mulai = time.perf_counter()
+    model = matriks_model(posisi, orientasi, skala)
+    waktu_model = time.perf_counter() - mulai
+    mulai = time.perf_counter()
+    matriks_normal(model)
+    waktu_normal = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    for i in range(jumlah_loop):
+        matriks_model(posisi[i], orientasi[i], skala[i])
+    waktu_loop = (time.perf_counter() - mulai) / jumlah_loop * jumlah
+    print(f"matriks n={jumlah}: model {waktu_model * 1000:.0f} ms, normal {waktu_normal * 1000:.0f} ms"
+          f" | loop per objek (perkiraan) {waktu_loop:.1f} s")
+
+
+def benchmark_instans(daftar_jumlah=(10000, 100000, 1000000), seed=0, lebar=1024, tinggi=768, batas_tanpa_cull=100000):
+    """
+    Scene instans kubus Modul_B (kepadatan ~1 instans per satuan volume, kamera di tengah):
+    jumlah instans yang dibuang/digambar, waktu culling, dan waktu frame dengan instancing
+    di konteks OpenGL headless. Frame tanpa culling hanya diukur hingga `batas_tanpa_cull` instans.
+    """
+    from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, glClear, glEnable, glFinish
+    from konteks_headless import KonteksHeadless
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import Modul_B
+    from renderer_mesh import PenggambarInstans
+    from scene_instans import SceneInstans
+    from transformasi import kali_quaternion, matriks_model, matriks_perspektif, quaternion_sumbu_sudut
+
+    konteks = KonteksHeadless(lebar, tinggi)
+    try:
+        glEnable(GL_DEPTH_TEST)
+        Modul_B.setup_lighting()
+        kubus = Modul_B.mesh_kubus()
+        for jumlah in daftar_jumlah:
+            luas = max(5.0, 0.5 * jumlah ** (1 / 3))
+            scene = SceneInstans.acak(kubus, jumlah, luas, seed)
+            penggambar = PenggambarInstans(scene)
+            orientasi = kali_quaternion(quaternion_sumbu_sudut((1, 0, 0), 15), quaternion_sumbu_sudut((0, 1, 0), 30))
+            proyeksi_view = matriks_perspektif(45, lebar / tinggi, 0.1, 4 * luas) @ matriks_model((0, 0, 0), orientasi)
+
+            waktu_cull = ukur(lambda: scene.cull(proyeksi_view))
+            waktu_matriks = ukur(lambda: (scene.tandai_berubah(), scene.matriks_model()), ulang=1)
+
+            def frame(pv):
+                glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+                penggambar.gambar(pv)
+                glFinish()
+            frame(proyeksi_view)  # Unggahan pertama tidak ikut diukur.
+            waktu_frame = ukur(lambda: frame(proyeksi_view), ulang=2)
+            keterangan = ''
+            if jumlah <= batas_tanpa_cull:
+                # Bidang frustum yang sangat longgar: semua instans lolos culling.
+                semua = np.diag([1e-6, 1e-6, 1e-6, 1.0])
+                frame(semua)
+                keterangan = f" | tanpa culling {ukur(lambda: frame(semua), ulang=1) * 1000:7.1f} ms"
+            frame(proyeksi_view)
+            print(f"instans n={jumlah:>7}: digambar {penggambar.jumlah_digambar:>7}, dibuang {penggambar.jumlah_dibuang:>7}"
+                  f" | cull {waktu_cull * 1000:6.2f} ms | matriks model {waktu_matriks * 1000:6.1f} ms"
+                  f" | frame {waktu_frame * 1000:7.1f} ms{keterangan}")
+            penggambar.hapus()
+    finally:
+        konteks.tutup()
+
+
+def buat_scene_campuran(jumlah, seed=0, lebar=1280, tinggi=720, app=None):
+    """Scene sintetis (seeded) berisi Titik, Garis, Persegi dan Elips bergantian, ditambahkan ke `app`."""
+    app = Main() if app is None else app
+    rng = np.random.default_rng(seed)
+    posisi = rng.uniform((0, 0), (lebar, tinggi), size=(jumlah, 2)).tolist()
+    ukuran = rng.uniform((-150, -150), (150, 150), size=(jumlah, 2)).tolist()
+    for i, ((x, y), (dx, dy)) in enumerate(zip(posisi, ukuran)):
+        jenis = i % 4
+        if jenis == 0:
+            bentuk = Titik((x, y), (0, 0, 0), 2.0, app.penyimpanan)
+        elif jenis == 1:
+            bentuk = Garis((x, y), (x + 2 * dx, y + 2 * dy), (1, 0, 0), 2.0, app.penyimpanan)
+        elif jenis == 2:
+            bentuk = Persegi((x, y), (x + dx, y + dy), (0, 0, 1), 2.0, app.penyimpanan)
+        else:
+            bentuk = Elips((x, y), abs(dx) / 2 + 1, abs(dy) / 2 + 1, (0, 1, 0), 2.0, app.penyimpanan)
+        app.tambah_bentuk(bentuk)
+    return app
+
+
+def periksa_scene_sama(app, app_muat):
+    """Pastikan dua scene Modul_A identik: urutan, tipe, warna, ketebalan, simpul layar, parameter elips, jendela."""
+    assert len(app.daftar_bentuk) == len(app_muat.daftar_bentuk)
+    assert app.window_clipping == app_muat.window_clipping and (app.lebar, app.tinggi) == (app_muat.lebar, app_muat.tinggi)
+    ids, ids_muat = app.ids_bentuk(), app_muat.ids_bentuk()
+    penyimpanan, penyimpanan_muat = app.penyimpanan, app_muat.penyimpanan
+    assert np.array_equal(penyimpanan.tipe[ids], penyimpanan_muat.tipe[ids_muat])
+    assert np.array_equal(penyimpanan.ketebalan[ids], penyimpanan_muat.ketebalan[ids_muat])
+    palet, palet_muat = np.array(penyimpanan.palet), np.array(penyimpanan_muat.palet)
+    assert np.array_equal(palet[penyimpanan.indeks_warna[ids]], palet_muat[penyimpanan_muat.indeks_warna[ids_muat]])
+    for nama in ('pusat', 'radius', 'sudut'):
+        assert np.allclose(getattr(penyimpanan, nama)[ids], getattr(penyimpanan_muat, nama)[ids_muat])
+    (simpul, offset), (simpul_muat, offset_muat) = penyimpanan.simpul_dunia(ids), penyimpanan_muat.simpul_dunia(ids_muat)
+    assert np.array_equal(offset, offset_muat) and np.allclose(simpul, simpul_muat)
+
+
+def buat_poligon_konveks(jumlah, seed=0, lebar=1280, tinggi=720):
+    """Poligon konveks acak terkemas (simpul, offset): persegi dan elips 32 simpul yang diputar, tanpa objek bentuk."""
+    rng = np.random.default_rng(seed)
+    jumlah_simpul = np.where(rng.random(jumlah) < 0.5, 4, 32)
+    offset = np.concatenate(([0], np.cumsum(jumlah_simpul)))
+    pemilik = np.repeat(np.arange(jumlah), jumlah_simpul)
+    urutan = np.arange(offset[-1]) - offset[pemilik]
+    sudut = 2 * np.pi * urutan / jumlah_simpul[pemilik] + rng.uniform(0, 2 * np.pi, jumlah)[pemilik]
+    radius = rng.uniform(5, 80, size=(jumlah, 2))[pemilik]
+    pusat = rng.uniform((0, 0), (lebar, tinggi), size=(jumlah, 2))[pemilik]
+    return pusat + radius * np.column_stack((np.cos(sudut), np.sin(sudut))), offset
+
+
+def benchmark_pemotongan_paralel(jumlah=1000000, daftar_pekerja=None, seed=0):
+    """
+    Pemotongan batch `jumlah` poligon dan segmen dengan 1..N proses (memori bersama), diperiksa
+    sama persis dengan versi satu proses, serta biaya tetap pembagian untuk batch kecil
+    (dasar pemilihan `AMBANG_SIMPUL`).
+    """
+    from pemotongan_paralel import PemotongParalel
+
+    jendela = (200.0, 100.0, 1000.0, 600.0)
+    simpul, offset = buat_poligon_konveks(jumlah, seed)
+    segmen = buat_segmen_acak(jumlah, seed)
+    acuan_poligon = sutherland_hodgman_batch(simpul, offset, jendela)
+    acuan_garis = potong_garis_batch(segmen, jendela)
+
+    jumlah_cpu = os.cpu_count() or 1
+    daftar_pekerja = daftar_pekerja or sorted({1, 2, *range(4, jumlah_cpu + 1, 4), jumlah_cpu})
+    print(f"pemotongan paralel: {jumlah} poligon ({len(simpul)} simpul) + {jumlah} segmen, {jumlah_cpu} CPU")
+    waktu_satu = None
+    for jumlah_pekerja in daftar_pekerja:
+        pemotong = PemotongParalel(jumlah_pekerja, ambang_simpul=0)
+        try:
+            pemotong.potong_poligon(simpul[:offset[100]], offset[:101], jendela)  # pool dibuat di luar pengukuran
+            hasil_poligon = pemotong.potong_poligon(simpul, offset, jendela)
+            hasil_garis = pemotong.potong_garis(segmen, jendela)
+            assert all(np.array_equal(a, b) for a, b in zip(hasil_poligon, acuan_poligon))
+            assert all(np.array_equal(a, b) for a, b in zip(hasil_garis, acuan_garis))
+            waktu_poligon = ukur(lambda: pemotong.potong_poligon(simpul, offset, jendela), ulang=3)
+            waktu_garis = ukur(lambda: pemotong.potong_garis(segmen, jendela), ulang=3)
+        finally:
+            pemotong.tutup()
+        waktu_satu = waktu_satu or waktu_poligon + waktu_garis
+        print(f"  {jumlah_pekerja:>2} proses: poligon {waktu_poligon * 1000:8.1f} ms | garis {waktu_garis * 1000:8.1f} ms"
+              f" | percepatan {waktu_satu / (waktu_poligon + waktu_garis):4.2f}x")
+
+    pemotong = PemotongParalel(2, ambang_simpul=0)
+    try:
+        pemotong.potong_poligon(simpul[:offset[100]], offset[:101], jendela)
+        for jumlah_kecil in (100, 1000, 10000, 100000):
+            bagian = simpul[:offset[jumlah_kecil]], offset[:jumlah_kecil + 1]
+            waktu_langsung = ukur(lambda: sutherland_hodgman_batch(*bagian, jendela))
+            waktu_paralel = ukur(lambda: pemotong.potong_poligon(*bagian, jendela))
+            print(f"  {offset[jumlah_kecil]:>8} simpul: 1 proses {waktu_langsung * 1000:7.2f} ms"
+                  f" | 2 proses {waktu_paralel * 1000:7.2f} ms")
+    finally:
+        pemotong.tutup()
+
+
+def gambar_berurutan(app, konteks):
+    """
+    Seperti `gambar_scene` (tanpa kotak seleksi), tetapi menunggu GPU selesai setelah setiap
+    bentuk. Dipakai sebagai acuan urutan gambar: pada llvmpipe, campuran isi transparan dan
+    garis tebal dalam satu frame besar bisa kehilangan sebagian outline.
+    """
+    from OpenGL.GL import GL_COLOR_BUFFER_BIT, glClear, glLoadIdentity
+
+    glClear(GL_COLOR_BUFFER_BIT)
+    glLoadIdentity()
+    hasil_potong = app.potong_semua_bentuk() if app.window_clipping else None
+    for i, bentuk in enumerate(app.daftar_bentuk):
+        if app.window_clipping:
+            app.gambar_terpotong(bentuk, hasil_potong[i])
+        else:
+            bentuk.gambar()
+        konteks.selesai()
+    if app.window_clipping:
+        app.draw_window_clipping()
+
+
+def benchmark_rasterisasi(daftar_jumlah=(1000, 10000), daftar_tile=None, seed=0, gl=False, lebar=1280, tinggi=720):
+    """
+    Frame per detik `PenggambarCPU` (rasterisasi NumPy) untuk scene campuran tanpa dan dengan
+    jendela pemotongan, per jumlah tile paralel. Dengan `gl`, gambar dibandingkan dengan
+    `gambar_scene` di konteks headless: bagian piksel yang berbeda lebih dari 8 level warna.
+    """
+    from rasterisasi import PenggambarCPU
+
+    konteks = None
+    if gl:
+        from konteks_headless import KonteksHeadless
+        konteks = KonteksHeadless(lebar, tinggi)
+    jumlah_cpu = os.cpu_count() or 1
+    daftar_tile = daftar_tile or sorted({1, *range(2, jumlah_cpu + 1, 2), jumlah_cpu})
+    try:
+        for jumlah in daftar_jumlah:
+            app = buat_scene_campuran(jumlah, seed, lebar, tinggi)
+            if konteks:
+                app.inisialisasi_gl()
+            for jendela in (None, (lebar * 0.25, tinggi * 0.25, lebar * 0.75, tinggi * 0.75)):
+                app.window_clipping = jendela
+                nama = 'terpotong' if jendela else 'utuh'
+                for jumlah_tile in daftar_tile:
+                    penggambar = PenggambarCPU(lebar, tinggi, jumlah_tile)
+                    try:
+                        waktu = ukur(lambda: penggambar.gambar(app), ulang=3)
+                    finally:
+                        penggambar.tutup()
+                    print(f"rasterisasi cpu n={jumlah:>6} {nama:>9} {jumlah_tile:>2} tile: {waktu * 1000:7.1f} ms/frame"
+                          f" | {60 / waktu:7.0f} frame/menit | {penggambar.jumlah_piksel} piksel primitif")
+                if konteks:
+                    gambar_cpu = penggambar.gambar(app)[..., :3].astype(np.int16)
+                    for acuan, gambar_gl in (('gl', app.gambar_scene), ('gl per bentuk', lambda: gambar_berurutan(app, konteks))):
+                        gambar_gl()
+                        konteks.selesai()
+                        selisih = np.abs(konteks.baca_piksel()[..., :3] - gambar_cpu).max(axis=2)
+                        print(f"rasterisasi cpu vs {acuan:<13} n={jumlah:>6} {nama:>9}: "
+                              f"{np.mean(selisih > 8) * 100:.2f}% piksel berbeda")
+    finally:
+        if konteks:
+            konteks.tutup()
+
+
+def benchmark_backend_potong(daftar_jumlah=(1000, 10000, 50000), jumlah_frame=10, seed=0, lebar=1280, tinggi=720):
+    """
+    Waktu frame `gambar_scene` dengan jendela pemotongan yang digeser setiap frame (cache
+    pemotongan selalu meleset) untuk backend_potong 'cpu' dan 'gpu', di konteks headless.
+    Gambar 'gpu' dibandingkan dengan `gambar_berurutan` (pemotongan CPU, urutan per bentuk).
+    """
+    from konteks_headless import KonteksHeadless
+
+    konteks = KonteksHeadless(lebar, tinggi)
+    try:
+        for jumlah in daftar_jumlah:
+            app = buat_scene_campuran(jumlah, seed, lebar, tinggi)
+            app.inisialisasi_gl()
+            waktu = {}
+            for backend in Main.BACKEND_POTONG:
+                app.backend_potong = backend
+                mulai = time.perf_counter()
+                for i in range(jumlah_frame):
+                    app.window_clipping = (lebar * 0.25 + 3 * i, tinggi * 0.25 + 2 * i,
+                                           lebar * 0.75 + 3 * i, tinggi * 0.75 + 2 * i)
+                    app.gambar_scene()
+                    konteks.selesai()
+                waktu[backend] = (time.perf_counter() - mulai) / jumlah_frame
+
+            gambar_berurutan(app, konteks)
+            konteks.selesai()
+            acuan = konteks.baca_piksel()[..., :3].astype(np.int16)
+            app.gambar_scene()
+            konteks.selesai()
+            selisih = np.abs(konteks.baca_piksel()[..., :3] - acuan).max(axis=2)
+            print(f"pemotongan n={jumlah:>6}: cpu {waktu['cpu'] * 1000:8.1f} ms/frame | gpu {waktu['gpu'] * 1000:8.1f} ms/frame"
+                  f" ({waktu['cpu'] / waktu['gpu']:.1f}x) | {np.mean(selisih > 8) * 100:.3f}% piksel berbeda")
+    finally:
+        konteks.tutup()
+
+
+def benchmark_daftar_gambar(daftar_jumlah=(1000, 10000), jumlah_frame=5, seed=0, lebar=1280, tinggi=720):
+    """
+    Waktu frame `gambar_scene` renderer 'langsung' (glBegin/glEnd, warna dan ketebalan per bentuk)
+    dan 'daftar' (DaftarGambar), tanpa dan dengan jendela pemotongan, di konteks headless, beserta
+    draw call dan perubahan keadaan per frame. Gambar 'daftar' dibandingkan dengan `gambar_berurutan`.
+    """
+    from konteks_headless import KonteksHeadless
+
+    konteks = KonteksHeadless(lebar, tinggi)
+    try:
+        for jumlah in daftar_jumlah:
+            app = buat_scene_campuran(jumlah, seed, lebar, tinggi)
+            app.inisialisasi_gl()
+            app.ids_terpilih = app.ids_bentuk()[::50]
+            for jendela in (None, (lebar * 0.25, tinggi * 0.25, lebar * 0.75, tinggi * 0.75)):
+                app.window_clipping = jendela
+                waktu = {}
+                for renderer in ('langsung', 'daftar'):
+                    app.renderer = renderer
+                    app.gambar_scene()  # cache simpul dan hasil potong tidak ikut diukur
+                    konteks.selesai()
+                    mulai = time.perf_counter()
+                    for _ in range(jumlah_frame):
+                        app.gambar_scene()
+                    konteks.selesai()
+                    waktu[renderer] = (time.perf_counter() - mulai) / jumlah_frame
+                daftar = app.daftar_gambar
+                gambar_daftar = konteks.baca_piksel()[..., :3].astype(np.int16)
+                gambar_berurutan(app, konteks)
+                app.gambar_kotak_seleksi()
+                konteks.selesai()
+                selisih = np.abs(konteks.baca_piksel()[..., :3] - gambar_daftar).max(axis=2)
+                # Immediate mode: satu glBegin/glEnd dan sekitar dua perintah keadaan (warna, ketebalan) per primitif.
+                print(f"daftar gambar n={jumlah:>6} {'terpotong' if jendela else 'utuh':>9}: langsung"
+                      f" {waktu['langsung'] * 1000:7.1f} ms/frame (~{daftar.jumlah_primitif} draw call,"
+                      f" ~{2 * daftar.jumlah_primitif} keadaan) | daftar {waktu['daftar'] * 1000:7.1f} ms/frame"
+                      f" ({daftar.jumlah_draw_call} draw call, {daftar.jumlah_ganti_state} keadaan)"
+                      f" | {np.mean(selisih > 8) * 100:.3f}% piksel berbeda")
+    finally:
+        konteks.tutup()
+
+
+def benchmark_masukan(jumlah=1000, jumlah_event=150, interval_ms=2.0, seed=0, lebar=1280, tinggi=720):
+    """
+    Seret jendela sambil menahan tombol panah: `jumlah_event` event (gerak mouse dan translasi
+    bergantian) tiba setiap `interval_ms`, dan setiap frame digambar `PenggambarCPU`. Latensi
+    event -> frame selesai jika setiap event diterapkan dan digambar sendiri, dibandingkan
+    dengan event yang digabung per frame (`Main.masukan`).
+    """
+    from masukan import HistogramLatensi
+    from rasterisasi import PenggambarCPU
+
+    app = buat_scene_campuran(jumlah, seed, lebar, tinggi)
+    app.masukan.minta_gambar = lambda: None  # tanpa GLUT; frame digambar oleh loop di bawah
+    app.ids_terpilih = np.array([app.daftar_bentuk[2].id])
+    penggambar = PenggambarCPU(lebar, tinggi)
+    try:
+        for nama, gabung in (('per event', False), ('digabung', True)):
+            app.window_clipping = (lebar * 0.25, tinggi * 0.25, lebar * 0.75, tinggi * 0.75)
+            app.masukan.histogram = HistogramLatensi()
+            jadwal = time.perf_counter() + np.arange(jumlah_event) * interval_ms / 1000
+            i = jumlah_frame = 0
+            while i < jumlah_event:
+                tunggu = jadwal[i] - time.perf_counter()
+                if tunggu > 0:
+                    time.sleep(tunggu)
+                # Event yang sudah tiba; tanpa penggabungan hanya event terdepan yang diproses per frame.
+                tiba = int(np.searchsorted(jadwal, time.perf_counter(), side='right')) if gabung else i + 1
+                for j in range(i, tiba):
+                    if j % 2:
+                        app.masukan.transformasi('translasi', (1, 0), waktu=jadwal[j])
+                    else:
+                        app.masukan.geser(1, 0, waktu=jadwal[j])
+                i = tiba
+                app.terapkan_masukan()
+                penggambar.gambar(app)
+                app.masukan.swap_selesai()
+                jumlah_frame += 1
+            p50, p95, p99 = app.masukan.histogram.persentil(50, 95, 99)
+            print(f"masukan n={jumlah} {nama:>9}: {jumlah_event} event, {jumlah_frame:>4} frame | latensi p50 {p50:7.1f}"
+                  f" p95 {p95:7.1f} p99 {p99:7.1f} maks {app.masukan.histogram.maks:7.1f} ms")
+    finally:
+        penggambar.tutup()
+
+
+def benchmark_seleksi(jumlah=5000, jumlah_event=30, seed=0):
+    """
+    Translasi/rotasi/skala bergantian pada seleksi `jumlah` bentuk (seleksi kotak seluruh scene):
+    `Main.terapkan_transformasi_terpilih` (satu operasi array per event) dibandingkan dengan loop
+    per bentuk memakai matriks dan pusat bersama yang sama. Hasilnya harus identik.
+    """
+    langkah = [('translasi', (5, -5)), ('rotasi', 5), ('skala', 1.05)]
+    app_batch, app_loop = buat_scene_campuran(jumlah, seed), buat_scene_campuran(jumlah, seed)
+    for app in (app_batch, app_loop):
+        app.pilih_dalam_kotak((-1e9, -1e9, 1e9, 1e9))
+        assert len(app.ids_terpilih) == jumlah
+
+    def per_bentuk(app, tipe_transformasi, nilai):
+        ids = app.ids_terpilih
+        pusat = tuple(app.penyimpanan.titik_pusat(ids).mean(axis=0))
+        matriks = {'translasi': lambda: translasi_2d(*nilai), 'rotasi': lambda: rotasi_2d(nilai, pusat),
+                   'skala': lambda: skala_2d(nilai, nilai, pusat)}[tipe_transformasi]()
+        for id_bentuk in ids.tolist():
+            bentuk = app.daftar_bentuk.bentuk(id_bentuk)
+            bentuk.transformasi(matriks)
+            if tipe_transformasi == 'skala' and bentuk.tipe_bentuk == 'elips':
+                bentuk.radius_x *= nilai
+                bentuk.radius_y *= nilai
+            app.indeks_spasial_kotor.add(id_bentuk)
+
+    # Waktu transformasi saja, dan waktu total termasuk memperbarui indeks spasial (dipakai bersama).
+    waktu, waktu_total = {}, {}
+    for nama, app, terapkan in (('batch', app_batch, app_batch.terapkan_transformasi_terpilih),
+                                ('per bentuk', app_loop, lambda tipe, nilai: per_bentuk(app_loop, tipe, nilai))):
+        waktu[nama] = waktu_total[nama] = 0.0
+        for i in range(jumlah_event):
+            mulai = time.perf_counter()
+            terapkan(*langkah[i % len(langkah)])
+            waktu[nama] += (time.perf_counter() - mulai) / jumlah_event
+            app.perbarui_indeks_spasial()
+            waktu_total[nama] += (time.perf_counter() - mulai) / jumlah_event
+
+    ids = app_batch.ids_bentuk()
+    simpul_batch, offset_batch = app_batch.penyimpanan.simpul_dunia(ids)
+    simpul_loop, offset_loop = app_loop.penyimpanan.simpul_dunia(ids)
+    assert np.array_equal(offset_batch, offset_loop) and np.allclose(simpul_batch, simpul_loop)
+    assert np.allclose(app_batch.indeks_spasial.kotak[ids], app_loop.indeks_spasial.kotak[ids])
+    for nama in waktu:
+        print(f"seleksi n={jumlah} {nama:>10}: transformasi {waktu[nama] * 1000:7.2f} ms/event | dengan indeks spasial"
+              f" {waktu_total[nama] * 1000:7.2f} ms/event")
+
+
+def benchmark_berkas_scene(jumlah=100000, seed=0, jumlah_simpul_besar=10000000):
+    """
+    Simpan/muat scene Modul_A sebagai JSON dan biner (round trip diperiksa), lalu waktu membuka
+    scene biner ~`jumlah_simpul_besar` simpul dan menyentuh sebagian kecil bentuknya.
+    """
+    app = buat_scene_campuran(jumlah, seed)
+    rng = np.random.default_rng(seed)
+    for bentuk in app.daftar_bentuk[::7]:
+        app.terapkan_transformasi(bentuk, 'rotasi', float(rng.uniform(-90, 90)))
+    for bentuk in app.daftar_bentuk[3::11]:
+        app.terapkan_transformasi(bentuk, 'skala', float(rng.uniform(0.5, 2)))
+    app.window_clipping = (200.0, 100.0, 900.0, 600.0)
+
+    with tempfile.TemporaryDirectory() as direktori:
+        for nama, path in (('json', os.path.join(direktori, 'scene.json')), ('biner', os.path.join(direktori, 'scene.bin'))):
+            mulai = time.perf_counter()
+            app.simpan_scene(path)
+            waktu_simpan = time.perf_counter() - mulai
+
+            app_muat = Main()
+            mulai = time.perf_counter()
+            app_muat.muat_scene(path)
+            waktu_muat = time.perf_counter() - mulai
+            periksa_scene_sama(app, app_muat)
+            print(f"scene {nama:>5} n={jumlah}: {os.path.getsize(path) / 2 ** 20:7.1f} MB"
+                  f" | simpan {waktu_simpan * 1000:8.1f} ms | muat {waktu_muat * 1000:8.1f} ms")
+
+        # Perubahan setelah dimuat tidak ditulis balik ke berkas (memory map copy-on-write).
+        app_muat.terapkan_transformasi(app_muat.daftar_bentuk[0], 'translasi', (10, 0))
+        app_muat.tambah_bentuk(Titik((1, 1), (0, 0, 0), 2.0, app_muat.penyimpanan))
+        app_ulang = Main()
+        app_ulang.muat_scene(path)
+        periksa_scene_sama(app, app_ulang)
+
+        # Scene besar: elips dengan jumlah segmen maksimum.
+        besar = Main()
+        for i in range(jumlah_simpul_besar // JUMLAH_SEGMEN_MAKS):
+            besar.tambah_bentuk(Elips((i % 1280, i % 720), 60000, 60000, (0, 0, 1), 1.0, besar.penyimpanan))
+        path = os.path.join(direktori, 'besar.bentuk')
+        besar.simpan_scene(path)
+        jumlah_simpul = besar.penyimpanan.simpul_terpakai
+        del besar
+
+        app_muat = Main()
+        mulai = time.perf_counter()
+        app_muat.muat_scene(path)
+        waktu_muat = time.perf_counter() - mulai
+        mulai = time.perf_counter()
+        for bentuk in app_muat.daftar_bentuk[::1000]:
+            bentuk.dapatkan_simpul_hasil_transformasi()
+        waktu_sentuh = time.perf_counter() - mulai
+        print(f"scene biner {jumlah_simpul} simpul ({os.path.getsize(path) / 2 ** 20:.0f} MB): muat {waktu_muat * 1000:.1f} ms"
+              f" | simpul layar 1 dari 1000 bentuk {waktu_sentuh * 1000:.1f} ms")
+
+
+def ukur(fungsi, ulang=5, waktu_min=0.02):
+    """
+    Waktu terbaik (detik per panggilan) dari `ulang` sampel. Setiap sampel memanggil
+    `fungsi` berulang kali hingga minimal `waktu_min` detik agar fungsi cepat tidak didominasi noise.
+    """
+    mulai = time.perf_counter()
+    fungsi()
+    sekali = time.perf_counter() - mulai
+    jumlah_panggil = max(1, int(waktu_min / max(sekali, 1e-9)))
+
+    terbaik = sekali
+    for _ in range(ulang if ulang > 1 else 0):
+        mulai = time.perf_counter()
+        for _ in range(jumlah_panggil):
+            fungsi()
+        terbaik = min(terbaik, (time.perf_counter() - mulai) / jumlah_panggil)
+    return terbaik
+
+
+def ukur_scene(jumlah, seed=0, sampel=2000, gl=False):
+    """Semua metrik suite untuk satu ukuran scene. Nilai dalam ms (akhiran _ms) atau us (_us); lebih kecil lebih baik."""
+    hasil = {}
+    app = Main()
+    hasil['buat_scene_ms'] = ukur(lambda: buat_scene_campuran(jumlah, seed, app=app), ulang=1) * 1000
+    app.window_clipping = (320, 180, 960, 540)
+    ids = app.ids_bentuk()
+    tipe = app.penyimpanan.tipe[ids]
+    daftar_garis = [app.daftar_bentuk[i] for i in np.flatnonzero(tipe == PenyimpananBentuk.GARIS)[:sampel]]
+    daftar_poligon = [app.daftar_bentuk[i] for i in np.flatnonzero(tipe >= PenyimpananBentuk.PERSEGI)[:sampel]]
+    daftar_elips = [app.daftar_bentuk[i] for i in np.flatnonzero(tipe == PenyimpananBentuk.ELIPS)[:sampel]]
+
+    # Versi per bentuk diukur pada sampel; versi batch pada seluruh scene.
+    segmen = [bentuk.dapatkan_simpul_hasil_transformasi().tolist() for bentuk in daftar_garis]
+    hasil['cohen_sutherland_us'] = ukur(
+        lambda: [app.algoritma_cohen_sutherland(p1, p2) for p1, p2 in segmen]) / max(len(segmen), 1) * 1e6
+    poligon = [[tuple(v) for v in bentuk.dapatkan_simpul_hasil_transformasi().tolist()] for bentuk in daftar_poligon]
+    hasil['sutherland_hodgman_us'] = ukur(
+        lambda: [app.algoritma_sutherland_hodgman(subjek) for subjek in poligon]) / max(len(poligon), 1) * 1e6
+
+    ids_garis, ids_poligon = ids[tipe == PenyimpananBentuk.GARIS], ids[tipe >= PenyimpananBentuk.PERSEGI]
+    simpul_garis, _ = app.penyimpanan.simpul_dunia(ids_garis)
+    hasil['cohen_sutherland_batch_ms'] = ukur(lambda: app.algoritma_garis_batch(simpul_garis.reshape(-1, 2, 2))) * 1000
+    simpul_poligon, offset_poligon = app.penyimpanan.simpul_dunia(ids_poligon)
+    hasil['sutherland_hodgman_batch_ms'] = ukur(
+        lambda: app.algoritma_sutherland_hodgman_batch(simpul_poligon, offset_poligon)) * 1000
+
+    def potong_dingin():
+        app.cache_pemotongan.kosongkan()
+        app.potong_semua_bentuk()
+    hasil['potong_semua_bentuk_ms'] = ukur(potong_dingin) * 1000
+
+    # Setiap transformasi diikuti kebalikannya agar scene tidak berubah selama pengukuran berulang.
+    sampel_bentuk = app.daftar_bentuk[:sampel]
+    transformasi = [(('translasi', (3, -2)), ('translasi', (-3, 2))), (('rotasi', 5), ('rotasi', -5)),
+                    (('skala', 1.25), ('skala', 0.8))]
+
+    def terapkan_semua():
+        for i, bentuk in enumerate(sampel_bentuk):
+            for tipe_transformasi, nilai in transformasi[i % 3]:
+                app.terapkan_transformasi(bentuk, tipe_transformasi, nilai)
+    hasil['terapkan_transformasi_us'] = ukur(terapkan_semua) / (2 * len(sampel_bentuk)) * 1e6
+
+    # Picking seperti di Main.mouse (mode PILIH): klik acak di kanvas.
+    klik = np.random.default_rng(seed + 1).uniform((0, 0), (app.lebar, app.tinggi), size=(sampel, 2)).tolist()
+    app.perbarui_indeks_spasial()
+    hasil['picking_us'] = ukur(lambda: [app.cari_bentuk_di(x, y) for x, y in klik]) / len(klik) * 1e6
+
+    hasil['elips_simpul_hit_us'] = ukur(
+        lambda: [elips.dapatkan_simpul_hasil_transformasi() for elips in daftar_elips]) / len(daftar_elips) * 1e6
+
+    def elips_miss():
+        for elips in daftar_elips:
+            app.penyimpanan.tandai_berubah(elips.id)
+            elips.dapatkan_simpul_hasil_transformasi()
+    hasil['elips_simpul_miss_us'] = ukur(elips_miss) / len(daftar_elips) * 1e6
+
+    if gl:
+        hasil.update(ukur_gl(app))
+    return hasil
+
+
+def ukur_gl(app, lebar=1280, tinggi=720):
+    """Waktu frame Modul_A (immediate mode, daftar gambar dan VBO) dan kubus Modul_B di konteks headless."""
+    from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, glClear, glEnable, glFinish
+    from konteks_headless import KonteksHeadless
+
+    hasil = {}
+    konteks = KonteksHeadless(lebar, tinggi)
+    try:
+        app.inisialisasi_gl()
+        app.window_clipping = None
+
+        def frame():
+            app.gambar_scene()
+            glFinish()
+        app.renderer = 'langsung'
+        hasil['gl_frame_langsung_ms'] = ukur(frame, ulang=1) * 1000
+        app.renderer = 'daftar'
+        hasil['gl_frame_daftar_ms'] = ukur(frame) * 1000
+
+        app.renderer = 'vbo'
+        app.inisialisasi_gl()
+        frame()  # Unggahan pertama ke VBO tidak ikut diukur.
+        hasil['gl_frame_vbo_ms'] = ukur(frame) * 1000
+        app.penggambar_vbo.hapus()
+        app.renderer, app.penggambar_vbo = 'langsung', None
+
+        try:
+            os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+            import Modul_B
+        except ImportError:
+            return hasil
+        from renderer_mesh import PenggambarMesh
+        glEnable(GL_DEPTH_TEST)
+        Modul_B.setup_lighting()
+        kubus = PenggambarMesh(Modul_B.mesh_kubus())
+
+        def frame_kubus():
+            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+            for _ in range(1000):
+                kubus.gambar()
+            glFinish()
+        hasil['gl_kubus_1000_ms'] = ukur(frame_kubus) * 1000
+        kubus.hapus()
+    finally:
+        konteks.tutup()
+    return hasil
+
+
+def jalankan_suite(daftar_ukuran, seed=0, gl=False):
+    from konteks_headless import konteks_tersedia
+
+    if gl and not konteks_tersedia():
+        print("konteks OpenGL headless tidak tersedia; pengukuran GL dilewati", file=sys.stderr)
+        gl = False
+
+    laporan = {
+        'meta': {'seed': seed, 'gl': gl, 'python': platform.python_version(), 'numpy': np.__version__,
+                 'platform': platform.platform(), 'waktu': time.strftime('%Y-%m-%dT%H:%M:%S')},
+        'hasil': {},
+    }
+    for jumlah in daftar_ukuran:
+        mulai = time.perf_counter()
+        laporan['hasil'][str(jumlah)] = ukur_scene(jumlah, seed, gl=gl)
+        print(f"suite n={jumlah}: selesai dalam {time.perf_counter() - mulai:.1f} s", file=sys.stderr)
+    return laporan
+
+
+def bandingkan(laporan, baseline, ambang=0.3):
+    """
+    Bandingkan metrik `laporan` dengan `baseline` (format sama). Metrik yang lebih lambat
+    lebih dari `ambang` (0.3 = 30%) ditandai sebagai regresi. Mengembalikan daftar regresi.
+    """
+    regresi = []
+    for jumlah, metrik in laporan['hasil'].items():
+        metrik_lama = baseline['hasil'].get(jumlah, {})
+        for nama, nilai in metrik.items():
+            if nama not in metrik_lama:
+                continue
+            rasio = nilai / metrik_lama[nama] if metrik_lama[nama] else float('inf')
+            tanda = 'REGRESI' if rasio > 1 + ambang else ('lebih cepat' if rasio < 1 - ambang else '')
+            print(f"n={jumlah:>8} {nama:<30} {metrik_lama[nama]:>12.3f} -> {nilai:>12.3f} ({rasio:6.2f}x) {tanda}")
+            if tanda == 'REGRESI':
+                regresi.append((jumlah, nama, metrik_lama[nama], nilai))
+    return regresi
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--ukuran', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--gl', action='store_true', help="jalankan juga benchmark render OpenGL headless")
+    parser.add_argument('--suite', action='store_true', help="jalankan suite terukur dengan keluaran JSON")
+    parser.add_argument('--keluaran', help="simpan hasil suite ke file JSON ini (default: stdout)")
+    parser.add_argument('--baseline', help="file JSON hasil suite sebelumnya untuk dibandingkan")
+    parser.add_argument('--ambang', type=float, default=0.3, help="batas perlambatan relatif sebelum dianggap regresi")
+    args = parser.parse_args()
+
+    if args.suite or args.baseline:
+        laporan = jalankan_suite(args.ukuran, args.seed, args.gl)
+        if args.keluaran:
+            with open(args.keluaran, 'w') as berkas:
+                json.dump(laporan, berkas, indent=2)
+        else:
+            json.dump(laporan, sys.stdout, indent=2)
+            print()
+        if args.baseline:
+            with open(args.baseline) as berkas:
+                regresi = bandingkan(laporan, json.load(berkas), args.ambang)
+            print(f"{len(regresi)} regresi", file=sys.stderr)
+            sys.exit(1 if regresi else 0)
+        sys.exit(0)
+
+    benchmark_sutherland_hodgman(args.ukuran, seed=args.seed)
+    benchmark_cohen_sutherland(args.ukuran, seed=args.seed)
+    benchmark_penyimpanan(max(args.ukuran), seed=args.seed)
+    benchmark_picking(max(args.ukuran), seed=args.seed)
+    benchmark_uji_kena(max(args.ukuran), seed=args.seed)
+    benchmark_cache(max(args.ukuran), seed=args.seed)
+    benchmark_seret_jendela(seed=args.seed)
+    benchmark_transformasi_tertunda(seed=args.seed)
+    benchmark_elips_adaptif(seed=args.seed, gl=args.gl)
+    benchmark_mesh(seed=args.seed)
+    benchmark_matriks_batch(seed=args.seed)
+    benchmark_berkas_scene(max(args.ukuran), seed=args.seed)
+    benchmark_pemotongan_paralel(seed=args.seed)
+    benchmark_rasterisasi(seed=args.seed, gl=args.gl)
+    benchmark_masukan(seed=args.seed)
+    benchmark_seleksi(seed=args.seed)
+    if args.gl:
+        for jumlah in args.ukuran:
+            benchmark_renderer_vbo(jumlah, seed=args.seed)
+        benchmark_daftar_gambar(seed=args.seed)
+        benchmark_backend_potong(seed=args.seed)
+        benchmark_instans(seed=args.seed)
@@ -0,0 +1,107 @@
+"""
+Pemotongan inkremental terhadap jendela pemotongan.
+
+Bentuk diklasifikasikan dari kotak pembatasnya (AABB): yang seluruhnya di dalam
+jendela diteruskan apa adanya, yang seluruhnya di luar dibuang, dan hanya bentuk
+yang memotong sisi jendela yang benar-benar dipotong. Hasil potong disimpan per
+(id bentuk, versi geometri, jendela, metode potong garis) dalam cache LRU berukuran terbatas, sehingga
+menggambar ulang tanpa perubahan atau menggeser jendela kembali ke posisi lama
+tidak memotong ulang apa pun.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from pemotongan import pecah_poligon
+from penyimpanan_bentuk import PenyimpananBentuk
+
+
+class CachePemotongan:
+
+    def __init__(self, penyimpanan, potong_garis, potong_poligon, maks_entri=100000):
+        self.penyimpanan = penyimpanan
+        # potong_garis(segmen (N, 2, 2)) -> (segmen, diterima);
+        # potong_poligon(simpul, offset) -> (simpul, offset). Keduanya memakai jendela yang sedang aktif.
+        self.potong_garis = potong_garis
+        self.potong_poligon = potong_poligon
+        self.maks_entri = maks_entri
+        self.memo = OrderedDict()  # (id, versi, jendela, metode) -> simpul hasil potong
+
+        self.jumlah_dalam = self.jumlah_luar = self.jumlah_dipotong = self.memo_hit = 0
+
+    def __len__(self):
+        return len(self.memo)
+
+    def kosongkan(self):
+        """Hapus semua hasil tersimpan (wajib setelah penyimpanan dikosongkan)."""
+        self.memo.clear()
+
+    def statistik(self):
+        return {'dalam': self.jumlah_dalam, 'luar': self.jumlah_luar,
+                'dipotong': self.jumlah_dipotong, 'memo_hit': self.memo_hit, 'memo': len(self.memo)}
+
+    def potong(self, ids, window_clipping, metode_garis=None):
+        """
+        Hasil potong setiap bentuk `ids` terhadap `window_clipping`: array simpul
+        (kosong jika tidak terlihat), atau None untuk titik. `metode_garis` adalah metode
+        yang dipakai `potong_garis`; ikut menjadi kunci memo agar hasil metode lain tidak terpakai.
+        """
+        penyimpanan = self.penyimpanan
+        ids = np.asarray(ids, dtype=np.int64)
+        hasil = [None] * len(ids)
+        if not len(ids):
+            return hasil
+
+        x_min, y_min, x_max, y_max = window_clipping
+        # batas() juga menyegarkan cache simpul dunia, jadi `penyimpanan.dunia` bisa dibaca langsung.
+        kotak = penyimpanan.batas(ids)
+        bukan_titik = penyimpanan.tipe[ids] != PenyimpananBentuk.TITIK
+        di_dalam = bukan_titik & (kotak[:, 0] >= x_min) & (kotak[:, 2] <= x_max) & (kotak[:, 1] >= y_min) & (kotak[:, 3] <= y_max)
+        di_luar = bukan_titik & ((kotak[:, 2] < x_min) | (kotak[:, 0] > x_max) | (kotak[:, 3] < y_min) | (kotak[:, 1] > y_max))
+        terpotong = np.flatnonzero(bukan_titik & ~(di_dalam | di_luar))
+
+        kosong = penyimpanan.dunia[:0]
+        for i in np.flatnonzero(di_luar):
+            hasil[i] = kosong
+
+        indeks_dalam = np.flatnonzero(di_dalam)
+        dunia = penyimpanan.dunia
+        for i, awal, panjang in zip(indeks_dalam.tolist(), penyimpanan.offset[ids[indeks_dalam]].tolist(),
+                                    penyimpanan.panjang[ids[indeks_dalam]].tolist()):
+            hasil[i] = dunia[awal:awal + panjang]
+
+        # Bentuk yang memotong sisi jendela: ambil dari memo, sisanya dipotong dalam satu batch per jenis.
+        jendela = tuple(window_clipping)
+        belum, kunci_belum = [], []
+        for i, id_bentuk, versi in zip(terpotong.tolist(), ids[terpotong].tolist(), penyimpanan.versi[ids[terpotong]].tolist()):
+            kunci = (id_bentuk, versi, jendela, metode_garis)
+            simpan = self.memo.get(kunci)
+            if simpan is None:
+                belum.append(i)
+                kunci_belum.append(kunci)
+            else:
+                self.memo.move_to_end(kunci)
+                hasil[i] = simpan
+        self.memo_hit += len(terpotong) - len(belum)
+
+        belum = np.array(belum, dtype=np.int64)
+        garis = penyimpanan.tipe[ids[belum]] == PenyimpananBentuk.GARIS
+        if garis.any():
+            simpul, _ = penyimpanan.simpul_dunia(ids[belum[garis]])
+            segmen, diterima = self.potong_garis(simpul.reshape(-1, 2, 2))
+            for i, seg, terima in zip(belum[garis].tolist(), segmen, diterima):
+                hasil[i] = seg if terima else seg[:0]
+        if (~garis).any():
+            simpul, offset = penyimpanan.simpul_dunia(ids[belum[~garis]])
+            for i, poligon in zip(belum[~garis].tolist(), pecah_poligon(*self.potong_poligon(simpul, offset))):
+                hasil[i] = poligon
+
+        for i, kunci in zip(belum.tolist(), kunci_belum):
+            self.memo[kunci] = hasil[i]
+        while len(self.memo) > self.maks_entri:
+            self.memo.popitem(last=False)
+
+        self.jumlah_dalam += len(indeks_dalam)
+        self.jumlah_luar += int(di_luar.sum())
+        self.jumlah_dipotong += len(belum)
+        return hasil
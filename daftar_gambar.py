@@ -0,0 +1,128 @@
+"""
+Daftar gambar (draw list) untuk Modul_A: primitif satu frame dikumpulkan dulu,
+lalu dikirim per kelompok keadaan (primitif, ketebalan/ukuran titik, warna dan
+alpha, blending) dengan satu `glMultiDrawArrays` per kelompok, sehingga warna,
+ketebalan dan mode hanya diganti saat kelompok berganti.
+
+Urutan gambar tetap dipertahankan lewat depth buffer: setiap primitif diberi
+kedalaman menurut kunci urutannya (makin besar makin dekat), sehingga primitif
+opak boleh dikirim dalam urutan kelompok mana pun dan tetap hanya menimpa yang
+digambar sebelumnya di tempat keduanya bertumpuk. Primitif transparan dikirim
+setelah semua primitif opak, menurut urutannya, dengan uji kedalaman tetapi
+tanpa menulis kedalaman: bagian yang tertutup primitif opak sesudahnya dibuang,
+dan yang bertumpuk dicampur seperti urutan aslinya.
+"""
+import numpy as np
+from OpenGL.GL import *
+
+from pemotongan import indeks_gabungan
+
+
+class DaftarGambar:
+
+    def __init__(self):
+        self.kosongkan()
+        # Statistik `kirim` terakhir: draw call, perubahan keadaan GL, dan jumlah primitif.
+        self.jumlah_draw_call = self.jumlah_ganti_state = self.jumlah_primitif = 0
+
+    def kosongkan(self):
+        self._simpul, self._panjang, self._kunci = [], [], []
+        self._mode, self._ukuran, self._warna = [], [], []
+
+    def tambah(self, mode, simpul, panjang, kunci, ukuran, warna, alpha=1.0):
+        """
+        Tambah primitif terkemas: `simpul` (m, 2) dengan jumlah simpul per primitif `panjang`.
+        `mode` (primitif GL), `kunci` (urutan gambar), `ukuran` (ketebalan garis atau ukuran titik)
+        dan `warna` (RGB) boleh satu nilai untuk semua primitif atau satu nilai per primitif.
+        """
+        panjang = np.asarray(panjang, dtype=np.int64).reshape(-1)
+        if not len(panjang):
+            return
+        jumlah = len(panjang)
+        warna = np.broadcast_to(np.asarray(warna, dtype=np.float32).reshape(-1, 3), (jumlah, 3))
+        self._simpul.append(np.asarray(simpul, dtype=np.float64).reshape(-1, 2))
+        self._panjang.append(panjang)
+        self._kunci.append(np.broadcast_to(np.asarray(kunci, dtype=np.int64), jumlah))
+        self._mode.append(np.broadcast_to(np.asarray(mode, dtype=np.int64), jumlah))
+        self._ukuran.append(np.broadcast_to(np.asarray(ukuran, dtype=np.float32), jumlah))
+        self._warna.append(np.column_stack((warna, np.full(jumlah, alpha, dtype=np.float32))))
+
+    def kelompok(self):
+        """
+        Urutan kirim: (simpul (m, 3) dengan kedalaman, awal, panjang, batas kelompok, mode, ukuran, warna RGBA).
+        Kelompok ke-k berisi primitif batas[k]:batas[k + 1] dari urutan tersebut.
+        """
+        panjang = np.concatenate(self._panjang)
+        offset = np.zeros(len(panjang) + 1, dtype=np.int64)
+        np.cumsum(panjang, out=offset[1:])
+        kunci, mode = np.concatenate(self._kunci), np.concatenate(self._mode)
+        ukuran, warna = np.concatenate(self._ukuran), np.concatenate(self._warna)
+        # Nomor warna (urutan leksikografis RGBA); lexsort jauh lebih cepat daripada np.unique(axis=0).
+        urut_warna = np.lexsort(warna.T[::-1])
+        nomor_warna = np.empty(len(warna), dtype=np.int64)
+        nomor_warna[urut_warna] = np.concatenate(([0], np.cumsum((np.diff(warna[urut_warna], axis=0) != 0).any(axis=1))))
+
+        # Opak dikelompokkan menurut keadaannya; transparan menyusul sesuai kunci urutan.
+        transparan = warna[:, 3] < 1
+        opak = np.flatnonzero(~transparan)
+        opak = opak[np.lexsort((nomor_warna[opak], ukuran[opak], mode[opak]))]
+        transparan = np.flatnonzero(transparan)
+        urutan = np.concatenate((opak, transparan[np.argsort(kunci[transparan], kind='stable')]))
+        mode, ukuran, nomor_warna = mode[urutan], ukuran[urutan], nomor_warna[urutan]
+        batas = np.flatnonzero((np.diff(mode, prepend=-1) != 0) | (np.diff(ukuran, prepend=-1) != 0)
+                               | (np.diff(nomor_warna, prepend=-1) != 0))
+
+        # Kedalaman dari peringkat kunci di (-1, 1); gluOrtho2D membalik z sehingga kunci terbesar terdekat.
+        nilai_kunci, peringkat = np.unique(kunci, return_inverse=True)
+        z = (-1 + 2 * (peringkat.reshape(-1) + 1) / (len(nilai_kunci) + 1)).astype(np.float32)
+        panjang_urut = panjang[urutan]
+        simpul = np.empty((int(panjang_urut.sum()), 3), dtype=np.float32)
+        simpul[:, :2] = np.concatenate(self._simpul)[indeks_gabungan(offset[urutan], panjang_urut)]
+        simpul[:, 2] = np.repeat(z[urutan], panjang_urut)
+        awal = np.cumsum(panjang_urut) - panjang_urut
+        return simpul, awal, panjang_urut, np.append(batas, len(urutan)), mode, ukuran, warna[urutan]
+
+    def kirim(self):
+        """Gambar semua primitif per kelompok, lalu kosongkan daftar. Mengembalikan jumlah draw call."""
+        self.jumlah_draw_call = self.jumlah_ganti_state = self.jumlah_primitif = 0
+        if not self._panjang:
+            return 0
+        simpul, awal, panjang, batas, mode, ukuran, warna = self.kelompok()
+        self.kosongkan()
+        self.jumlah_primitif = len(panjang)
+        awal, panjang = awal.astype(np.int32), panjang.astype(np.int32)
+
+        glClear(GL_DEPTH_BUFFER_BIT)
+        glEnable(GL_DEPTH_TEST)
+        glDepthFunc(GL_LESS)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, simpul)
+
+        # Keadaan saat ini; perintah keadaan hanya dikirim (dan dihitung) jika nilainya berubah.
+        warna_aktif, garis_aktif, titik_aktif, tulis_kedalaman = None, None, None, True
+        for dari, sampai in zip(batas[:-1].tolist(), batas[1:].tolist()):
+            warna_kelompok = tuple(warna[dari].tolist())
+            if warna_kelompok != warna_aktif:
+                glColor4f(*warna_kelompok)
+                warna_aktif = warna_kelompok
+                self.jumlah_ganti_state += 1
+            if tulis_kedalaman and warna_kelompok[3] < 1:
+                glDepthMask(GL_FALSE)
+                tulis_kedalaman = False
+                self.jumlah_ganti_state += 1
+            if mode[dari] == GL_POINTS:
+                if ukuran[dari] != titik_aktif:
+                    glPointSize(float(ukuran[dari]))
+                    titik_aktif = ukuran[dari]
+                    self.jumlah_ganti_state += 1
+            elif mode[dari] != GL_POLYGON and ukuran[dari] != garis_aktif:
+                glLineWidth(float(ukuran[dari]))
+                garis_aktif = ukuran[dari]
+                self.jumlah_ganti_state += 1
+            glMultiDrawArrays(int(mode[dari]), awal[dari:sampai], panjang[dari:sampai], sampai - dari)
+            self.jumlah_draw_call += 1
+
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDepthMask(GL_TRUE)
+        glDisable(GL_DEPTH_TEST)
+        return self.jumlah_draw_call
@@ -0,0 +1,186 @@
+"""
+Indeks spasial grid seragam untuk kotak pembatas (AABB) bentuk.
+
+Setiap bentuk didaftarkan ke semua sel grid yang disentuh kotaknya, sehingga
+pencarian titik (picking) dan pencarian persegi (jendela pemotongan) hanya
+memeriksa bentuk di sel yang relevan, bukan seluruh scene.
+"""
+import numpy as np
+
+
+class IndeksSpasial:
+
+    def __init__(self, ukuran_sel=64.0, maks_sel_per_bentuk=256):
+        self.ukuran_sel = ukuran_sel
+        # Bentuk yang menyentuh lebih banyak sel dari ini disimpan di `bentuk_besar`
+        # dan selalu ikut diperiksa, agar satu bentuk raksasa tidak mengisi ribuan sel.
+        self.maks_sel_per_bentuk = maks_sel_per_bentuk
+        self.sel = {}
+        self._sel_array = {}  # Salinan isi sel sebagai array id menurun, dibuat saat dibutuhkan.
+        self.bentuk_besar = set()
+        self.sel_bentuk = {}  # id -> (ix_min, iy_min, ix_max, iy_max) atau None jika bentuk besar
+        self.kotak = np.zeros((64, 4), dtype=np.float64)
+
+    def __len__(self):
+        return len(self.sel_bentuk)
+
+    def __contains__(self, id_bentuk):
+        return id_bentuk in self.sel_bentuk
+
+    def kosongkan(self):
+        self.sel.clear()
+        self._sel_array.clear()
+        self.bentuk_besar.clear()
+        self.sel_bentuk.clear()
+
+    def _rentang_sel(self, kotak):
+        min_x, min_y, max_x, max_y = kotak
+        return (int(min_x // self.ukuran_sel), int(min_y // self.ukuran_sel),
+                int(max_x // self.ukuran_sel), int(max_y // self.ukuran_sel))
+
+    def _simpan_kotak(self, ids, kotak):
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) and ids.max() >= len(self.kotak):
+            baru = np.zeros((max(ids.max() + 1, len(self.kotak) * 2), 4), dtype=np.float64)
+            baru[:len(self.kotak)] = self.kotak
+            self.kotak = baru
+        self.kotak[ids] = kotak
+
+    def sisipkan(self, id_bentuk, kotak):
+        if id_bentuk in self.sel_bentuk:
+            self.hapus(id_bentuk)
+        self._simpan_kotak([id_bentuk], kotak)
+
+        ix_min, iy_min, ix_max, iy_max = rentang = self._rentang_sel(kotak)
+        if (ix_max - ix_min + 1) * (iy_max - iy_min + 1) > self.maks_sel_per_bentuk:
+            self.bentuk_besar.add(id_bentuk)
+            self.sel_bentuk[id_bentuk] = None
+            return
+
+        self.sel_bentuk[id_bentuk] = rentang
+        for ix in range(ix_min, ix_max + 1):
+            for iy in range(iy_min, iy_max + 1):
+                self.sel.setdefault((ix, iy), set()).add(id_bentuk)
+                self._sel_array.pop((ix, iy), None)
+
+    def hapus(self, id_bentuk):
+        rentang = self.sel_bentuk.pop(id_bentuk)
+        if rentang is None:
+            self.bentuk_besar.discard(id_bentuk)
+            return
+
+        ix_min, iy_min, ix_max, iy_max = rentang
+        for ix in range(ix_min, ix_max + 1):
+            for iy in range(iy_min, iy_max + 1):
+                isi = self.sel[(ix, iy)]
+                isi.discard(id_bentuk)
+                self._sel_array.pop((ix, iy), None)
+                if not isi:
+                    del self.sel[(ix, iy)]
+
+    def perbarui(self, id_bentuk, kotak):
+        """Perbarui kotak satu bentuk; sel hanya diubah jika rentang selnya berubah."""
+        if self.sel_bentuk.get(id_bentuk, False) == self._rentang_sel(kotak):
+            self._simpan_kotak([id_bentuk], kotak)
+        else:
+            self.sisipkan(id_bentuk, kotak)
+
+    def perbarui_banyak(self, ids, kotak):
+        """
+        Seperti `perbarui` untuk banyak bentuk sekaligus (id yang belum terdaftar dilewati). Rentang sel
+        dihitung dalam satu operasi array; hanya bentuk yang pindah sel yang disisipkan ulang.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        kotak = np.asarray(kotak, dtype=np.float64).reshape(-1, 4)
+        terdaftar = np.fromiter((id_bentuk in self.sel_bentuk for id_bentuk in ids.tolist()), dtype=bool, count=len(ids))
+        ids, kotak = ids[terdaftar], kotak[terdaftar]
+        rentang = map(tuple, np.floor_divide(kotak, self.ukuran_sel).astype(np.int64).tolist())
+        tetap = np.fromiter((self.sel_bentuk[id_bentuk] == r for id_bentuk, r in zip(ids.tolist(), rentang)),
+                            dtype=bool, count=len(ids))
+        self._simpan_kotak(ids, kotak)
+        if 8 * np.count_nonzero(~tetap) > len(self):
+            # Sebagian besar scene pindah sel (mis. seleksi besar diputar): bangun ulang sekaligus lebih murah.
+            semua = np.fromiter(self.sel_bentuk, dtype=np.int64, count=len(self))
+            self.bangun(semua, self.kotak[semua])
+            return
+        for id_bentuk, kotak_bentuk in zip(ids[~tetap].tolist(), kotak[~tetap]):
+            self.sisipkan(id_bentuk, kotak_bentuk)
+
+    def bangun(self, ids, kotak):
+        """Bangun ulang indeks untuk banyak bentuk sekaligus; rentang sel dihitung dalam satu operasi array."""
+        self.kosongkan()
+        ids = np.asarray(ids, dtype=np.int64)
+        kotak = np.asarray(kotak, dtype=np.float64).reshape(-1, 4)
+        self._simpan_kotak(ids, kotak)
+
+        rentang = np.floor_divide(kotak, self.ukuran_sel).astype(np.int64)
+        lebar = rentang[:, 2] - rentang[:, 0] + 1
+        tinggi = rentang[:, 3] - rentang[:, 1] + 1
+        besar = lebar * tinggi > self.maks_sel_per_bentuk
+
+        for id_bentuk in ids[besar].tolist():
+            self.bentuk_besar.add(id_bentuk)
+            self.sel_bentuk[id_bentuk] = None
+
+        kecil = ~besar
+        ids_kecil, rentang_kecil = ids[kecil], rentang[kecil]
+        lebar, tinggi = lebar[kecil], tinggi[kecil]
+        self.sel_bentuk.update(zip(ids_kecil.tolist(), map(tuple, rentang_kecil.tolist())))
+
+        # Pasangan (sel, id) untuk semua bentuk kecil tanpa loop per bentuk.
+        jumlah_sel = lebar * tinggi
+        pemilik = np.repeat(np.arange(len(ids_kecil)), jumlah_sel)
+        urutan = np.arange(len(pemilik)) - np.repeat(np.cumsum(jumlah_sel) - jumlah_sel, jumlah_sel)
+        ix = rentang_kecil[pemilik, 0] + urutan // tinggi[pemilik]
+        iy = rentang_kecil[pemilik, 1] + urutan % tinggi[pemilik]
+
+        # Kelompokkan pasangan menurut sel dengan satu pengurutan, lalu isi dict per sel.
+        kunci = (ix - ix.min(initial=0)) * (iy.max(initial=0) - iy.min(initial=0) + 1) + (iy - iy.min(initial=0))
+        urutan = np.argsort(kunci, kind='stable')
+        kunci, ix, iy, isi = kunci[urutan], ix[urutan], iy[urutan], ids_kecil[pemilik][urutan]
+        awal = np.flatnonzero(np.diff(kunci, prepend=-1))
+        for ix_sel, iy_sel, isi_sel in zip(ix[awal].tolist(), iy[awal].tolist(), np.split(isi, awal[1:])):
+            self.sel[(ix_sel, iy_sel)] = set(isi_sel.tolist())
+
+    def _saring(self, kandidat, cocok):
+        kandidat = np.fromiter(kandidat, dtype=np.int64, count=len(kandidat))
+        return kandidat[cocok(self.kotak[kandidat])] if len(kandidat) else kandidat
+
+    def _isi_sel(self, kunci):
+        isi = self._sel_array.get(kunci)
+        if isi is None:
+            isi = np.sort(np.fromiter(self.sel.get(kunci, ()), dtype=np.int64))[::-1]
+            self._sel_array[kunci] = isi
+        return isi
+
+    def cari_titik(self, x, y, jarak=0.0):
+        """
+        Id bentuk yang kotaknya, diperbesar `jarak` ke semua arah, memuat (x, y) secara ketat
+        (dengan jarak=0 sama dengan syarat picking lama), urut dari yang paling atas
+        (id terbesar = digambar terakhir).
+        """
+        ix_min, iy_min, ix_max, iy_max = self._rentang_sel((x - jarak, y - jarak, x + jarak, y + jarak))
+        if ix_min == ix_max and iy_min == iy_max:
+            kandidat = self._isi_sel((ix_min, iy_min))
+        else:
+            kandidat = np.unique(np.concatenate([self._isi_sel((ix, iy)) for ix in range(ix_min, ix_max + 1)
+                                                 for iy in range(iy_min, iy_max + 1)]))[::-1]
+        if self.bentuk_besar:
+            kandidat = np.union1d(kandidat, list(self.bentuk_besar))[::-1]
+        k = self.kotak[kandidat]
+        return kandidat[(k[:, 0] - jarak < x) & (x < k[:, 2] + jarak) & (k[:, 1] - jarak < y) & (y < k[:, 3] + jarak)]
+
+    def cari_persegi(self, x_min, y_min, x_max, y_max):
+        """Id bentuk yang kotaknya beririsan dengan persegi (batas inklusif), urut menurut urutan gambar."""
+        ix_min, iy_min, ix_max, iy_max = self._rentang_sel((x_min, y_min, x_max, y_max))
+        kandidat = set(self.bentuk_besar)
+        if (ix_max - ix_min + 1) * (iy_max - iy_min + 1) > len(self.sel):
+            for isi in self.sel.values():
+                kandidat |= isi
+        else:
+            for ix in range(ix_min, ix_max + 1):
+                for iy in range(iy_min, iy_max + 1):
+                    kandidat |= self.sel.get((ix, iy), set())
+
+        hasil = self._saring(kandidat, lambda k: (k[:, 0] <= x_max) & (k[:, 2] >= x_min) & (k[:, 1] <= y_max) & (k[:, 3] >= y_min))
+        return np.sort(hasil)
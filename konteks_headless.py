@@ -0,0 +1,121 @@
+"""
+Konteks OpenGL tanpa jendela untuk pengujian, benchmark dan render batch.
+
+Memakai EGL surfaceless (Mesa llvmpipe) atau OSMesa, lalu menggambar ke
+framebuffer object berukuran tetap. `siapkan_platform()` harus dipanggil
+sebelum modul OpenGL pertama kali di-import karena PyOpenGL memilih platform
+saat import.
+"""
+import ctypes
+import os
+
+import numpy as np
+
+PLATFORM_DIDUKUNG = ('egl', 'osmesa')
+
+
+def siapkan_platform(platform='egl'):
+    """Pilih platform PyOpenGL headless (kecuali sudah diatur lewat PYOPENGL_PLATFORM)."""
+    return os.environ.setdefault('PYOPENGL_PLATFORM', platform)
+
+
+def konteks_tersedia():
+    """True jika konteks headless bisa dibuat di mesin ini."""
+    try:
+        KonteksHeadless(16, 16).tutup()
+        return True
+    except Exception:
+        return False
+
+
+class KonteksHeadless:
+
+    def __init__(self, lebar, tinggi):
+        self.lebar, self.tinggi = lebar, tinggi
+        self._buffer_baca = None  # buffer sementara baca_piksel (dipakai ulang)
+        self.platform = os.environ.get('PYOPENGL_PLATFORM')
+        if self.platform not in PLATFORM_DIDUKUNG:
+            raise RuntimeError("Panggil siapkan_platform() sebelum meng-import OpenGL "
+                               f"(PYOPENGL_PLATFORM={self.platform!r})")
+
+        if self.platform == 'egl':
+            self._buat_egl()
+        else:
+            self._buat_osmesa()
+        self._buat_framebuffer()
+
+    def _buat_egl(self):
+        from OpenGL import EGL
+
+        EGL_PLATFORM_SURFACELESS_MESA = 0x31DD
+        self.display = EGL.eglGetPlatformDisplay(EGL_PLATFORM_SURFACELESS_MESA, EGL.EGL_DEFAULT_DISPLAY, None)
+        if not self.display or not EGL.eglInitialize(self.display, None, None):
+            raise RuntimeError("EGL surfaceless tidak tersedia")
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        self.konteks = EGL.eglCreateContext(self.display, None, EGL.EGL_NO_CONTEXT, None)
+        if not self.konteks or not EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, self.konteks):
+            raise RuntimeError("Gagal membuat konteks EGL")
+
+    def _buat_osmesa(self):
+        from OpenGL import GL, osmesa
+
+        self.konteks = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 8, 0, None)
+        if not self.konteks:
+            raise RuntimeError("Gagal membuat konteks OSMesa")
+        self._buffer_osmesa = (ctypes.c_ubyte * (self.lebar * self.tinggi * 4))()
+        if not osmesa.OSMesaMakeCurrent(self.konteks, self._buffer_osmesa, GL.GL_UNSIGNED_BYTE, self.lebar, self.tinggi):
+            raise RuntimeError("Gagal mengaktifkan konteks OSMesa")
+
+    def _buat_framebuffer(self):
+        from OpenGL.GL import (GL_COLOR_ATTACHMENT0, GL_DEPTH24_STENCIL8, GL_DEPTH_STENCIL_ATTACHMENT, GL_FRAMEBUFFER,
+                               GL_FRAMEBUFFER_COMPLETE, GL_RENDERBUFFER, GL_RGBA8, glBindFramebuffer,
+                               glBindRenderbuffer, glCheckFramebufferStatus, glFramebufferRenderbuffer,
+                               glGenFramebuffers, glGenRenderbuffers, glRenderbufferStorage, glViewport)
+
+        self.framebuffer = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.framebuffer)
+        self.renderbuffer = glGenRenderbuffers(2)
+        for renderbuffer, format_internal, attachment in zip(
+                self.renderbuffer, (GL_RGBA8, GL_DEPTH24_STENCIL8), (GL_COLOR_ATTACHMENT0, GL_DEPTH_STENCIL_ATTACHMENT)):
+            glBindRenderbuffer(GL_RENDERBUFFER, renderbuffer)
+            glRenderbufferStorage(GL_RENDERBUFFER, format_internal, self.lebar, self.tinggi)
+            glFramebufferRenderbuffer(GL_FRAMEBUFFER, attachment, GL_RENDERBUFFER, renderbuffer)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError("Framebuffer headless tidak lengkap")
+        glViewport(0, 0, self.lebar, self.tinggi)
+
+    def selesai(self):
+        """Tunggu semua perintah gambar selesai (glFinish)."""
+        from OpenGL.GL import glFinish
+        glFinish()
+
+    def baca_piksel(self, keluaran=None, balik=True):
+        """
+        Baca isi framebuffer sebagai array RGBA (tinggi, lebar, 4), baris paling atas dulu.
+        Jika `keluaran` diberikan, piksel ditulis ke array itu (tanpa alokasi baru). Dengan
+        balik=False baris tidak dibalik (baris paling bawah dulu, urutan OpenGL) dan piksel
+        dibaca langsung ke `keluaran` tanpa salinan.
+        """
+        from OpenGL.GL import GL_RGBA, GL_UNSIGNED_BYTE, glReadPixels
+
+        if keluaran is None:
+            keluaran = np.empty((self.tinggi, self.lebar, 4), dtype=np.uint8)
+        if not balik:
+            glReadPixels(0, 0, self.lebar, self.tinggi, GL_RGBA, GL_UNSIGNED_BYTE, keluaran)
+            return keluaran
+
+        if self._buffer_baca is None:
+            self._buffer_baca = np.empty((self.tinggi, self.lebar, 4), dtype=np.uint8)
+        glReadPixels(0, 0, self.lebar, self.tinggi, GL_RGBA, GL_UNSIGNED_BYTE, self._buffer_baca)
+        # OpenGL membaca dari baris bawah; balik agar baris 0 adalah bagian atas gambar.
+        np.copyto(keluaran, self._buffer_baca[::-1])
+        return keluaran
+
+    def tutup(self):
+        if self.platform == 'egl':
+            from OpenGL import EGL
+            EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroyContext(self.display, self.konteks)
+        else:
+            from OpenGL import osmesa
+            osmesa.OSMesaDestroyContext(self.konteks)
@@ -0,0 +1,131 @@
+"""
+Penggabungan event masukan Modul_A dan latensi masukan-ke-layar.
+
+Event gerak mouse (geser jendela) dan transformasi berulang (auto-repeat tombol)
+tidak langsung diterapkan: pergeseran dan translasi dijumlahkan, sudut rotasi
+dijumlahkan dan faktor skala dikalikan, lalu semuanya diterapkan sekali di awal
+frame berikutnya. Rotasi dan skala selalu terhadap pusat bentuk sendiri (atau pusat
+bersama seleksi), sehingga urutannya terhadap translasi tidak mengubah hasil. Permintaan gambar ulang juga
+hanya dikirim sekali per frame.
+
+Waktu setiap event dicatat; saat swap buffer selesai, selisihnya dengan waktu swap
+dimasukkan ke `HistogramLatensi`.
+"""
+import time
+
+import numpy as np
+
+
+class HistogramLatensi:
+    """Histogram latensi (ms) dengan kelas logaritmik, ditambah jumlah dan nilai maksimum."""
+
+    def __init__(self, batas_ms=None):
+        # Batas atas setiap kelas; kelas terakhir menampung semua yang lebih besar.
+        self.batas_ms = np.geomspace(0.5, 16384, 31) if batas_ms is None else np.asarray(batas_ms, dtype=np.float64)
+        self.jumlah = np.zeros(len(self.batas_ms) + 1, dtype=np.int64)
+        self.maks = 0.0
+
+    def __len__(self):
+        return int(self.jumlah.sum())
+
+    def catat(self, latensi_ms):
+        latensi_ms = np.atleast_1d(np.asarray(latensi_ms, dtype=np.float64))
+        if not len(latensi_ms):
+            return
+        np.add.at(self.jumlah, np.searchsorted(self.batas_ms, latensi_ms), 1)
+        self.maks = max(self.maks, float(latensi_ms.max()))
+
+    def persentil(self, *persen):
+        """Batas atas kelas yang memuat persentil `persen` (kelas terakhir: nilai maksimum)."""
+        if not len(self):
+            return tuple(0.0 for _ in persen)
+        kumulatif = np.cumsum(self.jumlah)
+        kelas = np.searchsorted(kumulatif, np.asarray(persen) / 100 * kumulatif[-1])
+        batas = np.append(self.batas_ms, self.maks)
+        return tuple(min(float(batas[k]), self.maks) for k in kelas)
+
+    def baris(self, lebar_batang=40):
+        """Teks histogram: satu baris per kelas yang tidak kosong."""
+        total = max(len(self), 1)
+        baris = []
+        for k, jumlah in enumerate(self.jumlah.tolist()):
+            if not jumlah:
+                continue
+            label = f"<= {self.batas_ms[k]:7.1f} ms" if k < len(self.batas_ms) else f" > {self.batas_ms[-1]:7.1f} ms"
+            baris.append(f"{label} {jumlah:>7} {'#' * max(1, round(lebar_batang * jumlah / total))}")
+        p50, p95, p99 = self.persentil(50, 95, 99)
+        baris.append(f"{len(self)} event, p50 {p50:.1f} ms, p95 {p95:.1f} ms, p99 {p99:.1f} ms, maks {self.maks:.1f} ms")
+        return baris
+
+
+class PenggabungMasukan:
+
+    def __init__(self, minta_gambar, jam=time.perf_counter):
+        # minta_gambar: fungsi tanpa argumen yang menjadwalkan frame baru (glutPostRedisplay).
+        self.minta_gambar = minta_gambar
+        self.jam = jam
+        self.histogram = HistogramLatensi()
+        self.gambar_diminta = False
+        self._waktu_tertunda = []  # waktu event yang belum diterapkan
+        self._waktu_diterapkan = []  # waktu event yang sudah diterapkan dan menunggu swap
+        self._kosongkan()
+        self.jumlah_event = self.jumlah_penerapan = 0
+
+    def _kosongkan(self):
+        self.geser_jendela = (0.0, 0.0)
+        self.translasi = (0.0, 0.0)
+        self.rotasi, self.skala = 0.0, 1.0
+
+    def catat_event(self, waktu=None):
+        """Catat satu event masukan dan minta frame baru (sekali sampai frame itu digambar)."""
+        self._waktu_tertunda.append(self.jam() if waktu is None else waktu)
+        self.jumlah_event += 1
+        if not self.gambar_diminta:
+            self.gambar_diminta = True
+            self.minta_gambar()
+
+    def geser(self, dx, dy, waktu=None):
+        """Geser jendela pemotongan sejauh (dx, dy)."""
+        geser_x, geser_y = self.geser_jendela
+        self.geser_jendela = (geser_x + dx, geser_y + dy)
+        self.catat_event(waktu)
+
+    def transformasi(self, tipe_transformasi, nilai, waktu=None):
+        """Transformasi bentuk terpilih seperti `Main.terapkan_transformasi_terpilih`."""
+        if tipe_transformasi == 'translasi':
+            translasi_x, translasi_y = self.translasi
+            self.translasi = (translasi_x + nilai[0], translasi_y + nilai[1])
+        elif tipe_transformasi == 'rotasi':
+            self.rotasi += nilai
+        elif tipe_transformasi == 'skala':
+            self.skala *= nilai
+        else:
+            raise ValueError(f"Transformasi tidak dikenal: {tipe_transformasi}")
+        self.catat_event(waktu)
+
+    def ambil(self):
+        """
+        Perubahan yang tertunda sebagai (geser_jendela, translasi, rotasi, skala), lalu dikosongkan.
+        Event yang tercakup menunggu `swap_selesai` untuk dihitung latensinya.
+        """
+        hasil = (self.geser_jendela, self.translasi, self.rotasi, self.skala)
+        self._kosongkan()
+        if self._waktu_tertunda:
+            self._waktu_diterapkan.extend(self._waktu_tertunda)
+            self._waktu_tertunda = []
+            self.jumlah_penerapan += 1
+        return hasil
+
+    def swap_selesai(self, waktu=None):
+        """
+        Dipanggil setelah swap buffer: latensi event yang sudah diterapkan masuk ke histogram.
+        Mengembalikan (jumlah event di frame ini, latensi terbesar dalam ms).
+        """
+        self.gambar_diminta = False
+        if not self._waktu_diterapkan:
+            return 0, 0.0
+        sekarang = self.jam() if waktu is None else waktu
+        latensi = (sekarang - np.asarray(self._waktu_diterapkan)) * 1000
+        self._waktu_diterapkan = []
+        self.histogram.catat(latensi)
+        return len(latensi), float(latensi.max())
@@ -0,0 +1,429 @@
+"""
+Mesh segitiga untuk Modul_B: simpul, normal dan indeks dalam array NumPy.
+
+Pembaca OBJ dan PLY membaca file per potongan besar (bukan per baris) dan
+mengurai setiap potongan dengan operasi array, sehingga tidak ada objek Python
+per simpul atau per sisi. Sisi poligon dipecah menjadi segitiga kipas dan
+normal halus dihitung sekaligus untuk semua segitiga.
+"""
+import numpy as np
+
+from pemotongan import indeks_gabungan
+
+UKURAN_POTONGAN = 1 << 22  # byte per potongan baca
+
+TIPE_PLY = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+
+class Mesh:
+
+    def __init__(self, simpul, indeks, normal=None):
+        self.simpul = np.ascontiguousarray(simpul, dtype=np.float32).reshape(-1, 3)
+        self.indeks = np.ascontiguousarray(indeks, dtype=np.uint32).reshape(-1, 3)
+        if len(self.indeks) and int(self.indeks.max()) >= len(self.simpul):
+            raise ValueError("Indeks sisi melebihi jumlah simpul")
+        if normal is None:
+            normal = normal_halus(self.simpul, self.indeks)
+        self.normal = np.ascontiguousarray(normal, dtype=np.float32).reshape(-1, 3)
+
+    @property
+    def jumlah_simpul(self):
+        return len(self.simpul)
+
+    @property
+    def jumlah_segitiga(self):
+        return len(self.indeks)
+
+    @classmethod
+    def dari_sisi(cls, titik_sudut, sisi, normal_sisi):
+        """
+        Mesh flat-shaded dari sisi poligon berjumlah simpul sama (mis. quad kubus).
+        Simpul diduplikasi per sisi agar setiap sisi memakai normalnya sendiri.
+        """
+        sisi = np.asarray(sisi, dtype=np.int64)
+        jumlah_sisi, simpul_per_sisi = sisi.shape
+        simpul = np.asarray(titik_sudut, dtype=np.float32)[sisi.ravel()]
+        normal = np.repeat(np.asarray(normal_sisi, dtype=np.float32), simpul_per_sisi, axis=0)
+        indeks = triangulasi_kipas(np.arange(jumlah_sisi) * simpul_per_sisi, np.full(jumlah_sisi, simpul_per_sisi))
+        return cls(simpul, indeks, normal)
+
+    def dinormalkan(self, ukuran=1.0):
+        """Salinan mesh yang dipusatkan di titik asal dengan setengah sisi kotak pembatas terbesar `ukuran`."""
+        if not len(self.simpul):
+            return self
+        minimum, maksimum = self.simpul.min(axis=0), self.simpul.max(axis=0)
+        skala = 2 * ukuran / max(float((maksimum - minimum).max()), 1e-12)
+        return Mesh((self.simpul - (minimum + maksimum) / 2) * skala, self.indeks, self.normal)
+
+
+def triangulasi_kipas(awal, jumlah):
+    """
+    Segitiga kipas (awal, awal + j, awal + j + 1) untuk setiap poligon yang
+    simpulnya berada di posisi awal[i] .. awal[i] + jumlah[i] - 1. Poligon dengan
+    kurang dari 3 simpul diabaikan.
+    """
+    awal = np.asarray(awal, dtype=np.int64)
+    jumlah_segitiga = np.maximum(np.asarray(jumlah, dtype=np.int64) - 2, 0)
+    poros = np.repeat(awal, jumlah_segitiga)
+    j = indeks_gabungan(np.ones(len(awal), dtype=np.int64), jumlah_segitiga)
+    return np.stack((poros, poros + j, poros + j + 1), axis=1)
+
+
+def normal_halus(simpul, indeks):
+    """Normal per simpul: rata-rata normal segitiga di sekitarnya, dibobot luas segitiga."""
+    simpul = np.asarray(simpul, dtype=np.float32)
+    normal = np.zeros((len(simpul), 3), dtype=np.float32)
+    if not len(indeks):
+        return normal
+    a, b, c = simpul[indeks[:, 0]], simpul[indeks[:, 1]], simpul[indeks[:, 2]]
+    normal_sisi = np.cross(b - a, c - a)  # panjangnya dua kali luas segitiga
+
+    pemilik = indeks.ravel()
+    for k in range(3):
+        normal[:, k] = np.bincount(pemilik, weights=np.repeat(normal_sisi[:, k], 3), minlength=len(simpul))
+    panjang = np.linalg.norm(normal, axis=1, keepdims=True)
+    np.divide(normal, panjang, out=normal, where=panjang > 0)
+    return normal
+
+
+def baca_mesh(path, ukuran_potongan=UKURAN_POTONGAN):
+    """Baca mesh dari file .obj atau .ply."""
+    ekstensi = path.lower().rsplit('.', 1)[-1]
+    if ekstensi == 'obj':
+        return baca_obj(path, ukuran_potongan)
+    if ekstensi == 'ply':
+        return baca_ply(path, ukuran_potongan)
+    raise ValueError(f"Format mesh tidak didukung: {path}")
+
+
+# --- Pengurai teks per potongan ---------------------------------------------------
+
+def _potongan_baris(berkas, ukuran_potongan):
+    """Potongan file sebagai array byte (bisa ditulis) yang selalu berakhir di akhir baris."""
+    sisa = b''
+    while True:
+        blok = berkas.read(ukuran_potongan)
+        if not blok:
+            break
+        blok = sisa + blok
+        akhir = blok.rfind(b'\n') + 1
+        if akhir == 0:
+            sisa = blok
+            continue
+        sisa = blok[akhir:]
+        yield np.frombuffer(blok, dtype=np.uint8, count=akhir).copy()
+    if sisa.strip():
+        yield np.frombuffer(sisa + b'\n', dtype=np.uint8).copy()
+
+
+def _baris(data):
+    """Posisi awal dan akhir (posisi '\\n') setiap baris dalam potongan."""
+    akhir = np.flatnonzero(data == 10)
+    awal = np.empty_like(akhir)
+    awal[:1] = 0
+    awal[1:] = akhir[:-1] + 1
+    return awal, akhir
+
+
+def _jumlah_token(data, awal, akhir):
+    """Jumlah token di setiap baris; byte <= 32 (spasi dan karakter kontrol) dianggap pemisah."""
+    spasi = data <= 32
+    mulai_token = ~spasi
+    mulai_token[1:] &= spasi[:-1]
+    posisi_token = np.flatnonzero(mulai_token)
+    return np.searchsorted(posisi_token, akhir) - np.searchsorted(posisi_token, awal)
+
+
+def _nilai_baris(data, awal, akhir, pilih, dtype, jumlah_token, path):
+    """
+    Semua angka di baris-baris `pilih`, berurutan (kata kunci baris harus sudah diganti spasi).
+    Jumlahnya harus sama dengan `jumlah_token` baris-baris itu; token yang bukan angka ditolak.
+    """
+    teks = data[np.repeat(pilih, akhir - awal + 1)].tobytes()
+    try:
+        nilai = np.array(teks.split(), dtype=dtype)
+    except ValueError:
+        raise ValueError(f"{path}: angka tidak valid") from None
+    if len(nilai) != int(jumlah_token.sum()):
+        raise ValueError(f"{path}: angka tidak valid")
+    return nilai
+
+
+# --- OBJ ----------------------------------------------------------------------------
+
+def baca_obj(path, ukuran_potongan=UKURAN_POTONGAN):
+    """
+    Baca baris 'v' dan 'f' dari file OBJ. Sisi poligon dipecah menjadi segitiga,
+    indeks negatif (relatif) didukung, dan indeks tekstur/normal ('f 1/2/3') diabaikan.
+    """
+    daftar_simpul, daftar_indeks = [], []
+    jumlah_simpul = 0
+    with open(path, 'rb') as berkas:
+        for data in _potongan_baris(berkas, ukuran_potongan):
+            awal, akhir = _baris(data)
+            kata_kunci = data[awal]
+            pemisah = (data[np.minimum(awal + 1, akhir)] <= 32) & (awal < akhir)
+            baris_simpul = (kata_kunci == ord('v')) & pemisah
+            baris_sisi = (kata_kunci == ord('f')) & pemisah
+
+            # 'f 1/2/3': buang semua byte dari '/' hingga spasi berikutnya.
+            if (data == ord('/')).any():
+                posisi = np.arange(len(data), dtype=np.int32)
+                garis_miring = np.maximum.accumulate(np.where(data == ord('/'), posisi, -1))
+                spasi = np.maximum.accumulate(np.where(data <= 32, posisi, -1))
+                data[garis_miring > spasi] = ord(' ')
+            data[awal[baris_simpul | baris_sisi]] = ord(' ')
+            token = _jumlah_token(data, awal, akhir)
+
+            if baris_simpul.any():
+                jumlah = token[baris_simpul]
+                nilai = _nilai_baris(data, awal, akhir, baris_simpul, np.float32, jumlah, path)
+                if (jumlah < 3).any():
+                    raise ValueError(f"{path}: baris 'v' dengan kurang dari 3 koordinat")
+                awal_nilai = np.cumsum(jumlah) - jumlah
+                daftar_simpul.append(nilai[awal_nilai[:, None] + np.arange(3)])
+
+            if baris_sisi.any():
+                jumlah = token[baris_sisi]
+                nilai = _nilai_baris(data, awal, akhir, baris_sisi, np.int64, jumlah, path)
+                # Indeks negatif relatif terhadap jumlah simpul yang sudah dibaca sebelum baris sisi itu.
+                simpul_sebelum = jumlah_simpul + np.cumsum(baris_simpul)[baris_sisi]
+                nilai = np.where(nilai < 0, nilai + np.repeat(simpul_sebelum, jumlah), nilai - 1)
+                daftar_indeks.append(nilai[triangulasi_kipas(np.cumsum(jumlah) - jumlah, jumlah)])
+
+            jumlah_simpul += int(baris_simpul.sum())
+
+    simpul = np.concatenate(daftar_simpul) if daftar_simpul else np.zeros((0, 3), dtype=np.float32)
+    indeks = np.concatenate(daftar_indeks) if daftar_indeks else np.zeros((0, 3), dtype=np.int64)
+    if len(indeks) and int(indeks.min()) < 0:
+        raise ValueError(f"{path}: indeks simpul tidak valid")
+    return Mesh(simpul, indeks)
+
+
+# --- PLY ----------------------------------------------------------------------------
+
+def _baca_header_ply(berkas):
+    """(format, [(nama elemen, jumlah, [(nama properti, tipe, tipe item list atau None)])])."""
+    if berkas.readline().strip() != b'ply':
+        raise ValueError("Bukan file PLY")
+    format_ply, elemen = None, []
+    while True:
+        baris = berkas.readline()
+        if not baris:
+            raise ValueError("Header PLY tidak lengkap")
+        kata = baris.decode('ascii').split()
+        if not kata or kata[0] in ('comment', 'obj_info'):
+            continue
+        if kata[0] == 'format':
+            format_ply = kata[1]
+        elif kata[0] == 'element':
+            elemen.append((kata[1], int(kata[2]), []))
+        elif kata[0] == 'property' and kata[1] == 'list':
+            elemen[-1][2].append((kata[4], TIPE_PLY[kata[2]], TIPE_PLY[kata[3]]))
+        elif kata[0] == 'property':
+            elemen[-1][2].append((kata[2], TIPE_PLY[kata[1]], None))
+        elif kata[0] == 'end_header':
+            return format_ply, elemen
+
+
+def _kolom_simpul(properti):
+    """Posisi kolom x, y, z dan (jika ada) nx, ny, nz di antara properti simpul."""
+    nama = [p[0] for p in properti]
+    if any(p[2] is not None for p in properti):
+        raise ValueError("Properti list pada elemen vertex tidak didukung")
+    posisi = [nama.index(k) for k in ('x', 'y', 'z')]
+    normal = [nama.index(k) for k in ('nx', 'ny', 'nz')] if {'nx', 'ny', 'nz'} <= set(nama) else None
+    return posisi, normal
+
+
+def _posisi_list_sisi(properti):
+    """Posisi properti list indeks simpul di antara properti sisi (hanya satu list yang didukung)."""
+    daftar_list = [i for i, p in enumerate(properti) if p[2] is not None]
+    if len(daftar_list) != 1:
+        raise ValueError("Elemen face harus punya tepat satu properti list")
+    return daftar_list[0]
+
+
+def baca_ply(path, ukuran_potongan=UKURAN_POTONGAN):
+    """Baca elemen vertex dan face dari file PLY (ascii, binary_little_endian atau binary_big_endian)."""
+    with open(path, 'rb') as berkas:
+        format_ply, elemen = _baca_header_ply(berkas)
+        if format_ply == 'ascii':
+            hasil = _baca_ply_ascii(berkas, elemen, path, ukuran_potongan)
+        elif format_ply in ('binary_little_endian', 'binary_big_endian'):
+            urutan = '<' if format_ply == 'binary_little_endian' else '>'
+            hasil = _baca_ply_biner(berkas, elemen, urutan, path, ukuran_potongan)
+        else:
+            raise ValueError(f"{path}: format PLY tidak dikenal: {format_ply}")
+
+    simpul, normal, indeks = hasil
+    if len(indeks) and (int(indeks.min()) < 0 or int(indeks.max()) >= len(simpul)):
+        raise ValueError(f"{path}: indeks simpul tidak valid")
+    return Mesh(simpul, indeks, normal)
+
+
+def _baca_ply_ascii(berkas, elemen, path, ukuran_potongan):
+    simpul, normal, daftar_indeks = np.zeros((0, 3), dtype=np.float32), None, []
+    urutan_elemen = iter(elemen)
+    nama, sisa, properti = next(urutan_elemen, (None, 0, []))
+
+    for data in _potongan_baris(berkas, ukuran_potongan):
+        awal, akhir = _baris(data)
+        token = _jumlah_token(data, awal, akhir)
+        posisi = 0
+        while posisi < len(awal) and nama is not None:
+            ambil = min(sisa, len(awal) - posisi)
+            pilih = np.zeros(len(awal), dtype=bool)
+            pilih[posisi:posisi + ambil] = True
+
+            if nama == 'vertex' and ambil:
+                kolom, kolom_normal = _kolom_simpul(properti)
+                nilai = _nilai_baris(data, awal, akhir, pilih, np.float32, token[pilih], path)
+                nilai = nilai.reshape(ambil, len(properti))
+                simpul = np.concatenate((simpul, nilai[:, kolom]))
+                if kolom_normal:
+                    normal = nilai[:, kolom_normal] if normal is None else np.concatenate((normal, nilai[:, kolom_normal]))
+            elif nama == 'face' and ambil:
+                posisi_list = _posisi_list_sisi(properti)
+                jumlah_token = token[pilih]
+                nilai = _nilai_baris(data, awal, akhir, pilih, np.float64, jumlah_token, path)
+                awal_list = np.cumsum(jumlah_token) - jumlah_token + posisi_list
+                jumlah = nilai[awal_list].astype(np.int64)
+                daftar_indeks.append(nilai[triangulasi_kipas(awal_list + 1, jumlah)].astype(np.int64))
+
+            posisi += ambil
+            sisa -= ambil
+            if sisa == 0:
+                nama, sisa, properti = next(urutan_elemen, (None, 0, []))
+
+    if sisa:
+        raise ValueError(f"{path}: elemen '{nama}' terpotong")
+    indeks = np.concatenate(daftar_indeks) if daftar_indeks else np.zeros((0, 3), dtype=np.int64)
+    return simpul, normal, indeks
+
+
+def _baca_rekaman(berkas, jumlah, dtype, path, ukuran_potongan):
+    """Baca `jumlah` rekaman berukuran tetap langsung ke array, per potongan `ukuran_potongan` byte."""
+    hasil = np.empty(jumlah, dtype=dtype)
+    byte = hasil.view(np.uint8).reshape(-1)
+    for mulai in range(0, len(byte), ukuran_potongan):
+        bagian = byte[mulai:mulai + ukuran_potongan]
+        if berkas.readinto(memoryview(bagian)) != len(bagian):
+            raise ValueError(f"{path}: data PLY terpotong")
+    return hasil
+
+
+def _dtype_rekaman(properti, urutan, jumlah_item=None):
+    bidang = []
+    for nama, tipe, tipe_item in properti:
+        if tipe_item is None:
+            bidang.append((nama, urutan + tipe))
+        else:
+            bidang.append((nama + '_jumlah', urutan + tipe))
+            bidang.append((nama, urutan + tipe_item, (jumlah_item,)))
+    return np.dtype(bidang)
+
+
+def _baca_ply_biner(berkas, elemen, urutan, path, ukuran_potongan):
+    simpul, normal, indeks = np.zeros((0, 3), dtype=np.float32), None, np.zeros((0, 3), dtype=np.int64)
+    for nama, jumlah, properti in elemen:
+        if nama == 'face':
+            indeks = _baca_sisi_biner(berkas, jumlah, properti, urutan, path, ukuran_potongan)
+            continue
+        if any(p[2] is not None for p in properti):
+            raise ValueError(f"{path}: properti list pada elemen '{nama}' tidak didukung")
+
+        rekaman = _baca_rekaman(berkas, jumlah, _dtype_rekaman(properti, urutan), path, ukuran_potongan)
+        if nama == 'vertex':
+            kolom, kolom_normal = _kolom_simpul(properti)
+            nama_kolom = rekaman.dtype.names
+            simpul = np.stack([rekaman[nama_kolom[k]] for k in kolom], axis=1)
+            if kolom_normal:
+                normal = np.stack([rekaman[nama_kolom[k]] for k in kolom_normal], axis=1)
+    return simpul, normal, indeks
+
+
+def _baca_sisi_biner(berkas, jumlah, properti, urutan, path, ukuran_potongan):
+    """
+    Sisi biner dibaca sebagai rekaman berukuran tetap dengan jumlah simpul sisi
+    pertama (umumnya semua segitiga atau semua quad). Jika ternyata jumlahnya
+    bervariasi, sisi dibaca ulang lewat `_baca_sisi_bervariasi`.
+    """
+    posisi_list = _posisi_list_sisi(properti)
+    nama_list = properti[posisi_list][0]
+    if not jumlah:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    mulai = berkas.tell()
+    awalan = _dtype_rekaman(properti[:posisi_list + 1], urutan, 0)
+    jumlah_item = int(np.frombuffer(berkas.read(awalan.itemsize), dtype=awalan)[nama_list + '_jumlah'][0])
+    berkas.seek(mulai)
+
+    try:
+        rekaman = _baca_rekaman(berkas, jumlah, _dtype_rekaman(properti, urutan, jumlah_item), path, ukuran_potongan)
+        seragam = (rekaman[nama_list + '_jumlah'] == jumlah_item).all()
+    except ValueError:
+        seragam = False
+    if seragam:
+        item = rekaman[nama_list].astype(np.int64)
+        return item[:, triangulasi_kipas([0], [jumlah_item])].reshape(-1, 3)
+
+    berkas.seek(mulai)
+    return _baca_sisi_bervariasi(berkas, jumlah, properti, posisi_list, urutan, path)
+
+
+def _baca_sisi_bervariasi(berkas, jumlah, properti, posisi_list, urutan, path):
+    """
+    Sisi biner dengan jumlah simpul berbeda-beda, dibaca dari satu buffer. Awal rekaman ke-i
+    bergantung pada semua jumlah sebelumnya, jadi dicari dengan lompatan berlipat: untuk setiap
+    posisi byte dihitung awal rekaman berikutnya jika sebuah rekaman dimulai di sana, lalu
+    lompatan 2^k rekaman digabung menurut bit-bit nomor rekaman.
+    """
+    nama_list, tipe_jumlah, tipe_item = properti[posisi_list]
+    sebelum = _dtype_rekaman(properti[:posisi_list], urutan)
+    sesudah = _dtype_rekaman(properti[posisi_list + 1:], urutan)
+    tipe_jumlah, tipe_item = np.dtype(urutan + tipe_jumlah), np.dtype(urutan + tipe_item)
+    ukuran_tetap = sebelum.itemsize + tipe_jumlah.itemsize + sesudah.itemsize
+
+    mulai = berkas.tell()
+    data = np.frombuffer(berkas.read(), dtype=np.uint8)
+    jumlah_posisi = len(data) - ukuran_tetap + 1  # posisi byte yang masih memuat kepala rekaman
+    if jumlah_posisi <= 0:
+        raise ValueError(f"{path}: data PLY terpotong")
+    jendela = np.lib.stride_tricks.sliding_window_view(data[sebelum.itemsize:], tipe_jumlah.itemsize)
+    jumlah_di = np.ascontiguousarray(jendela[:jumlah_posisi]).view(tipe_jumlah).reshape(-1).astype(np.int64)
+
+    # lompat[p]: awal rekaman sesudah rekaman yang dimulai di p; `jumlah_posisi` menandai lewat batas.
+    tipe_posisi = np.int32 if len(data) < 2 ** 31 - ukuran_tetap else np.int64
+    lompat = np.empty(jumlah_posisi + 1, dtype=tipe_posisi)
+    lompat[:-1] = np.minimum(np.arange(jumlah_posisi) + ukuran_tetap + np.maximum(jumlah_di, 0) * tipe_item.itemsize,
+                             jumlah_posisi)
+    lompat[-1] = jumlah_posisi
+    nomor = np.arange(jumlah)
+    posisi = np.zeros(jumlah, dtype=tipe_posisi)
+    k = 0
+    while (1 << k) < jumlah:
+        bit = ((nomor >> k) & 1).astype(bool)
+        posisi[bit] = lompat[posisi[bit]]
+        k += 1
+        if (1 << k) < jumlah:
+            lompat = lompat[lompat]
+
+    if int(posisi[-1]) >= jumlah_posisi:
+        raise ValueError(f"{path}: data PLY terpotong")
+    daftar_jumlah = jumlah_di[posisi]
+    if (daftar_jumlah < 0).any():
+        raise ValueError(f"{path}: jumlah simpul sisi negatif")
+    akhir = int(posisi[-1]) + ukuran_tetap + int(daftar_jumlah[-1]) * tipe_item.itemsize
+    if akhir > len(data):
+        raise ValueError(f"{path}: data PLY terpotong")
+    berkas.seek(mulai + akhir)
+
+    awal_item = posisi.astype(np.int64) + sebelum.itemsize + tipe_jumlah.itemsize
+    byte_item = data[indeks_gabungan(awal_item, daftar_jumlah * tipe_item.itemsize)]
+    item = byte_item.view(tipe_item).astype(np.int64)
+    return item[triangulasi_kipas(np.cumsum(daftar_jumlah) - daftar_jumlah, daftar_jumlah)]
@@ -0,0 +1,70 @@
+"""
+Uji kena (hit-test) tepat untuk memilih bentuk Modul_A.
+
+Kandidat dari fase kasar (kotak pembatas di `IndeksSpasial`) diuji sekaligus dalam
+operasi array per tipe bentuk, memakai geometri yang sama dengan yang digambar:
+titik sebagai persegi selebar ukuran titiknya, garis dan outline persegi/poligon
+sebagai segmen setebal `ketebalan`, bagian dalam persegi/poligon dengan aturan
+genap-ganjil, dan elips secara analitik dari `pusat`, `radius` dan `sudut`.
+"""
+import numpy as np
+
+from pemotongan import segmen_loop
+from penyimpanan_bentuk import PenyimpananBentuk
+
+# Jarak tambahan (piksel) di luar bentuk yang masih dihitung kena.
+TOLERANSI_KENA = 3.0
+
+
+def jarak_ke_segmen(x, y, segmen):
+    """Jarak titik (x, y) ke setiap segmen (n, 2, 2); segmen dengan panjang nol menjadi titik."""
+    p1, p2 = segmen[:, 0], segmen[:, 1]
+    arah = p2 - p1
+    panjang_kuadrat = np.einsum('ij,ij->i', arah, arah)
+    relatif = np.array((x, y)) - p1
+    t = np.clip(np.einsum('ij,ij->i', relatif, arah) / np.where(panjang_kuadrat > 0, panjang_kuadrat, 1), 0, 1)
+    return np.hypot(*(relatif - t[:, None] * arah).T)
+
+
+def uji_kena(penyimpanan, ids, x, y, toleransi=TOLERANSI_KENA):
+    """Mask boolean: apakah (x, y) mengenai setiap bentuk `ids`."""
+    ids = np.asarray(ids, dtype=np.int64)
+    kena = np.zeros(len(ids), dtype=bool)
+    if not len(ids):
+        return kena
+    tipe = penyimpanan.tipe[ids]
+    setengah_tebal = penyimpanan.ketebalan[ids].astype(np.float64) / 2 + toleransi
+
+    elips = tipe == PenyimpananBentuk.ELIPS
+    if elips.any():
+        # Titik di sistem koordinat elips (digeser ke pusat dan diputar balik sebesar sudut).
+        ids_elips = ids[elips]
+        sudut = np.radians(penyimpanan.sudut[ids_elips])
+        cos_s, sin_s = np.cos(sudut), np.sin(sudut)
+        dx, dy = x - penyimpanan.pusat[ids_elips, 0], y - penyimpanan.pusat[ids_elips, 1]
+        x_lokal, y_lokal = cos_s * dx + sin_s * dy, cos_s * dy - sin_s * dx
+        radius = penyimpanan.radius[ids_elips] + setengah_tebal[elips, None]
+        kena[elips] = (x_lokal / radius[:, 0]) ** 2 + (y_lokal / radius[:, 1]) ** 2 <= 1
+
+    titik = tipe == PenyimpananBentuk.TITIK
+    if titik.any():
+        # Titik digambar sebagai persegi bersisi ketebalan * 2 (glPointSize).
+        posisi, _ = penyimpanan.simpul_dunia(ids[titik])
+        jangkauan = penyimpanan.ketebalan[ids[titik]] + toleransi
+        kena[titik] = np.maximum(np.abs(posisi[:, 0] - x), np.abs(posisi[:, 1] - y)) <= jangkauan
+
+    lain = np.flatnonzero(~elips & ~titik & (penyimpanan.panjang[ids] > 0))
+    if len(lain):
+        # Garis: satu segmen (sisi penutupnya segmen yang sama). Persegi/poligon: semua sisi outline.
+        simpul, offset = penyimpanan.simpul_dunia(ids[lain])
+        segmen = segmen_loop(simpul, offset)
+        awal = offset[:-1]
+        dekat = np.minimum.reduceat(jarak_ke_segmen(x, y, segmen), awal) <= setengah_tebal[lain]
+
+        # Aturan genap-ganjil: hitung sisi yang dipotong sinar mendatar dari (x, y) ke kanan.
+        (x1, y1), (x2, y2) = segmen[:, 0].T, segmen[:, 1].T
+        menyilang = (y1 > y) != (y2 > y)
+        x_potong = x1 + (y - y1) * (x2 - x1) / np.where(menyilang, y2 - y1, 1)
+        di_dalam = np.add.reduceat((menyilang & (x < x_potong)).astype(np.int64), awal) % 2 == 1
+        kena[lain] = dekat | (di_dalam & (tipe[lain] != PenyimpananBentuk.GARIS))
+    return kena
@@ -0,0 +1,259 @@
+"""
+Mesin pemotongan (clipping) berbasis NumPy untuk banyak bentuk sekaligus.
+
+Poligon dikemas dalam satu array simpul berukuran (M, 2) ditambah array `offset`
+berukuran (P + 1,), sehingga simpul poligon ke-i adalah simpul[offset[i]:offset[i + 1]].
+"""
+import numpy as np
+
+
+def kemas_poligon(daftar_poligon):
+    """Gabungkan list poligon (list of (x, y)) menjadi array simpul + offset."""
+    jumlah = np.fromiter((len(p) for p in daftar_poligon), dtype=np.int64, count=len(daftar_poligon))
+    offset = np.zeros(len(daftar_poligon) + 1, dtype=np.int64)
+    np.cumsum(jumlah, out=offset[1:])
+
+    simpul = np.empty((offset[-1], 2), dtype=np.float64)
+    for i, poligon in enumerate(daftar_poligon):
+        if jumlah[i]:
+            simpul[offset[i]:offset[i + 1]] = poligon
+    return simpul, offset
+
+
+def pecah_poligon(simpul, offset):
+    """Kebalikan dari `kemas_poligon`: kembalikan list array (n, 2) per poligon."""
+    return [simpul[offset[i]:offset[i + 1]] for i in range(len(offset) - 1)]
+
+
+def _geser_siklik(nilai, offset):
+    # Nilai milik simpul sebelumnya secara siklik di dalam poligon yang sama
+    # (simpul pertama mengambil nilai simpul terakhir).
+    hasil = np.empty_like(nilai)
+    hasil[1:] = nilai[:-1]
+    awal, akhir = offset[:-1], offset[1:]
+    tidak_kosong = akhir > awal
+    hasil[awal[tidak_kosong]] = nilai[akhir[tidak_kosong] - 1]
+    return hasil
+
+
+def simpul_berikut(simpul, offset):
+    """Simpul berikutnya secara siklik di dalam poligon yang sama (simpul terakhir -> simpul pertama)."""
+    hasil = np.empty_like(simpul)
+    hasil[:-1] = simpul[1:]
+    awal, akhir = offset[:-1], offset[1:]
+    tidak_kosong = akhir > awal
+    hasil[akhir[tidak_kosong] - 1] = simpul[awal[tidak_kosong]]
+    return hasil
+
+
+def segmen_loop(simpul, offset):
+    """Semua sisi (n, 2, 2) poligon terkemas, termasuk sisi penutup (seperti GL_LINE_LOOP)."""
+    return np.stack((simpul, simpul_berikut(simpul, offset)), axis=1)
+
+
+def indeks_gabungan(awal, jumlah):
+    """Indeks [awal[0], ..., awal[0] + jumlah[0] - 1, awal[1], ...] tanpa loop Python."""
+    jumlah = np.asarray(jumlah, dtype=np.int64)
+    total = int(jumlah.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    awal_keluaran = np.cumsum(jumlah) - jumlah
+    return np.repeat(np.asarray(awal, dtype=np.int64) - awal_keluaran, jumlah) + np.arange(total)
+
+
+def batas_poligon(simpul, offset):
+    """Kotak pembatas (min_x, min_y, max_x, max_y) tiap poligon; NaN untuk poligon kosong."""
+    jumlah = np.diff(offset)
+    hasil = np.full((len(jumlah), 4), np.nan)
+    tidak_kosong = jumlah > 0
+    if len(simpul):
+        awal = offset[:-1][tidak_kosong]
+        hasil[tidak_kosong, :2] = np.minimum.reduceat(simpul, awal, axis=0)
+        hasil[tidak_kosong, 2:] = np.maximum.reduceat(simpul, awal, axis=0)
+    return hasil
+
+
+def sutherland_hodgman_batch(simpul, offset, window_clipping):
+    """
+    Versi batch dari `Main.algoritma_sutherland_hodgman`.
+
+    Poligon yang kotak pembatasnya seluruhnya di luar jendela langsung dibuang dan
+    yang seluruhnya di dalam diteruskan apa adanya; sisanya dipotong dengan 4
+    lintasan array (satu per sisi jendela) untuk semua simpul sekaligus. Urutan dan
+    nilai simpul hasil sama dengan versi per-poligon. Mengembalikan
+    (simpul_hasil, offset_hasil) dengan format yang sama.
+    """
+    x_min, y_min, x_max, y_max = window_clipping
+    simpul = np.asarray(simpul, dtype=np.float64).reshape(-1, 2)
+    offset = np.asarray(offset, dtype=np.int64)
+
+    kotak = batas_poligon(simpul, offset)
+    with np.errstate(invalid='ignore'):
+        di_dalam = (kotak[:, 0] >= x_min) & (kotak[:, 2] <= x_max) & (kotak[:, 1] >= y_min) & (kotak[:, 3] <= y_max)
+        di_luar = (kotak[:, 2] < x_min) | (kotak[:, 0] > x_max) | (kotak[:, 3] < y_min) | (kotak[:, 1] > y_max)
+    terpotong = ~(di_dalam | di_luar | np.isnan(kotak[:, 0]))
+
+    jumlah = np.diff(offset)
+    awal = offset[:-1]
+    simpul_potong, offset_potong = _sutherland_hodgman_lintasan(
+        simpul[indeks_gabungan(awal[terpotong], jumlah[terpotong])],
+        np.concatenate(([0], np.cumsum(jumlah[terpotong]))), window_clipping)
+
+    # Susun kembali sesuai urutan poligon masukan.
+    sumber = np.zeros(len(jumlah), dtype=np.int64)
+    jumlah_hasil = np.zeros(len(jumlah), dtype=np.int64)
+    sumber[di_dalam], jumlah_hasil[di_dalam] = awal[di_dalam], jumlah[di_dalam]
+    sumber[terpotong], jumlah_hasil[terpotong] = len(simpul) + offset_potong[:-1], np.diff(offset_potong)
+
+    offset_hasil = np.concatenate(([0], np.cumsum(jumlah_hasil)))
+    return np.concatenate((simpul, simpul_potong))[indeks_gabungan(sumber, jumlah_hasil)], offset_hasil
+
+
+def _sutherland_hodgman_lintasan(simpul, offset, window_clipping):
+    x_min, y_min, x_max, y_max = window_clipping
+
+    # (indeks koordinat, nilai batas, True jika sisi dalam adalah >= batas)
+    daftar_batas = ((0, x_min, True), (0, x_max, False), (1, y_min, True), (1, y_max, False))
+
+    for sumbu, batas, lebih_besar in daftar_batas:
+        if len(simpul) == 0:
+            break
+
+        koordinat = simpul[:, sumbu]
+        akhir_diDalam = koordinat >= batas if lebih_besar else koordinat <= batas
+        awal_diDalam = _geser_siklik(akhir_diDalam, offset)
+
+        # Perpotongan hanya ada jika status dalam/luar kedua ujung sisi berbeda.
+        memotong = awal_diDalam != akhir_diDalam
+        indeks_memotong = np.flatnonzero(memotong)
+        poligon = np.searchsorted(offset, indeks_memotong, side='right') - 1
+        indeks_awal = np.where(indeks_memotong == offset[poligon], offset[poligon + 1] - 1, indeks_memotong - 1)
+        titik_awal = simpul[indeks_awal]
+        perpotongan = _cari_perpotongan_batch(titik_awal, simpul[indeks_memotong], sumbu, batas)
+
+        # Tiap simpul menghasilkan 0, 1 (perpotongan atau simpul) atau 2 (perpotongan + simpul) titik.
+        jumlah_keluaran = memotong.astype(np.int64) + akhir_diDalam
+        posisi = np.zeros(len(simpul) + 1, dtype=np.int64)
+        np.cumsum(jumlah_keluaran, out=posisi[1:])
+
+        simpul_baru = np.empty((posisi[-1], 2), dtype=np.float64)
+        simpul_baru[posisi[:-1][memotong]] = perpotongan
+        simpul_baru[(posisi[:-1] + memotong)[akhir_diDalam]] = simpul[akhir_diDalam]
+
+        simpul, offset = simpul_baru, posisi[offset]
+
+    return simpul, offset
+
+
+def _cari_perpotongan_batch(p1, p2, sumbu, batas):
+    """Padanan `Main._cari_perpotonganBatas` untuk banyak pasangan titik sekaligus."""
+    lain = 1 - sumbu
+    selisih_sumbu = p2[:, sumbu] - p1[:, sumbu]
+    selisih_lain = p2[:, lain] - p1[:, lain]
+
+    hasil = np.empty_like(p1)
+    hasil[:, sumbu] = batas
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hasil[:, lain] = np.where(selisih_sumbu != 0,
+                                  p1[:, lain] + selisih_lain * (batas - p1[:, sumbu]) / selisih_sumbu,
+                                  p1[:, lain])
+    return hasil
+
+
+# Kode region Cohen-Sutherland, sama dengan Main.DI_DALAM / KIRI / KANAN / BAWAH / ATAS.
+DI_DALAM, KIRI, KANAN, BAWAH, ATAS = 0, 1, 2, 4, 8
+
+
+def hitung_outCode_batch(x, y, window_clipping):
+    """Padanan `Main.hitung_outCode` untuk array koordinat."""
+    x_min, y_min, x_max, y_max = window_clipping
+    kode = np.where(x < x_min, KIRI, np.where(x > x_max, KANAN, DI_DALAM))
+    kode |= np.where(y < y_min, BAWAH, np.where(y > y_max, ATAS, DI_DALAM))
+    return kode
+
+
+def cohen_sutherland_batch(segmen, window_clipping):
+    """
+    Versi batch dari `Main.algoritma_cohen_sutherland` untuk segmen berukuran (N, 2, 2).
+
+    Setiap iterasi memajukan semua segmen yang belum selesai satu langkah, sama seperti
+    satu putaran `while` pada versi per garis, sehingga hasilnya identik.
+    Mengembalikan (segmen_hasil, diterima).
+    """
+    x_min, y_min, x_max, y_max = window_clipping
+    hasil = np.array(segmen, dtype=np.float64).reshape(-1, 2, 2)
+    diterima = np.zeros(len(hasil), dtype=bool)
+
+    kode = np.stack((hitung_outCode_batch(hasil[:, 0, 0], hasil[:, 0, 1], window_clipping),
+                     hitung_outCode_batch(hasil[:, 1, 0], hasil[:, 1, 1], window_clipping)), axis=1)
+    aktif = np.arange(len(hasil))
+
+    while len(aktif):
+        kode1, kode2 = kode[aktif, 0], kode[aktif, 1]
+        diterima[aktif[(kode1 | kode2) == 0]] = True
+
+        lanjut = ((kode1 | kode2) != 0) & ((kode1 & kode2) == 0)
+        aktif, kode1, kode2 = aktif[lanjut], kode1[lanjut], kode2[lanjut]
+        if not len(aktif):
+            break
+
+        # Titik luar yang dipindahkan: titik pertama jika di luar, selain itu titik kedua.
+        ujung = np.where(kode1 != 0, 0, 1)
+        kode_pilihan = np.where(ujung == 0, kode1, kode2)
+        x1, y1 = hasil[aktif, 0, 0], hasil[aktif, 0, 1]
+        x2, y2 = hasil[aktif, 1, 0], hasil[aktif, 1, 1]
+
+        atas = (kode_pilihan & ATAS) != 0
+        bawah = ~atas & ((kode_pilihan & BAWAH) != 0)
+        kanan = ~atas & ~bawah & ((kode_pilihan & KANAN) != 0)
+        batas_y = np.where(atas, y_max, y_min)
+        batas_x = np.where(kanan, x_max, x_min)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vertikal = atas | bawah
+            x = np.where(vertikal, x1 + (x2 - x1) * (batas_y - y1) / (y2 - y1), batas_x)
+            y = np.where(vertikal, batas_y, y1 + (y2 - y1) * (batas_x - x1) / (x2 - x1))
+
+        hasil[aktif, ujung, 0] = x
+        hasil[aktif, ujung, 1] = y
+        kode[aktif, ujung] = hitung_outCode_batch(x, y, window_clipping)
+
+    return hasil, diterima
+
+
+def liang_barsky_batch(segmen, window_clipping):
+    """
+    Pemotongan garis Liang-Barsky untuk segmen berukuran (N, 2, 2) tanpa percabangan per
+    garis: tiap segmen diparameterkan P(t) = P1 + t (P2 - P1) lalu dipersempit ke
+    rentang t di dalam keempat sisi jendela. Mengembalikan (segmen_hasil, diterima).
+    """
+    x_min, y_min, x_max, y_max = window_clipping
+    segmen = np.asarray(segmen, dtype=np.float64).reshape(-1, 2, 2)
+    p1 = segmen[:, 0]
+    delta = segmen[:, 1] - p1
+
+    # p_k * t <= q_k untuk sisi kiri, kanan, bawah, atas.
+    p = np.stack((-delta[:, 0], delta[:, 0], -delta[:, 1], delta[:, 1]), axis=1)
+    q = np.stack((p1[:, 0] - x_min, x_max - p1[:, 0], p1[:, 1] - y_min, y_max - p1[:, 1]), axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = q / p
+    t_masuk = np.max(np.where(p < 0, r, 0.0), axis=1, initial=0.0)
+    t_keluar = np.min(np.where(p > 0, r, 1.0), axis=1, initial=1.0)
+
+    diterima = (t_masuk <= t_keluar) & ~np.any((p == 0) & (q < 0), axis=1)
+    hasil = np.stack((p1 + t_masuk[:, None] * delta, p1 + t_keluar[:, None] * delta), axis=1)
+    return hasil, diterima
+
+
+METODE_POTONG_GARIS = {
+    'cohen_sutherland': cohen_sutherland_batch,
+    'liang_barsky': liang_barsky_batch,
+}
+
+
+def potong_garis_batch(segmen, window_clipping, metode='cohen_sutherland'):
+    """Potong segmen (N, 2, 2) dengan metode 'cohen_sutherland' atau 'liang_barsky'."""
+    if metode not in METODE_POTONG_GARIS:
+        raise ValueError(f"Metode pemotongan garis tidak dikenal: {metode}")
+    return METODE_POTONG_GARIS[metode](segmen, window_clipping)
@@ -0,0 +1,180 @@
+"""
+Pemotongan batch di beberapa proses untuk scene yang sangat besar.
+
+Simpul masukan ditulis sekali ke `multiprocessing.shared_memory`, lalu setiap
+proses pekerja memotong satu potongan poligon/segmen (Sutherland-Hodgman atau
+Cohen-Sutherland dari `pemotongan.py`) langsung dari memori bersama dan menulis
+hasilnya ke blok keluaran bersama; yang dikirim lewat pipe hanya nama blok dan
+rentang indeks. Hasil semua potongan digabung ke satu buffer sesuai urutan
+masukan. Di bawah `ambang_simpul` simpul, pemotongan tetap di proses utama
+karena biaya membagi pekerjaan lebih besar dari hasilnya.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pemotongan import potong_garis_batch, sutherland_hodgman_batch
+
+AMBANG_SIMPUL = 200000
+
+# Simpul tambahan maksimum per poligon: memotong poligon konveks dengan satu sisi jendela
+# menambah paling banyak satu simpul. Hasil yang lebih besar dikirim balik lewat pipe.
+TAMBAHAN_PER_POLIGON = 4
+
+# Blok memori bersama yang sedang dipakai oleh proses pekerja ini (nama -> SharedMemory).
+_blok_pekerja = {}
+
+
+def _lampirkan(*daftar_nama):
+    """Buffer blok-blok memori bersama ini; blok lain yang sudah diganti proses utama dilepas."""
+    for nama in list(_blok_pekerja):
+        if nama not in daftar_nama:
+            _blok_pekerja.pop(nama).close()
+    for nama in daftar_nama:
+        if nama not in _blok_pekerja:
+            _blok_pekerja[nama] = shared_memory.SharedMemory(name=nama)
+    return [_blok_pekerja[nama].buf for nama in daftar_nama]
+
+
+def _tata_letak_poligon(jumlah_simpul, jumlah_poligon):
+    """(kapasitas simpul keluaran, posisi byte offset masukan, posisi byte panjang keluaran)."""
+    kapasitas = jumlah_simpul + TAMBAHAN_PER_POLIGON * jumlah_poligon
+    return kapasitas, jumlah_simpul * 16, kapasitas * 16
+
+
+def _kerja_poligon(nama_masukan, nama_keluaran, jumlah_simpul, jumlah_poligon, awal, akhir, window_clipping):
+    masukan, keluaran = _lampirkan(nama_masukan, nama_keluaran)
+    kapasitas, posisi_offset, posisi_panjang = _tata_letak_poligon(jumlah_simpul, jumlah_poligon)
+    offset = np.ndarray(jumlah_poligon + 1, dtype=np.int64, buffer=masukan, offset=posisi_offset)[awal:akhir + 1]
+    simpul = np.ndarray((jumlah_simpul, 2), dtype=np.float64, buffer=masukan)[offset[0]:offset[-1]]
+
+    simpul_hasil, offset_hasil = sutherland_hodgman_batch(simpul, offset - offset[0], window_clipping)
+    np.ndarray(jumlah_poligon, dtype=np.int64, buffer=keluaran, offset=posisi_panjang)[awal:akhir] = np.diff(offset_hasil)
+
+    # Wilayah keluaran potongan ini: sebanyak simpul masukannya + tambahan maksimum per poligon.
+    awal_keluaran = int(offset[0]) + TAMBAHAN_PER_POLIGON * awal
+    batas = int(offset[-1]) + TAMBAHAN_PER_POLIGON * akhir
+    if awal_keluaran + len(simpul_hasil) > batas:
+        return simpul_hasil
+    np.ndarray((kapasitas, 2), dtype=np.float64, buffer=keluaran)[awal_keluaran:awal_keluaran + len(simpul_hasil)] = simpul_hasil
+    return len(simpul_hasil)
+
+
+def _kerja_garis(nama_masukan, nama_keluaran, jumlah, awal, akhir, window_clipping, metode):
+    masukan, keluaran = _lampirkan(nama_masukan, nama_keluaran)
+    segmen = np.ndarray((jumlah, 2, 2), dtype=np.float64, buffer=masukan)[awal:akhir]
+    hasil, diterima = potong_garis_batch(segmen, window_clipping, metode)
+    np.ndarray((jumlah, 2, 2), dtype=np.float64, buffer=keluaran)[awal:akhir] = hasil
+    np.ndarray(jumlah, dtype=np.bool_, buffer=keluaran, offset=jumlah * 32)[awal:akhir] = diterima
+
+
+class PemotongParalel:
+
+    def __init__(self, jumlah_pekerja=None, ambang_simpul=AMBANG_SIMPUL, potongan_per_pekerja=2):
+        self.jumlah_pekerja = jumlah_pekerja or os.cpu_count() or 1
+        self.ambang_simpul = ambang_simpul
+        # Beberapa potongan per pekerja agar pekerja yang selesai lebih dulu bisa mengambil sisanya.
+        self.potongan_per_pekerja = potongan_per_pekerja
+        self._pool = None  # dibuat saat pertama kali dibutuhkan
+        self._blok = {}  # 'masukan'/'keluaran' -> SharedMemory, dipakai ulang selama cukup besar
+        self.jumlah_paralel = self.jumlah_langsung = 0
+
+    def _paralel(self, jumlah_simpul):
+        return self.jumlah_pekerja > 1 and jumlah_simpul >= self.ambang_simpul
+
+    def _siapkan_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.jumlah_pekerja)
+        return self._pool
+
+    def _blok_bersama(self, peran, ukuran):
+        blok = self._blok.get(peran)
+        if blok is None or blok.size < ukuran:
+            if blok is not None:
+                blok.close()
+                blok.unlink()
+            blok = self._blok[peran] = shared_memory.SharedMemory(create=True, size=max(ukuran, 1 << 20))
+        return blok
+
+    def _bagi(self, bobot_kumulatif):
+        """Batas potongan (indeks) sehingga tiap potongan punya bobot (jumlah simpul) yang kira-kira sama."""
+        jumlah_item = len(bobot_kumulatif) - 1
+        jumlah_potongan = min(jumlah_item, self.jumlah_pekerja * self.potongan_per_pekerja)
+        target = np.linspace(0, bobot_kumulatif[-1], jumlah_potongan + 1)
+        batas = np.searchsorted(bobot_kumulatif, target[1:-1])
+        return np.unique(np.concatenate(([0], batas, [jumlah_item]))).tolist()
+
+    def potong_poligon(self, simpul, offset, window_clipping):
+        """Seperti `sutherland_hodgman_batch`, dibagi ke proses pekerja jika cukup besar."""
+        simpul = np.asarray(simpul, dtype=np.float64).reshape(-1, 2)
+        offset = np.asarray(offset, dtype=np.int64)
+        if not self._paralel(len(simpul)):
+            self.jumlah_langsung += 1
+            return sutherland_hodgman_batch(simpul, offset, window_clipping)
+        self.jumlah_paralel += 1
+
+        jumlah_simpul, jumlah_poligon = len(simpul), len(offset) - 1
+        kapasitas, posisi_offset, posisi_panjang = _tata_letak_poligon(jumlah_simpul, jumlah_poligon)
+        masukan = self._blok_bersama('masukan', posisi_offset + offset.nbytes)
+        keluaran = self._blok_bersama('keluaran', posisi_panjang + jumlah_poligon * 8)
+        np.ndarray(simpul.shape, dtype=np.float64, buffer=masukan.buf)[:] = simpul
+        np.ndarray(offset.shape, dtype=np.int64, buffer=masukan.buf, offset=posisi_offset)[:] = offset
+
+        batas = self._bagi(offset)
+        pool = self._siapkan_pool()
+        daftar_tugas = [pool.submit(_kerja_poligon, masukan.name, keluaran.name, jumlah_simpul, jumlah_poligon,
+                                    awal, akhir, tuple(window_clipping))
+                        for awal, akhir in zip(batas[:-1], batas[1:])]
+
+        panjang = np.ndarray(jumlah_poligon, dtype=np.int64, buffer=keluaran.buf, offset=posisi_panjang)
+        offset_hasil = np.zeros(jumlah_poligon + 1, dtype=np.int64)
+        hasil_potongan = [tugas.result() for tugas in daftar_tugas]
+        np.cumsum(panjang, out=offset_hasil[1:])
+
+        # Gabungkan wilayah keluaran setiap potongan (sesuai urutan) ke satu buffer.
+        simpul_keluaran = np.ndarray((kapasitas, 2), dtype=np.float64, buffer=keluaran.buf)
+        simpul_hasil = np.empty((offset_hasil[-1], 2), dtype=np.float64)
+        for awal, akhir, hasil in zip(batas[:-1], batas[1:], hasil_potongan):
+            tujuan = simpul_hasil[offset_hasil[awal]:offset_hasil[akhir]]
+            if isinstance(hasil, np.ndarray):
+                tujuan[:] = hasil
+            else:
+                awal_keluaran = offset[awal] + TAMBAHAN_PER_POLIGON * awal
+                tujuan[:] = simpul_keluaran[awal_keluaran:awal_keluaran + hasil]
+        del panjang, simpul_keluaran  # view ke memori bersama harus dilepas sebelum blok ditutup
+        return simpul_hasil, offset_hasil
+
+    def potong_garis(self, segmen, window_clipping, metode='cohen_sutherland'):
+        """Seperti `potong_garis_batch`, dibagi ke proses pekerja jika cukup besar."""
+        segmen = np.asarray(segmen, dtype=np.float64).reshape(-1, 2, 2)
+        if not self._paralel(2 * len(segmen)):
+            self.jumlah_langsung += 1
+            return potong_garis_batch(segmen, window_clipping, metode)
+        self.jumlah_paralel += 1
+
+        jumlah = len(segmen)
+        masukan = self._blok_bersama('masukan', segmen.nbytes)
+        keluaran = self._blok_bersama('keluaran', jumlah * 33)
+        np.ndarray(segmen.shape, dtype=np.float64, buffer=masukan.buf)[:] = segmen
+
+        batas = self._bagi(np.arange(jumlah + 1))
+        pool = self._siapkan_pool()
+        for tugas in [pool.submit(_kerja_garis, masukan.name, keluaran.name, jumlah, awal, akhir,
+                                  tuple(window_clipping), metode)
+                      for awal, akhir in zip(batas[:-1], batas[1:])]:
+            tugas.result()
+
+        hasil = np.ndarray((jumlah, 2, 2), dtype=np.float64, buffer=keluaran.buf).copy()
+        diterima = np.ndarray(jumlah, dtype=np.bool_, buffer=keluaran.buf, offset=jumlah * 32).copy()
+        return hasil, diterima
+
+    def tutup(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for blok in self._blok.values():
+            blok.close()
+            blok.unlink()
+        self._blok.clear()
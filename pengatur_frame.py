@@ -0,0 +1,87 @@
+"""
+Pengatur frame untuk loop render berbasis event (Modul_B).
+
+Saat tidak ada animasi, loop menunggu event tanpa menggambar (CPU idle). Saat
+animasi berjalan, simulasi dimajukan dengan langkah waktu tetap dan frame
+digambar mengikuti target FPS: sisa waktu hingga tenggat frame berikutnya
+dipakai tidur, dan tenggat yang terlewat dicatat sebagai frame terlewat.
+"""
+import time
+
+
+class PengaturFrame:
+
+    def __init__(self, fps=60, langkah_tetap=1 / 120, maks_langkah=8, jam=time.perf_counter, tidur=time.sleep):
+        self.periode = 1.0 / fps
+        self.langkah_tetap = langkah_tetap
+        # Batas langkah simulasi per frame agar frame yang sangat lambat tidak memicu spiral kejar-kejaran.
+        self.maks_langkah = maks_langkah
+        self.jam, self.tidur = jam, tidur
+
+        self.tenggat = None  # Waktu tenggat frame berikutnya; None jika animasi berhenti.
+        self.waktu_simulasi = None
+        self.akumulator = 0.0
+        self.jumlah_frame = self.frame_terlewat = 0
+        self.waktu_idle = 0.0
+        self.waktu_mulai = jam()
+
+    def mulai_ulang(self):
+        """Mulai animasi dari sekarang (waktu selama idle tidak ikut disimulasikan)."""
+        sekarang = self.jam()
+        self.tenggat = sekarang + self.periode
+        self.waktu_simulasi = sekarang
+        self.akumulator = 0.0
+
+    def berhenti(self):
+        self.tenggat = self.waktu_simulasi = None
+
+    def langkah_simulasi(self):
+        """Jumlah langkah simulasi tetap (`langkah_tetap` detik) yang harus dijalankan sebelum frame ini."""
+        if self.waktu_simulasi is None:
+            self.mulai_ulang()
+        sekarang = self.jam()
+        self.akumulator += sekarang - self.waktu_simulasi
+        self.waktu_simulasi = sekarang
+
+        langkah = int(self.akumulator / self.langkah_tetap)
+        self.akumulator -= langkah * self.langkah_tetap
+        if langkah > self.maks_langkah:
+            langkah, self.akumulator = self.maks_langkah, 0.0
+        return langkah
+
+    def frame_selesai(self):
+        self.jumlah_frame += 1
+
+    def tunggu_frame(self):
+        """Tidur hingga tenggat frame berikutnya; tenggat yang sudah lewat dihitung sebagai frame terlewat."""
+        if self.tenggat is None:
+            self.mulai_ulang()
+        sekarang = self.jam()
+        if sekarang < self.tenggat:
+            self.tunggu(self.tenggat - sekarang)
+            self.tenggat += self.periode
+            return 0
+
+        # Terlambat: lewati tenggat yang sudah lewat dan sejajarkan ke jadwal berikutnya.
+        terlewat = int((sekarang - self.tenggat) / self.periode) + 1
+        self.frame_terlewat += terlewat
+        self.tenggat += terlewat * self.periode
+        return terlewat
+
+    def tunggu(self, detik):
+        """Tidur `detik` detik dan catat sebagai waktu idle."""
+        mulai = self.jam()
+        self.tidur(detik)
+        self.waktu_idle += self.jam() - mulai
+
+    def tunggu_event(self, tunggu_event):
+        """Panggil `tunggu_event()` (misalnya pygame.event.wait) yang memblokir; lamanya dicatat sebagai idle."""
+        mulai = self.jam()
+        hasil = tunggu_event()
+        self.waktu_idle += self.jam() - mulai
+        return hasil
+
+    def statistik(self):
+        lama = max(self.jam() - self.waktu_mulai, 1e-9)
+        return {'frame': self.jumlah_frame, 'frame_terlewat': self.frame_terlewat,
+                'waktu_idle': self.waktu_idle, 'rasio_idle': self.waktu_idle / lama}
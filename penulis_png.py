@@ -0,0 +1,131 @@
+"""
+Penulis PNG untuk render batch tanpa display.
+
+Encoder PNG memakai zlib dan struct saja (tanpa Pillow): setiap baris difilter
+dengan filter 'Up' dalam satu operasi array lalu dikompres zlib. `PenulisPNG`
+menjalankan encoding di thread pekerja sehingga baca piksel frame berikutnya
+berjalan bersamaan dengan kompresi frame sebelumnya; buffer piksel diambil dari
+kumpulan buffer tetap dan dikembalikan setelah ditulis.
+"""
+import queue
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+SIGNATURE_PNG = b'\x89PNG\r\n\x1a\n'
+TIPE_WARNA = {1: 0, 3: 2, 4: 6}  # jumlah kanal -> tipe warna PNG (abu-abu, RGB, RGBA)
+
+
+def _chunk(tipe, data):
+    return struct.pack('>I', len(data)) + tipe + data + struct.pack('>I', zlib.crc32(tipe + data))
+
+
+def encode_png(piksel, level=6, buffer=None):
+    """
+    Bytes PNG dari array uint8 (tinggi, lebar, kanal), baris paling atas dulu. `piksel` boleh
+    berupa view (mis. `buffer[::-1, :, :3]`). `buffer` (tinggi, 1 + lebar * kanal) uint8 dipakai
+    ulang untuk baris terfilter jika diberikan.
+    """
+    piksel = np.asarray(piksel)
+    if piksel.ndim == 2:
+        piksel = piksel[:, :, None]
+    tinggi, lebar, kanal = piksel.shape
+    if buffer is None or buffer.shape != (tinggi, 1 + lebar * kanal):
+        buffer = np.empty((tinggi, 1 + lebar * kanal), dtype=np.uint8)
+
+    # Filter 'Up' (2): selisih dengan baris di atasnya (modulo 256); baris pertama sama dengan aslinya.
+    buffer[:, 0] = 2
+    data = buffer[:, 1:].reshape(tinggi, lebar, kanal)
+    data[0] = piksel[0]
+    np.subtract(piksel[1:], piksel[:-1], out=data[1:])
+
+    header = struct.pack('>IIBBBBB', lebar, tinggi, 8, TIPE_WARNA[kanal], 0, 0, 0)
+    return (SIGNATURE_PNG + _chunk(b'IHDR', header) + _chunk(b'IDAT', zlib.compress(buffer, level))
+            + _chunk(b'IEND', b''))
+
+
+def tulis_png(path, piksel, level=6, buffer=None):
+    with open(path, 'wb') as berkas:
+        berkas.write(encode_png(piksel, level, buffer))
+
+
+class PenulisPNG:
+    """
+    Antrean penulisan PNG di `jumlah_pekerja` thread. Pola pemakaian per frame:
+    `buffer = ambil_buffer()`, isi buffer (mis. `konteks.baca_piksel(buffer, balik=False)`),
+    lalu `kirim(buffer, path)`. `ambil_buffer` memblokir jika semua buffer masih antre
+    (encoder lebih lambat dari render); lamanya dicatat di `waktu_tunggu`. Dengan
+    jumlah_pekerja=0 setiap frame ditulis langsung di dalam `kirim`.
+    """
+
+    def __init__(self, bentuk, jumlah_buffer=4, jumlah_pekerja=2, level=6, balik=True, alpha=False):
+        # balik=True: buffer berisi baris paling bawah dulu (urutan glReadPixels).
+        self.level, self.balik, self.alpha = level, balik, alpha
+        self.bebas, self.tugas = queue.Queue(), queue.Queue()
+        for _ in range(jumlah_buffer):
+            self.bebas.put(np.empty(bentuk, dtype=np.uint8))
+
+        self.jumlah_ditulis = 0
+        self.waktu_encode = self.waktu_tunggu = 0.0
+        self.galat = None
+        self._buffer_filter = None
+        self._kunci = threading.Lock()
+        self.pekerja = [threading.Thread(target=self._kerja, daemon=True) for _ in range(jumlah_pekerja)]
+        for pekerja in self.pekerja:
+            pekerja.start()
+
+    def ambil_buffer(self):
+        mulai = time.perf_counter()
+        buffer = self.bebas.get()
+        self.waktu_tunggu += time.perf_counter() - mulai
+        if self.galat is not None:
+            raise self.galat
+        return buffer
+
+    def kirim(self, buffer, path):
+        if not self.pekerja:
+            # Tanpa pekerja: tulis langsung di thread pemanggil (untuk perbandingan tanpa pipeline).
+            self._buffer_filter = self._tulis(buffer, path, self._buffer_filter)
+            if self.galat is not None:
+                raise self.galat
+            return
+        self.tugas.put((buffer, path))
+
+    def _kerja(self):
+        buffer_filter = None  # milik thread ini, dipakai ulang antarframe
+        while True:
+            tugas = self.tugas.get()
+            if tugas is None:
+                return
+            buffer_filter = self._tulis(*tugas, buffer_filter)
+
+    def _tulis(self, buffer, path, buffer_filter):
+        mulai = time.perf_counter()
+        try:
+            piksel = buffer[::-1] if self.balik else buffer
+            if not self.alpha and piksel.ndim == 3 and piksel.shape[2] == 4:
+                piksel = piksel[:, :, :3]
+            tinggi, lebar, kanal = piksel.shape
+            if buffer_filter is None or buffer_filter.shape != (tinggi, 1 + lebar * kanal):
+                buffer_filter = np.empty((tinggi, 1 + lebar * kanal), dtype=np.uint8)
+            tulis_png(path, piksel, self.level, buffer_filter)
+        except Exception as galat:
+            self.galat = galat
+        finally:
+            with self._kunci:
+                self.jumlah_ditulis += 1
+                self.waktu_encode += time.perf_counter() - mulai
+            self.bebas.put(buffer)
+        return buffer_filter
+
+    def tutup(self):
+        """Tunggu semua frame yang antre selesai ditulis, lalu hentikan pekerja."""
+        for _ in self.pekerja:
+            self.tugas.put(None)
+        for pekerja in self.pekerja:
+            pekerja.join()
+        if self.galat is not None:
+            raise self.galat
@@ -0,0 +1,440 @@
+"""
+Penyimpanan scene dalam bentuk structure-of-arrays.
+
+Semua simpul semua bentuk berada dalam satu array float kontigu, dan atribut per
+bentuk (offset, jumlah simpul, tipe, indeks warna, ketebalan, parameter elips)
+disimpan sebagai kolom. Objek `Titik`, `Garis`, `Persegi` dan `Elips` di Modul_A
+hanyalah "view" ringan (id + referensi ke penyimpanan) ke dalam kolom-kolom ini.
+
+Transformasi tidak mengubah simpul: setiap bentuk menyimpan matriks affine
+gabungan (`matriks`, atau pusat/sudut/radius untuk elips) yang cukup dikalikan
+saat ada transformasi baru. Simpul koordinat layar dan kotak pembatas dihitung
+dari simpul asli dan matriks tersebut, di-cache, dan hanya dihitung ulang jika
+`versi` bentuk berubah (lihat `tandai_berubah`).
+
+`simpan_biner`/`muat_biner` menyimpan kolom-kolom ini apa adanya ke satu file biner;
+saat dimuat, kolom menjadi view ke memory map file tersebut sehingga hanya bagian
+yang disentuh yang dibaca dari disk.
+"""
+import json
+import math
+import os
+
+import numpy as np
+
+from pemotongan import indeks_gabungan
+
+MATRIKS_IDENTITAS = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+
+# Berkas biner: MAGIC, panjang header (uint64 little-endian), header JSON, lalu kolom-kolom
+# mentah yang masing-masing dimulai pada kelipatan PERATAAN_BERKAS byte.
+MAGIC_BERKAS = b'BENTUK\x00\x01'
+PERATAAN_BERKAS = 64
+
+
+class PenyimpananBentuk:
+    TIPE = ('titik', 'garis', 'persegi', 'elips', 'poligon')
+    KODE_TIPE = {nama: kode for kode, nama in enumerate(TIPE)}
+    TITIK, GARIS, PERSEGI, ELIPS, POLIGON = range(len(TIPE))
+
+    def __init__(self, palet=(), kapasitas_bentuk=64, kapasitas_simpul=512):
+        self.jumlah_bentuk = 0
+        self.simpul_terpakai = 0  # Panjang bagian `simpul` yang sudah dialokasikan.
+        self.simpul_terbuang = 0  # Simpul lama yang ditinggalkan saat bentuk berganti jumlah simpul.
+
+        self.simpul = np.zeros((kapasitas_simpul, 2), dtype=np.float64)
+        # Cache simpul koordinat layar, dengan offset yang sama seperti `simpul`.
+        self.dunia = np.zeros((kapasitas_simpul, 2), dtype=np.float64)
+
+        # Kolom per bentuk.
+        self.offset = np.zeros(kapasitas_bentuk, dtype=np.int64)
+        self.panjang = np.zeros(kapasitas_bentuk, dtype=np.int32)
+        self.tipe = np.zeros(kapasitas_bentuk, dtype=np.int8)
+        self.indeks_warna = np.zeros(kapasitas_bentuk, dtype=np.int16)
+        self.ketebalan = np.zeros(kapasitas_bentuk, dtype=np.float32)
+
+        # Kolom khusus elips (diabaikan untuk tipe lain).
+        self.pusat = np.zeros((kapasitas_bentuk, 2), dtype=np.float64)
+        self.radius = np.zeros((kapasitas_bentuk, 2), dtype=np.float64)
+        self.sudut = np.zeros(kapasitas_bentuk, dtype=np.float64)
+
+        # Matriks affine 2x3 gabungan semua transformasi (bentuk selain elips):
+        # simpul layar = matriks @ (x, y, 1). `pusat_lokal` = rata-rata simpul sebelum ditransformasi.
+        self.matriks = np.zeros((kapasitas_bentuk, 2, 3), dtype=np.float64)
+        self.pusat_lokal = np.zeros((kapasitas_bentuk, 2), dtype=np.float64)
+
+        # Versi geometri tiap bentuk dan versi saat cache terakhir dihitung (-1 = belum ada).
+        self.versi = np.zeros(kapasitas_bentuk, dtype=np.int64)
+        self.versi_cache = np.full(kapasitas_bentuk, -1, dtype=np.int64)
+        self.kotak_cache = np.zeros((kapasitas_bentuk, 4), dtype=np.float64)
+        self.cache_hit = self.cache_miss = 0
+
+        self.palet, self._indeks_palet = [], {}
+        for warna in palet:
+            self.indeks_palet(warna)
+
+    # ------------------------------------------------------------------ kapasitas
+
+    def _kolom(self):
+        return ('offset', 'panjang', 'tipe', 'indeks_warna', 'ketebalan', 'pusat', 'radius', 'sudut',
+                'matriks', 'pusat_lokal', 'versi', 'versi_cache', 'kotak_cache')
+
+    def _kolom_data(self):
+        # Kolom yang berisi data scene (bukan cache), dipakai untuk menghitung memori.
+        return self._kolom()[:10]
+
+    def _pastikan_kapasitas_bentuk(self, jumlah):
+        kapasitas = len(self.offset)
+        if jumlah <= kapasitas:
+            return
+        kapasitas_baru = max(jumlah, kapasitas * 2)
+        for nama in self._kolom():
+            lama = getattr(self, nama)
+            baru = np.zeros((kapasitas_baru,) + lama.shape[1:], dtype=lama.dtype)
+            baru[:self.jumlah_bentuk] = lama[:self.jumlah_bentuk]
+            setattr(self, nama, baru)
+
+    def _alokasi_simpul(self, jumlah):
+        """Sediakan `jumlah` simpul di akhir array simpul, kembalikan offset-nya."""
+        if self.simpul_terpakai + jumlah > len(self.simpul):
+            if self.simpul_terbuang > self.simpul_terpakai // 2:
+                self.padatkan()
+            if self.simpul_terpakai + jumlah > len(self.simpul):
+                kapasitas_baru = max(self.simpul_terpakai + jumlah, len(self.simpul) * 2)
+                for nama in ('simpul', 'dunia'):
+                    baru = np.zeros((kapasitas_baru, 2), dtype=np.float64)
+                    baru[:self.simpul_terpakai] = getattr(self, nama)[:self.simpul_terpakai]
+                    setattr(self, nama, baru)
+
+        offset = self.simpul_terpakai
+        self.simpul_terpakai += jumlah
+        return offset
+
+    def padatkan(self):
+        """Buang simpul yang tidak lagi dipakai sehingga array simpul kembali rapat."""
+        ids = np.arange(self.jumlah_bentuk)
+        indeks = indeks_gabungan(self.offset[ids], self.panjang[ids])
+        self.offset[ids] = np.cumsum(self.panjang[ids]) - self.panjang[ids]
+        self.simpul_terpakai, self.simpul_terbuang = len(indeks), 0
+        self.simpul[:len(indeks)] = self.simpul[indeks]
+        self.dunia[:len(indeks)] = self.dunia[indeks]
+
+    def kosongkan(self):
+        self.jumlah_bentuk = self.simpul_terpakai = self.simpul_terbuang = 0
+
+    # ------------------------------------------------------------------ per bentuk
+
+    def indeks_palet(self, warna):
+        warna = tuple(warna)
+        if warna not in self._indeks_palet:
+            self._indeks_palet[warna] = len(self.palet)
+            self.palet.append(warna)
+        return self._indeks_palet[warna]
+
+    def tambah(self, tipe_bentuk, warna, ketebalan, simpul=()):
+        """Tambahkan bentuk baru dan kembalikan id-nya (indeks baris di setiap kolom)."""
+        id_bentuk = self.jumlah_bentuk
+        self._pastikan_kapasitas_bentuk(id_bentuk + 1)
+        self.jumlah_bentuk += 1
+
+        self.tipe[id_bentuk] = self.KODE_TIPE[tipe_bentuk]
+        self.indeks_warna[id_bentuk] = self.indeks_palet(warna)
+        self.ketebalan[id_bentuk] = ketebalan
+        self.pusat[id_bentuk] = self.radius[id_bentuk] = 0
+        self.sudut[id_bentuk] = 0
+        self.matriks[id_bentuk], self.pusat_lokal[id_bentuk] = MATRIKS_IDENTITAS, 0
+        self.versi[id_bentuk], self.versi_cache[id_bentuk] = 0, -1
+        self.offset[id_bentuk], self.panjang[id_bentuk] = self.simpul_terpakai, 0
+        self.atur_simpul(id_bentuk, simpul)
+        return id_bentuk
+
+    def simpul_bentuk(self, id_bentuk):
+        """View (n, 2) ke simpul sebuah bentuk. Jangan disimpan lama: bisa berpindah saat array tumbuh."""
+        offset = self.offset[id_bentuk]
+        return self.simpul[offset:offset + self.panjang[id_bentuk]]
+
+    def atur_simpul(self, id_bentuk, simpul):
+        """Ganti simpul bentuk dengan simpul koordinat layar; transformasi yang terkumpul di-reset."""
+        simpul = np.asarray(simpul, dtype=np.float64).reshape(-1, 2)
+        if len(simpul) != self.panjang[id_bentuk]:
+            # Jumlah simpul berubah: pindahkan bentuk ke akhir array, tempat lama menjadi sampah.
+            self.simpul_terbuang += self.panjang[id_bentuk]
+            self.panjang[id_bentuk] = 0
+            self.offset[id_bentuk] = self._alokasi_simpul(len(simpul))
+            self.panjang[id_bentuk] = len(simpul)
+        self.simpul_bentuk(id_bentuk)[:] = simpul
+        self.matriks[id_bentuk] = MATRIKS_IDENTITAS
+        self.pusat_lokal[id_bentuk] = simpul.mean(axis=0) if len(simpul) else 0
+        self.versi[id_bentuk] += 1
+
+    def atur_simpul_banyak(self, ids, simpul, panjang):
+        """
+        Seperti `atur_simpul` untuk banyak bentuk (id unik) sekaligus: `simpul` terkemas berurutan
+        dengan `panjang[i]` simpul untuk bentuk `ids[i]`. Bentuk yang jumlah simpulnya berubah
+        dipindahkan bersama ke satu blok baru di akhir array.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        panjang = np.asarray(panjang, dtype=np.int64)
+        simpul = np.asarray(simpul, dtype=np.float64).reshape(-1, 2)
+        pindah = ids[panjang != self.panjang[ids]]
+        if len(pindah):
+            panjang_pindah = panjang[panjang != self.panjang[ids]]
+            self.simpul_terbuang += int(self.panjang[pindah].sum())
+            self.panjang[pindah] = 0
+            self.offset[pindah] = self._alokasi_simpul(int(panjang_pindah.sum())) + np.cumsum(panjang_pindah) - panjang_pindah
+            self.panjang[pindah] = panjang_pindah
+        self.simpul[indeks_gabungan(self.offset[ids], panjang)] = simpul
+        self.matriks[ids] = MATRIKS_IDENTITAS
+
+        ada = panjang > 0
+        awal = np.cumsum(panjang) - panjang
+        self.pusat_lokal[ids] = 0
+        if ada.any():
+            self.pusat_lokal[ids[ada]] = np.add.reduceat(simpul, awal[ada]) / panjang[ada, None]
+        self.versi[ids] += 1
+
+    def tandai_berubah(self, ids):
+        """Naikkan versi geometri sehingga cache bentuk-bentuk ini dihitung ulang saat dibutuhkan."""
+        self.versi[ids] += 1
+
+    def gabung_matriks(self, id_bentuk, matriks):
+        """
+        Kalikan matriks affine 3x3 ke transformasi bentuk (bukan elips) dalam O(1);
+        simpul baru dihitung saat dibutuhkan, dan selalu dari simpul asli sehingga tidak ada galat menumpuk.
+        """
+        matriks = np.asarray(matriks, dtype=np.float64)
+        gabungan = matriks[:2, :2] @ self.matriks[id_bentuk]
+        gabungan[:, 2] += matriks[:2, 2]
+        self.matriks[id_bentuk] = gabungan
+        self.versi[id_bentuk] += 1
+
+    # ------------------------------------------------------------------ cache
+
+    def _segarkan_cache(self, ids):
+        """Hitung ulang cache untuk bentuk di `ids` yang versinya sudah berubah; catat hit/miss."""
+        basi = ids[self.versi_cache[ids] != self.versi[ids]]
+        self.cache_miss += len(basi)
+        self.cache_hit += len(ids) - len(basi)
+        if not len(basi):
+            return
+
+        basi = np.unique(basi)
+        # Bentuk tanpa simpul tidak punya apa pun untuk dihitung, tetapi tetap dicap agar tidak basi terus.
+        self.versi_cache[basi] = self.versi[basi]
+        basi = basi[self.panjang[basi] > 0]
+        lokal, offset = self.kemas(basi)
+        dunia = self._ke_dunia(basi, lokal, offset)
+        self.dunia[indeks_gabungan(self.offset[basi], self.panjang[basi])] = dunia
+        self.kotak_cache[basi, :2] = np.minimum.reduceat(dunia, offset[:-1], axis=0)
+        self.kotak_cache[basi, 2:] = np.maximum.reduceat(dunia, offset[:-1], axis=0)
+
+    def _segarkan_cache_bentuk(self, id_bentuk):
+        """Versi `_segarkan_cache` untuk satu bentuk, tanpa overhead pengemasan."""
+        if self.versi_cache[id_bentuk] == self.versi[id_bentuk]:
+            self.cache_hit += 1
+            return
+
+        self.cache_miss += 1
+        offset, panjang = self.offset[id_bentuk], self.panjang[id_bentuk]
+        if not panjang:
+            self.versi_cache[id_bentuk] = self.versi[id_bentuk]
+            return
+        lokal, dunia = self.simpul[offset:offset + panjang], self.dunia[offset:offset + panjang]
+        if self.tipe[id_bentuk] == self.ELIPS:
+            # Simpul elips adalah lingkaran satuan: skala dengan radius, putar, lalu geser ke pusat.
+            sudut_rad = math.radians(self.sudut[id_bentuk])
+            cos_s, sin_s = math.cos(sudut_rad), math.sin(sudut_rad)
+            pusat_x, pusat_y = self.pusat[id_bentuk]
+            x_lokal, y_lokal = lokal[:, 0] * self.radius[id_bentuk, 0], lokal[:, 1] * self.radius[id_bentuk, 1]
+            dunia[:, 0] = x_lokal * cos_s - y_lokal * sin_s + pusat_x
+            dunia[:, 1] = x_lokal * sin_s + y_lokal * cos_s + pusat_y
+        else:
+            (a, b, c), (d, e, f) = self.matriks[id_bentuk].tolist()
+            dunia[:, 0] = a * lokal[:, 0] + b * lokal[:, 1] + c
+            dunia[:, 1] = d * lokal[:, 0] + e * lokal[:, 1] + f
+        self.kotak_cache[id_bentuk, :2] = dunia.min(axis=0)
+        self.kotak_cache[id_bentuk, 2:] = dunia.max(axis=0)
+        self.versi_cache[id_bentuk] = self.versi[id_bentuk]
+
+    def simpul_dunia_bentuk(self, id_bentuk):
+        """Simpul koordinat layar satu bentuk dari cache (view; jangan diubah)."""
+        self._segarkan_cache_bentuk(id_bentuk)
+        offset = self.offset[id_bentuk]
+        return self.dunia[offset:offset + self.panjang[id_bentuk]]
+
+    def batas_bentuk(self, id_bentuk):
+        self._segarkan_cache_bentuk(id_bentuk)
+        return self.kotak_cache[id_bentuk]
+
+    def pusat_bentuk(self, id_bentuk):
+        """Titik pusat dari `pusat_lokal` dan matriks (atau `pusat` elips), tanpa menghitung simpul."""
+        if self.tipe[id_bentuk] == self.ELIPS:
+            return self.pusat[id_bentuk]
+        matriks = self.matriks[id_bentuk]
+        return matriks[:, :2] @ self.pusat_lokal[id_bentuk] + matriks[:, 2]
+
+    def statistik_cache(self):
+        total = self.cache_hit + self.cache_miss
+        return {'hit': self.cache_hit, 'miss': self.cache_miss,
+                'rasio_hit': self.cache_hit / total if total else 0.0}
+
+    # ------------------------------------------------------------------ batch
+
+    def kemas(self, ids):
+        """Simpul (lokal) bentuk-bentuk `ids` dalam format terkemas (simpul, offset)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        panjang = self.panjang[ids]
+        offset = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(panjang, out=offset[1:])
+        return self.simpul[indeks_gabungan(self.offset[ids], panjang)], offset
+
+    def matriks_dunia(self, ids):
+        """
+        Matriks affine (k, 2, 3) dari simpul tersimpan ke koordinat layar. Untuk elips
+        berupa rotasi `sudut` + geser ke `pusat`; radiusnya diterapkan terpisah (lihat `_ke_dunia`).
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        matriks = self.matriks[ids]
+        elips = self.tipe[ids] == self.ELIPS
+        if elips.any():
+            sudut_rad = np.radians(self.sudut[ids[elips]])
+            cos_s, sin_s = np.cos(sudut_rad), np.sin(sudut_rad)
+            pusat = self.pusat[ids[elips]]
+            matriks[elips] = np.stack((np.column_stack((cos_s, -sin_s, pusat[:, 0])),
+                                       np.column_stack((sin_s, cos_s, pusat[:, 1]))), axis=1)
+        return matriks
+
+    def _ke_dunia(self, ids, simpul, offset):
+        """Ubah simpul lokal terkemas milik `ids` ke koordinat layar."""
+        panjang = np.diff(offset)
+        elips = self.tipe[ids] == self.ELIPS
+        if elips.any():
+            # Simpul elips adalah lingkaran satuan; bentuk lain memakai skala 1 sehingga tidak berubah.
+            simpul = simpul * np.repeat(np.where(elips[:, None], self.radius[ids], 1.0), panjang, axis=0)
+        a, b, c, d, e, f = np.repeat(self.matriks_dunia(ids).reshape(-1, 6), panjang, axis=0).T
+        x_lokal, y_lokal = simpul[:, 0], simpul[:, 1]
+        return np.column_stack((a * x_lokal + b * y_lokal + c, d * x_lokal + e * y_lokal + f))
+
+    def simpul_dunia(self, ids):
+        """
+        Seperti `kemas`, tetapi dalam koordinat layar: simpul setiap bentuk dikalikan
+        matriksnya (elips: diskalakan radius, diputar `sudut` dan digeser ke `pusat`).
+        Diambil dari cache; hanya bentuk yang berubah yang dihitung ulang.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        self._segarkan_cache(ids)
+        panjang = self.panjang[ids]
+        offset = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(panjang, out=offset[1:])
+        return self.dunia[indeks_gabungan(self.offset[ids], panjang)], offset
+
+    def titik_pusat(self, ids):
+        """Rata-rata simpul tiap bentuk (untuk elips: `pusat`), berukuran (k, 2)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        matriks = self.matriks_dunia(ids)
+        pusat = np.einsum('nij,nj->ni', matriks[:, :, :2], self.pusat_lokal[ids]) + matriks[:, :, 2]
+        elips = self.tipe[ids] == self.ELIPS
+        pusat[elips] = self.pusat[ids[elips]]
+        return pusat
+
+    def batas(self, ids):
+        """Kotak pembatas (min_x, min_y, max_x, max_y) tiap bentuk dalam koordinat layar."""
+        ids = np.asarray(ids, dtype=np.int64)
+        self._segarkan_cache(ids)
+        return self.kotak_cache[ids]
+
+    def transformasi(self, ids, matriks):
+        """
+        Gabungkan matriks affine 3x3 ke transformasi bentuk-bentuk `ids` dalam satu operasi
+        array (seperti `gabung_matriks`). Untuk elips hanya pusat dan sudutnya yang berubah.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        matriks = np.asarray(matriks, dtype=np.float64)
+        elips = self.tipe[ids] == self.ELIPS
+
+        lain = ids[~elips]
+        self.matriks[lain] = np.einsum('ij,njk->nik', matriks[:2, :2], self.matriks[lain])
+        self.matriks[lain, :, 2] += matriks[:2, 2]
+
+        if elips.any():
+            self.pusat[ids[elips]] = self.pusat[ids[elips]] @ matriks[:2, :2].T + matriks[:2, 2]
+            if matriks[0, 0] == matriks[1, 1] and matriks[0, 1] == -matriks[1, 0]:
+                self.sudut[ids[elips]] += math.degrees(math.atan2(matriks[1, 0], matriks[0, 0]))
+        self.tandai_berubah(ids)
+
+    # ------------------------------------------------------------------ berkas
+
+    def _kolom_berkas(self):
+        # Kolom data yang disimpan ke berkas (versi dan cache dibuat ulang saat dimuat).
+        return self._kolom_data()[1:]
+
+    def simpan_biner(self, path, ids, meta=None):
+        """
+        Simpan bentuk-bentuk `ids` (sesuai urutan) ke berkas biner kolom per kolom: simpul
+        dikemas rapat, lalu offset, panjang, tipe, indeks warna, ketebalan, parameter elips dan
+        matriks. `meta` (dict JSON) ikut disimpan di header. Ditulis ke berkas sementara lalu
+        diganti, sehingga aman meskipun penyimpanan ini sedang memetakan `path`.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        simpul, offset = self.kemas(ids)
+        kolom = {'simpul': simpul, 'offset': offset[:-1]}
+        kolom.update((nama, getattr(self, nama)[ids]) for nama in self._kolom_berkas())
+
+        posisi, tata_letak = 0, {}
+        for nama, data in kolom.items():
+            tata_letak[nama] = {'dtype': data.dtype.str, 'bentuk': data.shape, 'posisi': posisi}
+            posisi += -(-data.nbytes // PERATAAN_BERKAS) * PERATAAN_BERKAS
+        header = json.dumps({'versi': 1, 'jumlah_bentuk': len(ids), 'jumlah_simpul': len(simpul),
+                             'palet': self.palet, 'kolom': tata_letak, 'meta': meta or {}}).encode()
+        awal_data = -(-(len(MAGIC_BERKAS) + 8 + len(header)) // PERATAAN_BERKAS) * PERATAAN_BERKAS
+
+        sementara = f"{path}.tmp"
+        with open(sementara, 'wb') as berkas:
+            berkas.write(MAGIC_BERKAS + len(header).to_bytes(8, 'little') + header)
+            for nama, data in kolom.items():
+                berkas.seek(awal_data + tata_letak[nama]['posisi'])
+                berkas.write(np.ascontiguousarray(data).data)
+            berkas.truncate(awal_data + posisi)
+        os.replace(sementara, path)
+
+    def muat_biner(self, path):
+        """
+        Ganti isi penyimpanan dengan berkas dari `simpan_biner` (id baru 0..n-1 sesuai urutan
+        berkas) dan kembalikan `meta`-nya. Kolom menjadi view ke memory map copy-on-write:
+        tidak ada yang dibaca sampai disentuh, dan perubahan tidak ditulis balik ke berkas.
+        """
+        with open(path, 'rb') as berkas:
+            if berkas.read(len(MAGIC_BERKAS)) != MAGIC_BERKAS:
+                raise ValueError(f"Bukan berkas scene biner: {path}")
+            panjang_header = int.from_bytes(berkas.read(8), 'little')
+            header = json.loads(berkas.read(panjang_header))
+        awal_data = -(-(len(MAGIC_BERKAS) + 8 + panjang_header) // PERATAAN_BERKAS) * PERATAAN_BERKAS
+
+        peta = np.memmap(path, dtype=np.uint8, mode='c') if os.path.getsize(path) > awal_data else None
+        for nama, info in header['kolom'].items():
+            bentuk, dtype = tuple(info['bentuk']), np.dtype(info['dtype'])
+            if peta is None or not np.prod(bentuk):
+                kolom = np.zeros(bentuk, dtype=dtype)
+            else:
+                kolom = np.ndarray(bentuk, dtype=dtype, buffer=peta, offset=awal_data + info['posisi'])
+            setattr(self, nama, kolom)
+
+        jumlah_bentuk, jumlah_simpul = header['jumlah_bentuk'], header['jumlah_simpul']
+        self.jumlah_bentuk, self.simpul_terpakai, self.simpul_terbuang = jumlah_bentuk, jumlah_simpul, 0
+        # np.zeros untuk array besar tidak menyentuh memori sampai ditulis.
+        self.dunia = np.zeros((jumlah_simpul, 2), dtype=np.float64)
+        self.versi = np.zeros(jumlah_bentuk, dtype=np.int64)
+        self.versi_cache = np.full(jumlah_bentuk, -1, dtype=np.int64)
+        self.kotak_cache = np.zeros((jumlah_bentuk, 4), dtype=np.float64)
+        self.palet, self._indeks_palet = [], {}
+        for warna in header['palet']:
+            self.indeks_palet(warna)
+        return header['meta']
+
+    def byte_per_bentuk(self):
+        """Memori kolom data + simpul yang benar-benar terpakai (tanpa cache), dibagi jumlah bentuk."""
+        if not self.jumlah_bentuk:
+            return 0.0
+        byte_kolom = sum(getattr(self, nama)[:1].nbytes for nama in self._kolom_data()) * self.jumlah_bentuk
+        byte_simpul = self.simpul[:1].nbytes * (self.simpul_terpakai - self.simpul_terbuang)
+        return (byte_kolom + byte_simpul) / self.jumlah_bentuk
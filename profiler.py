@@ -0,0 +1,155 @@
+"""
+Profiler frame untuk Modul_A dan Modul_B.
+
+Setiap frame dibagi menjadi fase bernama (`with profiler.fase('bentuk'): ...`).
+Waktu fase bersarang tidak dihitung dua kali: fase induk hanya mendapat waktu
+miliknya sendiri. Di akhir frame (`akhir_frame`) waktu setiap fase dan nilai
+penghitung dimasukkan ke jendela bergulir untuk persentil p50/p95/p99, lalu
+dikirim ke sink CSV/JSON jika ada.
+
+Saat tidak aktif, `fase()` mengembalikan satu context manager kosong yang sama
+dan `tambah()` langsung kembali, sehingga instrumentasi bisa dibiarkan di kode.
+"""
+import atexit
+import contextlib
+import csv
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+_FASE_KOSONG = contextlib.nullcontext()
+
+
+class _Fase:
+    __slots__ = ('profiler', 'nama', 'mulai', 'anak')
+
+    def __init__(self, profiler, nama):
+        self.profiler, self.nama = profiler, nama
+
+    def __enter__(self):
+        self.anak = 0.0
+        self.profiler._tumpukan.append(self)
+        self.mulai = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        lama = time.perf_counter() - self.mulai
+        profiler = self.profiler
+        profiler._tumpukan.pop()
+        if profiler._tumpukan:
+            profiler._tumpukan[-1].anak += lama
+        profiler._frame[self.nama] = profiler._frame.get(self.nama, 0.0) + lama - self.anak
+        return False
+
+
+class SinkCSV:
+    """Tulis satu baris per (frame, jenis, nama, nilai); jenis = 'fase' (ms) atau 'penghitung'."""
+
+    def __init__(self, path):
+        self.berkas = open(path, 'w', newline='')
+        self.penulis = csv.writer(self.berkas)
+        self.penulis.writerow(('frame', 'jenis', 'nama', 'nilai'))
+
+    def tulis(self, nomor_frame, fase, penghitung):
+        self.penulis.writerows((nomor_frame, 'fase', nama, f"{nilai:.4f}") for nama, nilai in fase.items())
+        self.penulis.writerows((nomor_frame, 'penghitung', nama, nilai) for nama, nilai in penghitung.items())
+
+    def tutup(self):
+        self.berkas.close()
+
+
+class SinkJSON:
+    """JSON lines: satu objek {"frame", "fase", "penghitung"} per frame."""
+
+    def __init__(self, path):
+        self.berkas = open(path, 'w')
+
+    def tulis(self, nomor_frame, fase, penghitung):
+        self.berkas.write(json.dumps({'frame': nomor_frame, 'fase': fase, 'penghitung': penghitung}) + '\n')
+
+    def tutup(self):
+        self.berkas.close()
+
+
+def buat_sink(path):
+    """Sink menurut ekstensi file: .csv untuk CSV, selain itu JSON lines."""
+    return SinkCSV(path) if path.lower().endswith('.csv') else SinkJSON(path)
+
+
+class Profiler:
+
+    def __init__(self, aktif=False, jendela=240, sink=None):
+        self.aktif = aktif
+        self.jendela = jendela  # Jumlah frame terakhir yang dipakai untuk persentil.
+        self.sink = sink
+        self.overlay = False  # Hanya penanda; modul yang menggambar overlay-nya sendiri.
+        self.nomor_frame = 0
+
+        self.riwayat = {}  # nama fase/penghitung -> deque nilai per frame
+        self.fungsi_penghitung = {}  # nama -> fungsi tanpa argumen, dibaca setiap akhir frame
+        self._frame, self._penghitung, self._tumpukan = {}, {}, []
+        if sink is not None:
+            atexit.register(self.tutup)
+
+    def fase(self, nama):
+        """Context manager yang mengukur waktu fase `nama` pada frame ini."""
+        if not self.aktif:
+            return _FASE_KOSONG
+        return _Fase(self, nama)
+
+    def tambah(self, nama, nilai=1):
+        """Tambahkan `nilai` ke penghitung `nama` untuk frame ini."""
+        if self.aktif:
+            self._penghitung[nama] = self._penghitung.get(nama, 0) + nilai
+
+    def daftarkan_penghitung(self, nama, fungsi):
+        """Daftarkan penghitung yang nilainya dibaca dari `fungsi()` setiap akhir frame."""
+        self.fungsi_penghitung[nama] = fungsi
+
+    def akhir_frame(self):
+        """Tutup frame: simpan waktu fase (ms) dan penghitung, kirim ke sink, lalu mulai frame baru."""
+        if not self.aktif:
+            return
+
+        fase = {nama: lama * 1000 for nama, lama in self._frame.items()}
+        fase['total'] = sum(fase.values())
+        penghitung = dict(self._penghitung)
+        for nama, fungsi in self.fungsi_penghitung.items():
+            penghitung[nama] = fungsi()
+
+        for nama, nilai in (*fase.items(), *penghitung.items()):
+            riwayat = self.riwayat.get(nama)
+            if riwayat is None:
+                riwayat = self.riwayat[nama] = deque(maxlen=self.jendela)
+            riwayat.append(nilai)
+        if self.sink is not None:
+            self.sink.tulis(self.nomor_frame, fase, penghitung)
+
+        self.nomor_frame += 1
+        self._frame, self._penghitung = {}, {}
+
+    def persentil(self, nama):
+        """(p50, p95, p99) nilai `nama` di jendela bergulir."""
+        riwayat = self.riwayat.get(nama)
+        if not riwayat:
+            return 0.0, 0.0, 0.0
+        p50, p95, p99 = np.percentile(np.fromiter(riwayat, dtype=np.float64), (50, 95, 99))
+        return p50, p95, p99
+
+    def ringkasan(self):
+        return {nama: dict(zip(('p50', 'p95', 'p99'), self.persentil(nama))) for nama in self.riwayat}
+
+    def baris_overlay(self):
+        """Teks ringkas untuk overlay: satu baris per fase/penghitung."""
+        baris = [f"{'fase':<14}{'p50':>9}{'p95':>9}{'p99':>9}"]
+        for nama in self.riwayat:
+            p50, p95, p99 = self.persentil(nama)
+            baris.append(f"{nama:<14}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}")
+        return baris
+
+    def tutup(self):
+        if self.sink is not None:
+            self.sink.tutup()
+            self.sink = None
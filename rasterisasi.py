@@ -0,0 +1,384 @@
+"""
+Rasterisasi scene Modul_A di CPU dengan NumPy, tanpa konteks OpenGL.
+
+Setiap primitif diubah menjadi poligon konveks: titik menjadi persegi selebar
+ukuran titik, setiap segmen garis (termasuk sisi outline poligon) menjadi jajaran
+genjang selebar ketebalannya (digeser vertikal untuk garis yang condong mendatar
+dan mendatar untuk garis yang condong tegak, seperti garis tebal OpenGL), dan isi
+transparan poligon terpotong tetap poligonnya sendiri. Semua poligon diubah ke
+rentang scanline dalam operasi array: perpotongan setiap sisi dengan pusat baris
+piksel dihitung sekaligus, lalu batas kiri/kanan tiap (poligon, baris) diambil
+dengan `np.minimum.at`/`np.maximum.at`. Piksel sampel di pusatnya seperti OpenGL.
+
+Urutan gambar diselesaikan per piksel: warna piksel adalah warna primitif opak
+terakhir yang menutupinya, ditimpa isi transparan yang digambar sesudahnya
+(semua isi memakai warna dan alpha yang sama, seperti di `gambar_terpotong`,
+sehingga k lapisan isi cukup dihitung dengan (1 - alpha)^k). Framebuffer dibagi
+menjadi pita baris (tile) yang diselesaikan paralel di thread pekerja.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pemotongan import indeks_gabungan, segmen_loop, simpul_berikut
+from penyimpanan_bentuk import PenyimpananBentuk
+
+ALPHA_ISI = 0.3  # isi poligon terpotong (glColor4f(..., 0.3) di `gambar_terpotong`)
+WARNA_SELEKSI, ALPHA_SELEKSI = (0.3, 0.5, 0.8), 0.5
+WARNA_JENDELA, ALPHA_JENDELA = (0.8, 0.2, 0.2), 0.7
+POLA_JENDELA = 0xAAAA  # glLineStipple(1, 0xAAAA) di `draw_window_clipping`
+
+
+def ukuran_raster(ukuran):
+    """Ukuran titik/ketebalan garis non-antialias dalam piksel: dibulatkan, minimal 1."""
+    return np.maximum(1.0, np.round(ukuran))
+
+
+def poligon_titik(titik, ukuran):
+    """Persegi (n, 4, 2) berpusat di setiap titik dengan sisi `ukuran` piksel (seperti GL_POINTS)."""
+    titik = np.asarray(titik, dtype=np.float64).reshape(-1, 2)
+    setengah = np.broadcast_to(ukuran_raster(ukuran) / 2, len(titik))[:, None]
+    x, y = titik[:, :1], titik[:, 1:]
+    return np.stack((np.hstack((x - setengah, y - setengah)), np.hstack((x + setengah, y - setengah)),
+                     np.hstack((x + setengah, y + setengah)), np.hstack((x - setengah, y + setengah))), axis=1)
+
+
+def poligon_garis(segmen, ketebalan):
+    """
+    Jajaran genjang (n, 4, 2) untuk setiap segmen (n, 2, 2) selebar `ketebalan`: seperti garis
+    tebal OpenGL, garis yang lebih mendatar dilebarkan vertikal dan sebaliknya.
+    """
+    segmen = np.asarray(segmen, dtype=np.float64).reshape(-1, 2, 2)
+    p1, p2 = segmen[:, 0], segmen[:, 1]
+    setengah = np.broadcast_to(ukuran_raster(ketebalan) / 2, len(segmen))
+    mendatar = np.abs(p2[:, 0] - p1[:, 0]) >= np.abs(p2[:, 1] - p1[:, 1])
+    geser = np.zeros_like(p1)
+    geser[mendatar, 1] = setengah[mendatar]
+    geser[~mendatar, 0] = setengah[~mendatar]
+    return np.stack((p1 - geser, p2 - geser, p2 + geser, p1 + geser), axis=1)
+
+
+def rentang_poligon(simpul, offset, baris_atas, baris_bawah):
+    """
+    Rentang scanline poligon konveks terkemas: (indeks poligon, baris, x kiri, x kanan) untuk
+    setiap baris piksel yang pusatnya (baris + 0.5) berada di dalam poligon, dengan x sebagai
+    posisi tepi (float, belum dibulatkan ke kolom). Hanya baris di [baris_atas, baris_bawah).
+    """
+    jumlah_poligon = len(offset) - 1
+    kosong = np.zeros(0, dtype=np.int64)
+    if not len(simpul):
+        return kosong, kosong, np.zeros(0), np.zeros(0)
+
+    a, b = simpul, simpul_berikut(simpul, offset)
+    y_atas, y_bawah = np.minimum(a[:, 1], b[:, 1]), np.maximum(a[:, 1], b[:, 1])
+    # Baris j dengan y_atas < j + 0.5 <= y_bawah: aturan setengah terbuka OpenGL berlaku di koordinat
+    # jendela GL yang sumbu y-nya terbalik. Sisi mendatar tidak memotong baris mana pun.
+    baris_awal = np.clip(np.floor(y_atas + 0.5), baris_atas, baris_bawah).astype(np.int64)
+    baris_akhir = np.clip(np.floor(y_bawah + 0.5), baris_atas, baris_bawah).astype(np.int64)
+    jumlah_baris = np.maximum(baris_akhir - baris_awal, 0)
+
+    # Rentang baris setiap poligon: gabungan rentang baris sisi-sisinya.
+    pemilik_sisi = np.repeat(np.arange(jumlah_poligon), np.diff(offset))
+    ada = jumlah_baris > 0
+    baris_min = np.full(jumlah_poligon, baris_bawah, dtype=np.int64)
+    baris_maks = np.zeros(jumlah_poligon, dtype=np.int64)
+    np.minimum.at(baris_min, pemilik_sisi[ada], baris_awal[ada])
+    np.maximum.at(baris_maks, pemilik_sisi[ada], baris_akhir[ada])
+    baris_poligon = np.maximum(baris_maks - baris_min, 0)
+    awal_slot = np.cumsum(baris_poligon) - baris_poligon
+
+    # Per sisi yang memotong baris: x = x_0 + baris * kemiringan di pusat baris, dan posisi slot
+    # (poligon, baris) = geser_slot + baris.
+    a, b, pemilik_sisi = a[ada], b[ada], pemilik_sisi[ada]
+    kemiringan = (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+    x_0 = a[:, 0] + (0.5 - a[:, 1]) * kemiringan
+    geser_slot = awal_slot[pemilik_sisi] - baris_min[pemilik_sisi]
+
+    # Satu catatan per (sisi, baris yang dipotongnya): x perpotongan sisi dengan pusat baris.
+    sisi = np.repeat(np.arange(len(a)), jumlah_baris[ada])
+    baris = indeks_gabungan(baris_awal[ada], jumlah_baris[ada])
+    x = x_0[sisi] + baris * kemiringan[sisi]
+    slot = geser_slot[sisi] + baris
+    jumlah_slot = int(baris_poligon.sum())
+    x_kiri, x_kanan = np.full(jumlah_slot, np.inf), np.full(jumlah_slot, -np.inf)
+    np.minimum.at(x_kiri, slot, x)
+    np.maximum.at(x_kanan, slot, x)
+
+    poligon = np.repeat(np.arange(jumlah_poligon), baris_poligon)
+    baris_slot = indeks_gabungan(baris_min[baris_poligon > 0], baris_poligon[baris_poligon > 0])
+    return poligon, baris_slot, x_kiri, x_kanan
+
+
+def kolom_rentang(x_kiri, x_kanan, lebar):
+    """Kolom piksel [awal, akhir) yang pusatnya (kolom + 0.5) berada di [x_kiri, x_kanan)."""
+    awal = np.clip(np.ceil(x_kiri - 0.5), 0, lebar).astype(np.int64)
+    akhir = np.clip(np.ceil(x_kanan - 0.5), 0, lebar).astype(np.int64)
+    return awal, np.maximum(akhir, awal)
+
+
+class DaftarPrimitif:
+    """
+    Poligon konveks yang akan dirasterisasi, dalam urutan gambar. Setiap poligon punya kunci
+    urutan (`kunci`, makin besar makin akhir digambar) dan jenis: opak (warna RGB) atau isi
+    transparan (warna dan alpha `warna_isi`/`alpha_isi` yang sama untuk semua isi).
+    """
+
+    def __init__(self):
+        self._simpul, self._panjang, self._kunci, self._warna, self._isi = [], [], [], [], []
+
+    def tambah(self, simpul, panjang, kunci, warna=None, isi=False):
+        """Tambah poligon terkemas: `simpul` (m, 2) dengan jumlah simpul per poligon `panjang`."""
+        panjang = np.asarray(panjang, dtype=np.int64).reshape(-1)
+        if not len(panjang):
+            return
+        self._simpul.append(np.asarray(simpul, dtype=np.float64).reshape(-1, 2))
+        self._panjang.append(panjang)
+        self._kunci.append(np.broadcast_to(np.asarray(kunci, dtype=np.int32), len(panjang)))
+        warna = np.zeros(3) if warna is None else np.asarray(warna, dtype=np.float32)
+        self._warna.append(np.broadcast_to(warna, (len(panjang), 3)))
+        self._isi.append(np.full(len(panjang), isi))
+
+    def tambah_segi_empat(self, poligon, kunci, warna=None, isi=False):
+        """Tambah poligon (n, 4, 2) seperti hasil `poligon_garis`/`poligon_titik`."""
+        self.tambah(poligon.reshape(-1, 2), np.full(len(poligon), 4), kunci, warna, isi)
+
+    def kemas(self):
+        """(simpul, offset, kunci, warna, isi) semua poligon."""
+        if not self._panjang:
+            return (np.zeros((0, 2)), np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32),
+                    np.zeros((0, 3), dtype=np.float32), np.zeros(0, dtype=bool))
+        panjang = np.concatenate(self._panjang)
+        offset = np.zeros(len(panjang) + 1, dtype=np.int64)
+        np.cumsum(panjang, out=offset[1:])
+        return (np.concatenate(self._simpul), offset, np.concatenate(self._kunci),
+                np.concatenate(self._warna), np.concatenate(self._isi))
+
+
+class PenggambarCPU:
+    """
+    Menggambar scene `Main` Modul_A ke framebuffer RGBA uint8 (tinggi, lebar, 4), baris
+    paling atas dulu, seperti `Main.gambar_scene` (bentuk, isi dan outline hasil potong,
+    kotak seleksi `ids_terpilih`, jendela pemotongan). Kotak seleksi digambar setelah
+    semua bentuk.
+    """
+
+    def __init__(self, lebar, tinggi, jumlah_tile=None, warna_latar=(1.0, 1.0, 1.0)):
+        self.lebar, self.tinggi = lebar, tinggi
+        # Warna latar (glClearColor) sebagai satu piksel RGBA8 untuk mengisi framebuffer sekaligus.
+        self._latar = np.append(_ke_uint8(warna_latar), np.uint8(255)).view(np.uint32)[0]
+        self.jumlah_tile = max(1, min(tinggi, jumlah_tile or os.cpu_count() or 1))
+        self.batas_tile = np.linspace(0, tinggi, self.jumlah_tile + 1).astype(np.int64).tolist()
+        self._pool = ThreadPoolExecutor(self.jumlah_tile) if self.jumlah_tile > 1 else None
+        self.framebuffer = np.empty((tinggi, lebar, 4), dtype=np.uint8)
+        self.jumlah_poligon = self.jumlah_piksel = 0
+
+    # ------------------------------------------------------------------ scene Modul_A
+
+    def primitif_scene(self, app):
+        """Primitif scene `app` (objek `Main`) dalam urutan `gambar_scene`."""
+        daftar = DaftarPrimitif()
+        penyimpanan = app.penyimpanan
+        ids = app.ids_bentuk()
+        if not len(ids):
+            return daftar
+        simpul, offset = penyimpanan.simpul_dunia(ids)
+        tipe, ketebalan = penyimpanan.tipe[ids], penyimpanan.ketebalan[ids].astype(np.float64)
+        urutan = np.arange(len(ids))
+        titik = tipe == PenyimpananBentuk.TITIK
+
+        if not app.window_clipping:
+            palet = np.asarray(penyimpanan.palet, dtype=np.float32).reshape(-1, 3)
+            warna = palet[penyimpanan.indeks_warna[ids]]
+            daftar.tambah_segi_empat(poligon_titik(simpul[offset[:-1][titik]], 2 * ketebalan[titik]),
+                                     urutan[titik], warna[titik])
+            # Garis (GL_LINES, selalu dua simpul) dan outline bentuk lain (GL_LINE_LOOP) menjadi segmen tebal.
+            garis = tipe == PenyimpananBentuk.GARIS
+            simpul_garis, _ = _pilih_poligon(simpul, offset, garis)
+            _tambah_segmen(daftar, simpul_garis.reshape(-1, 2, 2), ketebalan[garis], urutan[garis], warna[garis])
+            loop = ~(titik | garis)
+            simpul_loop, offset_loop = _pilih_poligon(simpul, offset, loop)
+            panjang_loop = np.diff(offset_loop)
+            _tambah_segmen(daftar, segmen_loop(simpul_loop, offset_loop), np.repeat(ketebalan[loop], panjang_loop),
+                           np.repeat(urutan[loop], panjang_loop), np.repeat(warna[loop], panjang_loop, axis=0))
+        else:
+            # Seperti `gambar_terpotong`: semua bentuk terpotong memakai `warna_potong`. Kunci 2i untuk
+            # isi bentuk ke-i dan 2i + 1 untuk outline-nya, agar outline menimpa isinya sendiri.
+            warna_potong = np.asarray(app.warna_potong, dtype=np.float32)
+            x_min, y_min, x_max, y_max = app.window_clipping
+            p = simpul[offset[:-1][titik]]
+            di_dalam = (p[:, 0] >= x_min) & (p[:, 0] <= x_max) & (p[:, 1] >= y_min) & (p[:, 1] <= y_max)
+            daftar.tambah_segi_empat(poligon_titik(p[di_dalam], 2 * ketebalan[titik][di_dalam]),
+                                     2 * urutan[titik][di_dalam] + 1, warna_potong)
+
+            hasil_potong = app.potong_semua_bentuk()
+            garis = np.flatnonzero(tipe == PenyimpananBentuk.GARIS)
+            terlihat = [i for i in garis.tolist() if len(hasil_potong[i])]
+            if terlihat:
+                segmen = np.concatenate([hasil_potong[i] for i in terlihat]).reshape(-1, 2, 2)
+                _tambah_segmen(daftar, segmen, ketebalan[terlihat], 2 * urutan[terlihat] + 1, warna_potong)
+
+            poligon = np.flatnonzero(~titik & (tipe != PenyimpananBentuk.GARIS))
+            terlihat = [i for i in poligon.tolist() if len(hasil_potong[i])]
+            if terlihat:
+                simpul_potong = np.concatenate([hasil_potong[i] for i in terlihat])
+                panjang = np.fromiter((len(hasil_potong[i]) for i in terlihat), dtype=np.int64, count=len(terlihat))
+                offset_potong = np.zeros(len(terlihat) + 1, dtype=np.int64)
+                np.cumsum(panjang, out=offset_potong[1:])
+                daftar.tambah(simpul_potong, panjang, 2 * urutan[terlihat], isi=True)
+                _tambah_segmen(daftar, segmen_loop(simpul_potong, offset_potong), np.repeat(ketebalan[terlihat], panjang),
+                               np.repeat(2 * urutan[terlihat] + 1, panjang), warna_potong)
+        return daftar
+
+    def gambar(self, app, keluaran=None):
+        """
+        Rasterisasi scene `app` ke `keluaran` (atau `framebuffer`) dan kembalikan array tersebut.
+        Sama dengan glClear + `gambar_scene` tanpa teks info, lalu `baca_piksel()`.
+        """
+        keluaran = self.framebuffer if keluaran is None else keluaran
+        daftar = self.primitif_scene(app)
+        lapisan = []  # (segmen, ketebalan, warna, alpha, pola stipple) digambar berurutan setelah bentuk
+        kotak = app.kotak_seleksi()
+        if len(kotak):
+            lapisan.append((segmen_loop(kotak, np.arange(0, len(kotak) + 1, 4)), 2.0, WARNA_SELEKSI, ALPHA_SELEKSI, None))
+        if app.window_clipping:
+            x_min, y_min, x_max, y_max = app.window_clipping
+            jendela = np.array([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]], dtype=np.float64)
+            lapisan.append((segmen_loop(jendela, np.array([0, 4])), 3.0, WARNA_JENDELA, ALPHA_JENDELA, POLA_JENDELA))
+        return self.gambar_primitif(daftar, keluaran, app.warna_potong, ALPHA_ISI, lapisan)
+
+    # ------------------------------------------------------------------ rasterisasi
+
+    def gambar_primitif(self, daftar, keluaran=None, warna_isi=(0.0, 0.0, 0.0), alpha_isi=ALPHA_ISI, lapisan=()):
+        """Rasterisasi `DaftarPrimitif` (lalu garis transparan `lapisan`) ke `keluaran`."""
+        keluaran = self.framebuffer if keluaran is None else keluaran
+        simpul, offset, kunci, warna, isi = daftar.kemas()
+        self.jumlah_poligon = len(offset) - 1
+
+        # Warna uint8 per kunci untuk primitif opak (diambil dari poligon pemiliknya).
+        opak = ~isi
+        tabel_warna = np.zeros((int(kunci.max()) + 1 if len(kunci) else 1, 3), dtype=np.uint8)
+        tabel_warna[kunci[opak]] = _ke_uint8(warna[opak])
+        lapisan = [(poligon_garis(segmen, ketebalan), _ke_uint8(warna_garis), _ke_uint8(alpha) / 255, pola, segmen)
+                   for segmen, ketebalan, warna_garis, alpha, pola in lapisan]
+        argumen = (simpul, offset, kunci, isi, tabel_warna, _ke_uint8(warna_isi), _ke_uint8(alpha_isi) / 255, lapisan, keluaran)
+
+        # Setiap pita menghitung rentang scanline-nya sendiri, jadi seluruh rasterisasi berjalan paralel.
+        pita = list(zip(self.batas_tile[:-1], self.batas_tile[1:]))
+        if self._pool is None:
+            jumlah_piksel = [self._gambar_pita(awal, akhir, *argumen) for awal, akhir in pita]
+        else:
+            jumlah_piksel = [tugas.result() for tugas in
+                             [self._pool.submit(self._gambar_pita, awal, akhir, *argumen) for awal, akhir in pita]]
+        self.jumlah_piksel = sum(jumlah_piksel)
+        return keluaran
+
+    def _gambar_pita(self, baris_awal, baris_akhir, simpul, offset, kunci, isi, tabel_warna, warna_isi, alpha_isi,
+                     lapisan, keluaran):
+        """Rasterisasi baris [baris_awal, baris_akhir) ke `keluaran`; mengembalikan jumlah piksel primitif."""
+        lebar = self.lebar
+        jumlah_piksel = (baris_akhir - baris_awal) * lebar
+        poligon, baris, x_kiri, x_kanan = rentang_poligon(simpul, offset, baris_awal, baris_akhir)
+        kolom_awal, kolom_akhir = kolom_rentang(x_kiri, x_kanan, lebar)
+        awal_piksel = (baris - baris_awal) * lebar + kolom_awal
+        jumlah = kolom_akhir - kolom_awal
+
+        tujuan = keluaran[baris_awal:baris_akhir]
+        tujuan.view(np.uint32)[:] = self._latar
+        piksel_tujuan = tujuan.reshape(-1, 4)
+
+        # Primitif opak terakhir di setiap piksel (-1 = latar).
+        terakhir = np.full(jumlah_piksel, -1, dtype=np.int32)
+        opak = ~isi[poligon]
+        piksel_opak = indeks_gabungan(awal_piksel[opak], jumlah[opak])
+        np.maximum.at(terakhir, piksel_opak, np.repeat(kunci[poligon[opak]], jumlah[opak]))
+        tertutup = np.flatnonzero(terakhir >= 0)
+        piksel_tujuan[tertutup, :3] = tabel_warna[terakhir[tertutup]]
+
+        # Isi transparan yang digambar setelah primitif opak tersebut: k lapis isi dengan warna c dan
+        # alpha a mengubah warna p menjadi c + (1 - a)^k (p - c).
+        piksel_isi = indeks_gabungan(awal_piksel[~opak], jumlah[~opak])
+        if len(piksel_isi):
+            kunci_isi = np.repeat(kunci[poligon[~opak]], jumlah[~opak])
+            tumpukan = np.bincount(piksel_isi[kunci_isi > terakhir[piksel_isi]], minlength=jumlah_piksel)
+            terisi = np.flatnonzero(tumpukan)
+            sisa = np.power(np.float32(1 - alpha_isi), tumpukan[terisi], dtype=np.float32)[:, None]
+            warna = piksel_tujuan[terisi, :3].astype(np.float32)
+            piksel_tujuan[terisi, :3] = np.rint(warna_isi + sisa * (warna - warna_isi))
+
+        for poligon_lapisan, warna_garis, alpha, pola, segmen in lapisan:
+            self._campur_garis(tujuan, baris_awal, poligon_lapisan, segmen, warna_garis, alpha, pola)
+        return int(jumlah.sum())
+
+    def _campur_garis(self, tujuan, baris_awal, poligon, segmen, warna_garis, alpha, pola):
+        """Campur (alpha blending) segmen-segmen tebal ke `tujuan` milik satu pita."""
+        tinggi_pita, lebar = tujuan.shape[:2]
+        if pola is None:
+            # Tanpa stipple semua segmen dicampur sekaligus: k lapis garis mengubah warna p menjadi
+            # c + (1 - a)^k (p - c), seperti isi transparan di `_gambar_pita`.
+            _, baris, x_kiri, x_kanan = rentang_poligon(poligon.reshape(-1, 2), np.arange(0, 4 * len(poligon) + 1, 4),
+                                                        baris_awal, baris_awal + tinggi_pita)
+            kolom_awal, kolom_akhir = kolom_rentang(x_kiri, x_kanan, lebar)
+            jumlah = kolom_akhir - kolom_awal
+            piksel = indeks_gabungan((baris - baris_awal) * lebar + kolom_awal, jumlah)
+            tumpukan = np.bincount(piksel, minlength=tinggi_pita * lebar)
+            terisi = np.flatnonzero(tumpukan)
+            sisa = np.power(np.float32(1 - alpha), tumpukan[terisi], dtype=np.float32)[:, None]
+            piksel_tujuan = tujuan.reshape(-1, 4)
+            warna = piksel_tujuan[terisi, :3].astype(np.float32)
+            piksel_tujuan[terisi, :3] = np.rint(warna_garis + sisa * (warna - warna_garis))
+            return
+        penghitung = 0  # penghitung pola stipple berlanjut antarsegmen seperti di GL_LINE_LOOP
+        for quad, (p1, p2) in zip(poligon, segmen):
+            _, baris, x_kiri, x_kanan = rentang_poligon(quad, np.array([0, 4]), baris_awal, baris_awal + tinggi_pita)
+            kolom_awal, kolom_akhir = kolom_rentang(x_kiri, x_kanan, lebar)
+            jumlah = kolom_akhir - kolom_awal
+            kolom, baris = indeks_gabungan(kolom_awal, jumlah), np.repeat(baris, jumlah)
+            if pola is not None:
+                # Fragmen ke-n sepanjang sumbu utama segmen memakai bit (n mod 16) dari pola.
+                mendatar = abs(p2[0] - p1[0]) >= abs(p2[1] - p1[1])
+                jarak = np.abs(kolom + 0.5 - p1[0]) if mendatar else np.abs(baris + 0.5 - p1[1])
+                n = penghitung + jarak.astype(np.int64)
+                pakai = (pola >> (n % 16)) & 1 == 1
+                penghitung += int(round(abs(p2[0] - p1[0]) if mendatar else abs(p2[1] - p1[1])))
+                baris, kolom = baris[pakai], kolom[pakai]
+            baris = baris - baris_awal
+            warna = tujuan[baris, kolom, :3].astype(np.float32)
+            tujuan[baris, kolom, :3] = np.rint(warna + alpha * (warna_garis - warna))
+
+    # ------------------------------------------------------------------ antarmuka konteks (render_batch)
+
+    def selesai(self):
+        """Rasterisasi selalu selesai saat `gambar` kembali (pengganti glFinish)."""
+
+    def baca_piksel(self, keluaran=None, balik=True):
+        """
+        Salinan `framebuffer` seperti `KonteksHeadless.baca_piksel`: baris paling atas dulu, atau
+        dengan balik=False baris paling bawah dulu (urutan OpenGL).
+        """
+        if keluaran is None:
+            keluaran = np.empty_like(self.framebuffer)
+        np.copyto(keluaran, self.framebuffer if balik else self.framebuffer[::-1])
+        return keluaran
+
+    def tutup(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def _ke_uint8(warna):
+    """Warna/alpha float [0, 1] ke nilai 8 bit seperti konversi glColor ke framebuffer RGBA8."""
+    return np.rint(np.clip(np.asarray(warna, dtype=np.float32), 0, 1) * 255).astype(np.uint8)
+
+
+def _tambah_segmen(daftar, segmen, ketebalan, kunci, warna):
+    daftar.tambah_segi_empat(poligon_garis(segmen, ketebalan), kunci, warna)
+
+
+def _pilih_poligon(simpul, offset, mask):
+    """Simpul dan offset terkemas hanya untuk poligon `mask`."""
+    panjang = np.diff(offset)[mask]
+    offset_baru = np.zeros(len(panjang) + 1, dtype=np.int64)
+    np.cumsum(panjang, out=offset_baru[1:])
+    return simpul[indeks_gabungan(offset[:-1][mask], panjang)], offset_baru
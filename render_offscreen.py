@@ -0,0 +1,162 @@
+"""
+Render batch tanpa display (EGL surfaceless atau OSMesa) ke deretan file PNG.
+
+    python render_offscreen.py a --scene scene.json --jendela 200 100 700 500 --geser 2 0 --frame 1000
+    python render_offscreen.py a --scene scene.json --backend cpu --tile 8 --frame 5000
+    python render_offscreen.py b --instans 10000 --kamera 0 0 -30 --putar 0.5 --frame 1000
+
+Mode `a` memuat scene Modul_A (berkas dari tombol `k`) dan menggambarnya, opsional
+dipotong jendela yang digeser setiap frame; dengan `--backend cpu` scene dirasterisasi
+NumPy (rasterisasi.py) tanpa konteks OpenGL sama sekali. Mode `b` menggambar mesh
+atau scene instans Modul_B dengan kamera tertentu yang diputar setiap frame. Piksel
+dibaca ke buffer yang dipakai ulang, dan PNG di-encode di thread pekerja bersamaan
+dengan render frame berikutnya.
+"""
+import argparse
+import os
+import time
+
+from konteks_headless import PLATFORM_DIDUKUNG, KonteksHeadless, siapkan_platform
+
+
+def render_batch(konteks, gambar_frame, jumlah_frame, keluaran, level=6, jumlah_pekerja=2, jumlah_buffer=4):
+    """
+    Untuk setiap frame i: `gambar_frame(i)`, baca piksel ke buffer dari kumpulan `PenulisPNG`,
+    lalu antrekan sebagai `keluaran`/frame_<i>.png. Mengembalikan statistik waktu.
+    """
+    from penulis_png import PenulisPNG
+
+    os.makedirs(keluaran, exist_ok=True)
+    digit = max(5, len(str(jumlah_frame - 1)))
+    penulis = PenulisPNG((konteks.tinggi, konteks.lebar, 4), jumlah_buffer, jumlah_pekerja, level)
+    waktu_render = waktu_baca = 0.0
+    mulai = time.perf_counter()
+    try:
+        for i in range(jumlah_frame):
+            awal_render = time.perf_counter()
+            gambar_frame(i)
+            konteks.selesai()
+            waktu_render += time.perf_counter() - awal_render
+
+            buffer = penulis.ambil_buffer()
+            awal_baca = time.perf_counter()
+            # Tanpa membalik baris di sini; pekerja meng-encode view terbalik dari buffer.
+            konteks.baca_piksel(buffer, balik=False)
+            waktu_baca += time.perf_counter() - awal_baca
+            penulis.kirim(buffer, os.path.join(keluaran, f"frame_{i:0{digit}d}.png"))
+    finally:
+        penulis.tutup()
+    lama = time.perf_counter() - mulai
+
+    per_frame = 1000 / max(jumlah_frame, 1)
+    return {'frame': jumlah_frame, 'detik': lama, 'fps': jumlah_frame / lama,
+            'render_ms': waktu_render * per_frame, 'baca_ms': waktu_baca * per_frame,
+            'tunggu_encoder_ms': penulis.waktu_tunggu * per_frame, 'encode_ms': penulis.waktu_encode * per_frame}
+
+
+def siapkan_modul_a(args):
+    from Modul_A import Main
+
+    app = Main(renderer=args.renderer, pekerja_potong=args.pekerja_potong)
+    app.muat_scene(args.scene)
+    if args.ukuran:
+        app.lebar, app.tinggi = args.ukuran
+    if args.backend == 'cpu':
+        from rasterisasi import PenggambarCPU
+
+        # Tanpa konteks OpenGL: scene dirasterisasi NumPy ke framebuffer milik penggambar.
+        konteks = PenggambarCPU(app.lebar, app.tinggi, args.tile)
+        gambar_scene = lambda: konteks.gambar(app)
+    else:
+        konteks = KonteksHeadless(app.lebar, app.tinggi)
+        app.inisialisasi_gl()
+        gambar_scene = app.gambar_scene
+
+    jendela = tuple(args.jendela) if args.jendela else app.window_clipping
+    geser_x, geser_y = args.geser
+
+    def gambar_frame(i):
+        if jendela:
+            x_min, y_min, x_max, y_max = jendela
+            app.window_clipping = (x_min + i * geser_x, y_min + i * geser_y, x_max + i * geser_x, y_max + i * geser_y)
+        gambar_scene()
+    return konteks, gambar_frame
+
+
+def siapkan_modul_b(args):
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import Modul_B
+    from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear, glColor3f, glLoadMatrixf
+    from renderer_mesh import PenggambarInstans, PenggambarMesh
+    from transformasi import kali_quaternion, matriks_model, quaternion_sumbu_sudut, untuk_gl
+
+    mesh = Modul_B.muat_mesh(args.mesh)
+    scene = Modul_B.scene_acak(mesh, args.instans) if args.instans else None
+    lebar, tinggi = args.ukuran or (1024, 768)
+    konteks = KonteksHeadless(lebar, tinggi)
+    proyeksi = Modul_B.siapkan_gl(lebar / tinggi, Modul_B.bidang_jauh(scene))
+    penggambar = PenggambarMesh(mesh) if scene is None else PenggambarInstans(scene)
+
+    sudut_x, sudut_y = args.sudut
+    orientasi_awal = kali_quaternion(quaternion_sumbu_sudut((0, 1, 0), sudut_y), quaternion_sumbu_sudut((1, 0, 0), sudut_x))
+
+    def gambar_frame(i):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        orientasi = kali_quaternion(orientasi_awal, quaternion_sumbu_sudut((0, 1, 0), i * args.putar))
+        modelview = matriks_model(args.kamera, orientasi, args.skala)
+        glLoadMatrixf(untuk_gl(modelview))
+        if scene is not None:
+            penggambar.gambar(proyeksi @ modelview)
+        else:
+            glColor3f(*Modul_B.WARNA_KUBUS)
+            penggambar.gambar()
+    return konteks, gambar_frame
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render batch Modul_A/Modul_B tanpa display ke file PNG")
+    parser.add_argument('--platform', choices=PLATFORM_DIDUKUNG, default='egl')
+    parser.add_argument('--frame', type=int, default=100, help="jumlah frame")
+    parser.add_argument('--keluaran', default='frame', help="direktori file PNG")
+    parser.add_argument('--ukuran', type=int, nargs=2, metavar=('LEBAR', 'TINGGI'),
+                        help="ukuran frame (default: ukuran scene Modul_A, 1024x768 untuk Modul_B)")
+    parser.add_argument('--level', type=int, default=6, help="level kompresi zlib 0-9")
+    parser.add_argument('--pekerja', type=int, default=2, help="thread encoder PNG (0 = encode di thread render)")
+    parser.add_argument('--buffer', type=int, default=4, help="jumlah buffer piksel yang dipakai bergiliran")
+    sub = parser.add_subparsers(dest='modul', required=True)
+
+    parser_a = sub.add_parser('a', help="scene 2D Modul_A")
+    parser_a.add_argument('--scene', required=True, help="file scene .json atau biner (tombol k di Modul_A)")
+    parser_a.add_argument('--renderer', choices=('daftar', 'langsung', 'vbo'), default='langsung')
+    parser_a.add_argument('--backend', choices=('gl', 'cpu'), default='gl',
+                          help="cpu = rasterisasi NumPy tanpa konteks OpenGL (rasterisasi.py)")
+    parser_a.add_argument('--tile', type=int, help="jumlah pita baris paralel backend cpu (default: jumlah CPU)")
+    parser_a.add_argument('--pekerja-potong', type=int, default=1, help="jumlah proses pemotongan")
+    parser_a.add_argument('--jendela', type=float, nargs=4, metavar=('X_MIN', 'Y_MIN', 'X_MAKS', 'Y_MAKS'),
+                          help="jendela pemotongan (default: jendela yang tersimpan di scene)")
+    parser_a.add_argument('--geser', type=float, nargs=2, default=(0.0, 0.0), metavar=('DX', 'DY'),
+                          help="pergeseran jendela per frame")
+
+    parser_b = sub.add_parser('b', help="mesh/scene 3D Modul_B")
+    parser_b.add_argument('--mesh', default='kubus', help="mesh bawaan atau path file .obj/.ply")
+    parser_b.add_argument('--instans', type=int, default=0, help="jumlah instans acak (0 = satu mesh)")
+    parser_b.add_argument('--kamera', type=float, nargs=3, default=(0.0, 0.0, -10.0), metavar=('X', 'Y', 'Z'),
+                          help="translasi kamera (seperti panah/W/S di Modul_B)")
+    parser_b.add_argument('--sudut', type=float, nargs=2, default=(30.0, 30.0), metavar=('X', 'Y'),
+                          help="rotasi awal terhadap sumbu x lalu y (derajat)")
+    parser_b.add_argument('--putar', type=float, default=1.0, help="rotasi terhadap sumbu y per frame (derajat)")
+    parser_b.add_argument('--skala', type=float, default=1.0)
+    args = parser.parse_args()
+
+    siapkan_platform(args.platform)
+    konteks, gambar_frame = (siapkan_modul_a if args.modul == 'a' else siapkan_modul_b)(args)
+    try:
+        hasil = render_batch(konteks, gambar_frame, args.frame, args.keluaran, args.level, args.pekerja, args.buffer)
+    finally:
+        konteks.tutup()
+
+    print(f"{hasil['frame']} frame {konteks.lebar}x{konteks.tinggi} dalam {hasil['detik']:.2f} s: "
+          f"{hasil['fps']:.1f} frame/s")
+    print(f"per frame: render {hasil['render_ms']:.2f} ms, baca piksel {hasil['baca_ms']:.2f} ms, "
+          f"tunggu encoder {hasil['tunggu_encoder_ms']:.2f} ms, encode {hasil['encode_ms']:.2f} ms "
+          f"({args.pekerja} pekerja)")
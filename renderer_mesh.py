@@ -0,0 +1,164 @@
+"""
+Renderer mesh untuk Modul_B.
+
+Posisi dan normal simpul diunggah sekali ke satu vertex buffer (interleaved)
+dan indeks segitiga ke index buffer, lalu setiap frame mesh digambar dengan
+satu `glDrawElements`. Pencahayaan fixed-function tetap dipakai.
+
+`PenggambarInstans` menggambar banyak salinan mesh yang sama dengan satu
+`glDrawElementsInstanced`: matriks model dan warna per instans dibaca shader
+dari buffer instans, dan pencahayaannya meniru pencahayaan fixed-function.
+"""
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+
+from transformasi import untuk_gl
+
+SHADER_SIMPUL_INSTANS = """
+#version 330 compatibility
+layout(location = 0) in vec3 posisi;
+layout(location = 1) in vec3 normal;
+layout(location = 2) in vec4 model_0;
+layout(location = 3) in vec4 model_1;
+layout(location = 4) in vec4 model_2;
+layout(location = 5) in vec4 model_3;
+layout(location = 6) in vec3 warna;
+out vec4 warna_simpul;
+
+void main() {
+    mat4 model = mat4(model_0, model_1, model_2, model_3);
+    vec4 posisi_mata = gl_ModelViewMatrix * model * vec4(posisi, 1.0);
+    vec3 n = normalize(gl_NormalMatrix * mat3(model) * normal);
+
+    // Gouraud seperti fixed-function: GL_COLOR_MATERIAL (ambient & diffuse) + specular material.
+    vec3 cahaya = normalize(gl_LightSource[0].position.xyz - posisi_mata.xyz * gl_LightSource[0].position.w);
+    float diffuse = max(dot(n, cahaya), 0.0);
+    float specular = diffuse > 0.0 ? pow(max(dot(n, normalize(cahaya + vec3(0.0, 0.0, 1.0))), 0.0),
+                                         gl_FrontMaterial.shininess) : 0.0;
+    vec3 hasil = warna * (gl_LightModel.ambient.rgb + gl_LightSource[0].ambient.rgb
+                          + gl_LightSource[0].diffuse.rgb * diffuse)
+               + gl_FrontMaterial.specular.rgb * gl_LightSource[0].specular.rgb * specular;
+    warna_simpul = vec4(hasil, 1.0);
+    gl_Position = gl_ProjectionMatrix * posisi_mata;
+}
+"""
+
+SHADER_FRAGMEN_INSTANS = """
+#version 330 compatibility
+in vec4 warna_simpul;
+
+void main() {
+    gl_FragColor = warna_simpul;
+}
+"""
+
+
+class PenggambarMesh:
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.vbo, self.ibo = glGenBuffers(2)
+        self.jumlah_indeks = 0
+        self.unggah()
+
+    def unggah(self):
+        mesh = self.mesh
+        simpul = np.ascontiguousarray(np.hstack((mesh.simpul, mesh.normal)), dtype=np.float32)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, simpul.nbytes, simpul, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, mesh.indeks.nbytes, mesh.indeks, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        self.jumlah_indeks = mesh.indeks.size
+
+    def gambar(self):
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 24, None)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glNormalPointer(GL_FLOAT, 24, ctypes.c_void_p(12))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+
+        glDrawElements(GL_TRIANGLES, self.jumlah_indeks, GL_UNSIGNED_INT, None)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def hapus(self):
+        glDeleteBuffers(2, [self.vbo, self.ibo])
+
+
+class PenggambarInstans:
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.penggambar_mesh = PenggambarMesh(scene.mesh)
+        self.program = shaders.compileProgram(
+            shaders.compileShader(SHADER_SIMPUL_INSTANS, GL_VERTEX_SHADER),
+            shaders.compileShader(SHADER_FRAGMEN_INSTANS, GL_FRAGMENT_SHADER))
+        self.vbo_matriks, self.vbo_warna = glGenBuffers(2)
+
+        # Instans yang terakhir diunggah; jika hasil culling sama, buffer instans tidak diunggah ulang.
+        self.terlihat, self.versi_unggah = None, -1
+        self.jumlah_digambar = self.jumlah_dibuang = 0
+
+    def unggah(self, terlihat):
+        scene = self.scene
+        if self.versi_unggah == scene.versi and self.terlihat is not None and np.array_equal(self.terlihat, terlihat):
+            return
+        # Urutan kolom: setiap 4 float berurutan adalah satu kolom matriks (satu atribut vec4).
+        matriks = untuk_gl(scene.matriks_model()[terlihat])
+        warna = np.ascontiguousarray(scene.warna[terlihat])
+        for vbo, data in ((self.vbo_matriks, matriks), (self.vbo_warna, warna)):
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, max(data.nbytes, 4), data if len(data) else None, GL_STREAM_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.terlihat, self.versi_unggah = terlihat, scene.versi
+
+    def gambar(self, proyeksi_view):
+        """Cull instans terhadap frustum `proyeksi_view` (matriks proyeksi @ view), lalu gambar sisanya."""
+        terlihat = self.scene.cull(proyeksi_view)
+        self.jumlah_digambar, self.jumlah_dibuang = len(terlihat), len(self.scene) - len(terlihat)
+        if not len(terlihat):
+            return
+        self.unggah(terlihat)
+
+        glUseProgram(self.program)
+        penggambar_mesh = self.penggambar_mesh
+        glBindBuffer(GL_ARRAY_BUFFER, penggambar_mesh.vbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 24, None)
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(12))
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_matriks)
+        for kolom in range(4):
+            glEnableVertexAttribArray(2 + kolom)
+            glVertexAttribPointer(2 + kolom, 4, GL_FLOAT, GL_FALSE, 64, ctypes.c_void_p(16 * kolom))
+            glVertexAttribDivisor(2 + kolom, 1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_warna)
+        glEnableVertexAttribArray(6)
+        glVertexAttribPointer(6, 3, GL_FLOAT, GL_FALSE, 12, None)
+        glVertexAttribDivisor(6, 1)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, penggambar_mesh.ibo)
+        glDrawElementsInstanced(GL_TRIANGLES, penggambar_mesh.jumlah_indeks, GL_UNSIGNED_INT, None, len(terlihat))
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        for lokasi in range(7):
+            glVertexAttribDivisor(lokasi, 0)
+            glDisableVertexAttribArray(lokasi)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    def hapus(self):
+        self.penggambar_mesh.hapus()
+        glDeleteBuffers(2, [self.vbo_matriks, self.vbo_warna])
+        glDeleteProgram(self.program)
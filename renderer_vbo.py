@@ -0,0 +1,137 @@
+"""
+Renderer retained-mode untuk bentuk Modul_A.
+
+Simpul koordinat layar (cache `PenyimpananBentuk.dunia`) dan warnanya diunggah
+sekali ke vertex buffer dengan offset yang sama seperti di penyimpanan. Setiap
+frame hanya rentang milik bentuk yang berubah yang diunggah ulang, lalu semua
+bentuk digambar dengan satu `glMultiDrawArrays` per kelompok
+(jenis primitif, ketebalan).
+"""
+import numpy as np
+from OpenGL.GL import *
+
+from pemotongan import indeks_gabungan
+from penyimpanan_bentuk import PenyimpananBentuk
+
+# Primitif OpenGL untuk setiap kode tipe bentuk (indeks = PenyimpananBentuk.KODE_TIPE).
+MODE_GAMBAR = np.array([GL_POINTS, GL_LINES, GL_LINE_LOOP, GL_LINE_LOOP, GL_LINE_LOOP], dtype=np.int64)
+
+
+class PenggambarVBO:
+
+    def __init__(self, penyimpanan, ambang_unggah_penuh=0.25):
+        self.penyimpanan = penyimpanan
+        # Jika bagian simpul yang berubah melebihi rasio ini, seluruh buffer diunggah sekaligus.
+        self.ambang_unggah_penuh = ambang_unggah_penuh
+        self.vbo_simpul, self.vbo_warna = glGenBuffers(2)
+        self.kapasitas = 0
+
+        # Keadaan penyimpanan saat terakhir diunggah, untuk mendeteksi bentuk yang berubah.
+        self.versi_vbo = np.zeros(0, dtype=np.int64)
+        self.offset_vbo = np.zeros(0, dtype=np.int64)
+        self.warna_vbo = np.zeros(0, dtype=np.int16)
+        self.jumlah_unggah = self.jumlah_simpul_unggah = self.jumlah_draw_call = 0
+
+    def _alokasi(self, kapasitas):
+        self.kapasitas = kapasitas
+        for vbo, komponen in ((self.vbo_simpul, 2), (self.vbo_warna, 3)):
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, kapasitas * komponen * 4, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.versi_vbo = np.full(0, -1, dtype=np.int64)
+
+    def _unggah_rentang(self, awal, akhir):
+        palet = np.asarray(self.penyimpanan.palet, dtype=np.float32).reshape(-1, 3)
+        simpul = np.ascontiguousarray(self.penyimpanan.dunia[awal:akhir], dtype=np.float32)
+
+        # Warna per simpul: warna bentuk pemilik simpul.
+        pemilik = self._pemilik_simpul[awal:akhir]
+        warna = np.ascontiguousarray(palet[self.penyimpanan.indeks_warna[pemilik]])
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_simpul)
+        glBufferSubData(GL_ARRAY_BUFFER, awal * 8, simpul.nbytes, simpul)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_warna)
+        glBufferSubData(GL_ARRAY_BUFFER, awal * 12, warna.nbytes, warna)
+        self.jumlah_unggah += 1
+        self.jumlah_simpul_unggah += akhir - awal
+
+    def sinkronkan(self, ids):
+        """Unggah simpul dan warna bentuk-bentuk `ids` yang berubah sejak sinkronisasi terakhir."""
+        penyimpanan = self.penyimpanan
+        penyimpanan._segarkan_cache(ids)
+
+        if len(penyimpanan.dunia) > self.kapasitas:
+            self._alokasi(len(penyimpanan.dunia))
+
+        jumlah_bentuk = penyimpanan.jumlah_bentuk
+        for nama, isi in (('versi_vbo', -1), ('offset_vbo', -1), ('warna_vbo', -1)):
+            lama = getattr(self, nama)
+            if len(lama) < jumlah_bentuk:
+                setattr(self, nama, np.concatenate((lama, np.full(jumlah_bentuk - len(lama), isi, dtype=lama.dtype))))
+
+        berubah = ids[(self.versi_vbo[ids] != penyimpanan.versi_cache[ids])
+                      | (self.offset_vbo[ids] != penyimpanan.offset[ids])
+                      | (self.warna_vbo[ids] != penyimpanan.indeks_warna[ids])]
+        if not len(berubah):
+            return
+
+        # Pemilik setiap simpul, dipakai untuk menyusun warna per simpul.
+        panjang = penyimpanan.panjang[:jumlah_bentuk]
+        self._pemilik_simpul = np.zeros(penyimpanan.simpul_terpakai, dtype=np.int64)
+        self._pemilik_simpul[indeks_gabungan(penyimpanan.offset[:jumlah_bentuk], panjang)] = np.repeat(
+            np.arange(jumlah_bentuk), panjang)
+
+        if penyimpanan.panjang[berubah].sum() > self.ambang_unggah_penuh * penyimpanan.simpul_terpakai:
+            self._unggah_rentang(0, penyimpanan.simpul_terpakai)
+        else:
+            for awal, panjang_bentuk in zip(penyimpanan.offset[berubah].tolist(), penyimpanan.panjang[berubah].tolist()):
+                self._unggah_rentang(awal, awal + panjang_bentuk)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self.versi_vbo[berubah] = penyimpanan.versi_cache[berubah]
+        self.offset_vbo[berubah] = penyimpanan.offset[berubah]
+        self.warna_vbo[berubah] = penyimpanan.indeks_warna[berubah]
+
+    def gambar(self, ids):
+        """Gambar bentuk-bentuk `ids` dengan satu glMultiDrawArrays per (primitif, ketebalan)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(ids):
+            return
+        self.sinkronkan(ids)
+        penyimpanan = self.penyimpanan
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_simpul)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_warna)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        mode = MODE_GAMBAR[penyimpanan.tipe[ids]]
+        ketebalan = penyimpanan.ketebalan[ids]
+        kelompok = np.lexsort((ketebalan, mode))
+        mode, ketebalan, ids_urut = mode[kelompok], ketebalan[kelompok], ids[kelompok]
+        batas = np.flatnonzero((np.diff(mode, prepend=-1) != 0) | (np.diff(ketebalan, prepend=-1) != 0))
+
+        for awal, akhir in zip(batas, np.append(batas[1:], len(ids_urut))):
+            anggota = ids_urut[awal:akhir]
+            if mode[awal] == GL_POINTS:
+                glPointSize(float(ketebalan[awal]) * 2)
+            else:
+                glLineWidth(float(ketebalan[awal]))
+            glMultiDrawArrays(int(mode[awal]), penyimpanan.offset[anggota].astype(np.int32),
+                              penyimpanan.panjang[anggota].astype(np.int32), len(anggota))
+            self.jumlah_draw_call += 1
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def kosongkan(self):
+        """Lupakan isi buffer (dipanggil setelah penyimpanan dikosongkan, karena id bentuk dipakai ulang)."""
+        self.versi_vbo = np.zeros(0, dtype=np.int64)
+        self.offset_vbo = np.zeros(0, dtype=np.int64)
+        self.warna_vbo = np.zeros(0, dtype=np.int16)
+
+    def hapus(self):
+        glDeleteBuffers(2, [self.vbo_simpul, self.vbo_warna])
@@ -0,0 +1,78 @@
+"""
+Scene berisi banyak instans satu mesh untuk Modul_B.
+
+Transformasi (posisi, orientasi quaternion, skala) dan warna setiap instans
+disimpan dalam array NumPy. Matriks model semua instans disusun sekaligus, dan culling
+view-frustum menguji bola pembatas semua instans terhadap enam bidang frustum
+dalam satu operasi array sebelum data instans dikirim ke GPU.
+"""
+import numpy as np
+
+from transformasi import matriks_model, quaternion_acak
+
+
+def bidang_frustum(proyeksi_view):
+    """
+    Enam bidang (a, b, c, d) frustum dari matriks proyeksi @ view (metode Gribb-Hartmann),
+    dinormalkan sehingga a*x + b*y + c*z + d adalah jarak bertanda di koordinat dunia
+    (positif di dalam frustum).
+    """
+    m = np.asarray(proyeksi_view, dtype=np.float64)
+    bidang = np.array([m[3] + m[0], m[3] - m[0], m[3] + m[1], m[3] - m[1], m[3] + m[2], m[3] - m[2]])
+    return bidang / np.linalg.norm(bidang[:, :3], axis=1, keepdims=True)
+
+
+def di_dalam_frustum(bidang, pusat, radius):
+    """Mask instans yang bola pembatasnya (pusat (n, 3), radius (n,)) tidak seluruhnya di luar frustum."""
+    terlihat = np.ones(len(pusat), dtype=bool)
+    for a, b, c, d in bidang:
+        # Per bidang agar tidak membuat array jarak (n, 6) sekaligus untuk jutaan instans.
+        terlihat &= pusat @ np.array([a, b, c], dtype=pusat.dtype) + d >= -radius
+    return terlihat
+
+
+class SceneInstans:
+
+    def __init__(self, mesh, posisi, orientasi=None, skala=None, warna=None):
+        jumlah = len(posisi)
+        self.mesh = mesh
+        self.posisi = np.ascontiguousarray(posisi, dtype=np.float32).reshape(-1, 3)
+        # Orientasi setiap instans sebagai quaternion satuan (w, x, y, z).
+        self.orientasi = (np.tile(np.float32([1, 0, 0, 0]), (jumlah, 1)) if orientasi is None
+                          else np.asarray(orientasi, dtype=np.float32))
+        self.skala = np.ones(jumlah, dtype=np.float32) if skala is None else np.asarray(skala, dtype=np.float32)
+        self.warna = np.full((jumlah, 3), (0.8, 0.4, 0.2), dtype=np.float32) if warna is None else np.asarray(warna, dtype=np.float32)
+
+        # Radius bola pembatas mesh (dari titik asal mesh), dipakai untuk culling.
+        self.radius_mesh = float(np.linalg.norm(mesh.simpul, axis=1).max()) if len(mesh.simpul) else 0.0
+        self.versi = 0
+        self._matriks, self._versi_matriks = None, -1
+
+    def __len__(self):
+        return len(self.posisi)
+
+    @classmethod
+    def acak(cls, mesh, jumlah, luas, seed=0):
+        """Instans tersebar acak (seeded) di kubus [-luas, luas]^3 dengan rotasi, skala dan warna acak."""
+        rng = np.random.default_rng(seed)
+        return cls(mesh,
+                   rng.uniform(-luas, luas, size=(jumlah, 3)),
+                   quaternion_acak(jumlah, rng),
+                   rng.uniform(0.1, 0.4, size=jumlah),
+                   rng.uniform(0.2, 1.0, size=(jumlah, 3)))
+
+    def tandai_berubah(self):
+        """Panggil setelah posisi/orientasi/skala diubah langsung agar matriks model disusun ulang."""
+        self.versi += 1
+
+    def matriks_model(self):
+        """Matriks model semua instans (n, 4, 4) float32, disusun dalam satu panggilan batch."""
+        if self._versi_matriks != self.versi:
+            self._matriks = matriks_model(self.posisi, self.orientasi, self.skala)
+            self._versi_matriks = self.versi
+        return self._matriks
+
+    def cull(self, proyeksi_view):
+        """Indeks instans yang (mungkin) terlihat oleh kamera dengan matriks proyeksi @ view ini."""
+        radius = self.skala * self.radius_mesh
+        return np.flatnonzero(di_dalam_frustum(bidang_frustum(proyeksi_view), self.posisi, radius))
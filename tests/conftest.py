@@ -0,0 +1,31 @@
+import ctypes.util
+import os
+import sys
+
+import pytest
+
+# Modul-modul proyek berada di akar repo (bukan paket), jadi akar repo dimasukkan ke sys.path.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from konteks_headless import PLATFORM_DIDUKUNG, siapkan_platform  # noqa: E402
+
+# Platform PyOpenGL dipilih saat OpenGL pertama kali di-import, jadi platform headless (jika
+# pustakanya ada) diatur di sini, sebelum modul uji mana pun meng-import Modul_A.
+_PUSTAKA_PLATFORM = {'egl': 'EGL', 'osmesa': 'OSMesa'}
+_platform = next((nama for nama in PLATFORM_DIDUKUNG if ctypes.util.find_library(_PUSTAKA_PLATFORM[nama])), None)
+if _platform:
+    siapkan_platform(_platform)
+
+
+@pytest.fixture(scope='module')
+def konteks(request):
+    """Konteks OpenGL headless seukuran `LEBAR` x `TINGGI` modul uji; dilewati jika tidak tersedia."""
+    platform = os.environ.get('PYOPENGL_PLATFORM')
+    if platform not in PLATFORM_DIDUKUNG:
+        pytest.skip("platform OpenGL headless (EGL/OSMesa) tidak tersedia")
+    from konteks_headless import KonteksHeadless, konteks_tersedia
+    if not konteks_tersedia():
+        pytest.skip(f"konteks headless {platform} tidak bisa dibuat")
+    konteks = KonteksHeadless(request.module.LEBAR, request.module.TINGGI)
+    yield konteks
+    konteks.tutup()
@@ -0,0 +1,148 @@
+"""Berkas scene biner Modul_A: simpan -> muat, scene kosong, memory map malas, dan penulisan atomik."""
+import os
+
+import numpy as np
+import pytest
+
+from Modul_A import Elips, Garis, Main, Persegi, Titik
+from penyimpanan_bentuk import PenyimpananBentuk
+from transformasi import rotasi_2d, skala_2d, translasi_2d
+
+
+def buat_scene():
+    """Semua tipe bentuk, termasuk bentuk yang sudah ditransformasi dan elips yang diputar."""
+    app = Main()
+    app.lebar, app.tinggi = 800, 600
+    app.window_clipping = (50.0, 60.0, 400.0, 300.0)
+    titik = Titik((10, 20), (1, 0, 0), 4.0, app.penyimpanan)
+    garis = Garis((0, 0), (100, 50), (0, 1, 0), 2.0, app.penyimpanan)
+    persegi = Persegi((30, 40), (90, 120), (0, 0, 1), 3.0, app.penyimpanan)
+    elips = Elips((200, 150), 80.0, 30.0, (1, 1, 0), 1.5, app.penyimpanan)
+    elips_kecil = Elips((500, 400), 3.0, 2.0, (1, 0.5, 0), 1.0, app.penyimpanan)
+    for bentuk in (titik, garis, persegi, elips, elips_kecil):
+        app.tambah_bentuk(bentuk)
+
+    garis.transformasi(rotasi_2d(30, (50, 25)))
+    persegi.transformasi(translasi_2d(15, -5) @ skala_2d(1.5, 0.5, (60, 80)))
+    elips.transformasi(rotasi_2d(40, (0, 0)))
+    return app
+
+
+def muat(path):
+    app = Main()
+    app.muat_scene(path)
+    return app
+
+
+def test_simpan_muat_semua_tipe(tmp_path):
+    app = buat_scene()
+    path = str(tmp_path / 'scene.bin')
+    app.simpan_scene(path)
+    app_muat = muat(path)
+
+    assert (app_muat.lebar, app_muat.tinggi) == (800, 600)
+    assert app_muat.window_clipping == app.window_clipping
+    assert len(app_muat.daftar_bentuk) == len(app.daftar_bentuk)
+    for bentuk, bentuk_muat in zip(app.daftar_bentuk, app_muat.daftar_bentuk):
+        assert type(bentuk_muat) is type(bentuk)
+        assert tuple(bentuk_muat.warna) == tuple(bentuk.warna)
+        assert bentuk_muat.ketebalan == bentuk.ketebalan
+        np.testing.assert_array_equal(bentuk_muat.simpul, bentuk.simpul)
+        np.testing.assert_array_equal(bentuk_muat.dapatkan_simpul_hasil_transformasi(),
+                                      bentuk.dapatkan_simpul_hasil_transformasi())
+        assert bentuk_muat.get_batas() == bentuk.get_batas()
+        if isinstance(bentuk, Elips):
+            assert bentuk_muat.pusat == bentuk.pusat
+            assert (bentuk_muat.radius_x, bentuk_muat.radius_y) == (bentuk.radius_x, bentuk.radius_y)
+            assert bentuk_muat.sudut == bentuk.sudut
+
+    elips = app_muat.daftar_bentuk[3]
+    assert elips.sudut == pytest.approx(40)
+    assert len(elips.simpul) > len(app_muat.daftar_bentuk[4].simpul)
+
+
+def test_simpan_muat_scene_kosong(tmp_path):
+    app = Main()
+    path = str(tmp_path / 'kosong.bin')
+    app.simpan_scene(path)
+    app_muat = muat(path)
+
+    assert len(app_muat.daftar_bentuk) == 0
+    assert app_muat.penyimpanan.jumlah_bentuk == 0
+    assert app_muat.window_clipping is None
+    # Scene kosong yang dimuat tetap bisa ditambah bentuk baru.
+    app_muat.tambah_bentuk(Titik((1, 2), (0, 0, 0), 2.0, app_muat.penyimpanan))
+    assert app_muat.daftar_bentuk[0].dapatkan_simpul_hasil_transformasi().tolist() == [[1.0, 2.0]]
+
+
+def test_muat_memetakan_berkas_dan_objek_dibuat_saat_diakses(tmp_path):
+    app = buat_scene()
+    path = str(tmp_path / 'scene.bin')
+    app.simpan_scene(path)
+    app_muat = muat(path)
+
+    penyimpanan = app_muat.penyimpanan
+    for nama in ('simpul', 'tipe', 'radius', 'matriks'):
+        assert isinstance(getattr(penyimpanan, nama).base, np.memmap)
+    assert app_muat.daftar_bentuk._objek == {}
+
+    elips = app_muat.daftar_bentuk[3]
+    assert list(app_muat.daftar_bentuk._objek) == [3]
+    assert app_muat.daftar_bentuk[3] is elips
+
+    # Memory map copy-on-write: mengubah scene yang dimuat tidak menulis balik ke berkas.
+    elips.radius_x = 5.0
+    app_muat.daftar_bentuk[1].transformasi(translasi_2d(100, 0))
+    app_ulang = muat(path)
+    assert app_ulang.daftar_bentuk[3].radius_x == 80.0
+    np.testing.assert_array_equal(app_ulang.daftar_bentuk[1].dapatkan_simpul_hasil_transformasi(),
+                                  app.daftar_bentuk[1].dapatkan_simpul_hasil_transformasi())
+
+
+def test_simpan_atomik(tmp_path, monkeypatch):
+    path = str(tmp_path / 'scene.bin')
+    buat_scene().simpan_scene(path)
+    isi_lama = open(path, 'rb').read()
+
+    # Penulisan gagal sebelum diganti: berkas lama utuh, data baru hanya di berkas sementara.
+    def gagal(sumber, tujuan):
+        raise OSError("gagal mengganti berkas")
+    monkeypatch.setattr(os, 'replace', gagal)
+    app_kosong = Main()
+    with pytest.raises(OSError):
+        app_kosong.simpan_scene(path)
+    assert open(path, 'rb').read() == isi_lama
+    assert os.path.exists(path + '.tmp')
+    monkeypatch.undo()
+
+    # Menyimpan ke berkas yang sedang dipetakan scene itu sendiri aman dan tidak meninggalkan sisa.
+    app_muat = muat(path)
+    app_muat.daftar_bentuk[2].transformasi(translasi_2d(7, 7))
+    app_muat.simpan_scene(path)
+    assert not os.path.exists(path + '.tmp')
+    app_ulang = muat(path)
+    np.testing.assert_array_equal(app_ulang.daftar_bentuk[2].dapatkan_simpul_hasil_transformasi(),
+                                  app_muat.daftar_bentuk[2].dapatkan_simpul_hasil_transformasi())
+    assert app_ulang.penyimpanan.tipe.tolist() == [PenyimpananBentuk.TITIK, PenyimpananBentuk.GARIS,
+                                                   PenyimpananBentuk.PERSEGI, PenyimpananBentuk.ELIPS,
+                                                   PenyimpananBentuk.ELIPS]
+
+
+def test_format_mengikuti_ekstensi(tmp_path):
+    # Tombol k menyimpan ke `path_scene`; defaultnya biner, JSON hanya untuk path .json.
+    assert not Main().path_scene.lower().endswith('.json')
+
+    app = buat_scene()
+    path_biner, path_json = str(tmp_path / 'scene.bin'), str(tmp_path / 'scene.json')
+    app.simpan_scene(path_biner)
+    app.simpan_scene(path_json)
+    assert open(path_biner, 'rb').read(1) != b'{'
+    with open(path_json) as berkas:
+        assert berkas.read(1) == '{'
+
+    app_json = muat(path_json)
+    assert len(app_json.daftar_bentuk) == len(app.daftar_bentuk)
+    for bentuk, bentuk_json in zip(app.daftar_bentuk, app_json.daftar_bentuk):
+        assert type(bentuk_json) is type(bentuk)
+        np.testing.assert_allclose(bentuk_json.dapatkan_simpul_hasil_transformasi(),
+                                   bentuk.dapatkan_simpul_hasil_transformasi())
@@ -0,0 +1,57 @@
+"""`CachePemotongan` saat jendela diseret dan metode potong garis diganti harus sama dengan pemotongan tanpa cache."""
+import numpy as np
+
+from Modul_A import Elips, Garis, Main, Persegi
+
+
+def buat_scene(seed=0, jumlah=600):
+    app = Main()
+    rng = np.random.default_rng(seed)
+    for i in range(jumlah):
+        x, y = rng.uniform((0, 0), (1280, 720))
+        dx, dy = rng.uniform(-200, 200, size=2)
+        if i % 3 == 0:
+            bentuk = Garis((x, y), (x + dx, y + dy), (0, 0, 0), 2.0, app.penyimpanan)
+        elif i % 3 == 1:
+            bentuk = Persegi((x, y), (x + abs(dx), y + abs(dy)), (0, 0, 1), 2.0, app.penyimpanan)
+        else:
+            bentuk = Elips((x, y), abs(dx) / 2 + 5, abs(dy) / 2 + 5, (1, 0, 0), 2.0, app.penyimpanan)
+        app.tambah_bentuk(bentuk)
+    return app
+
+
+def potong_tanpa_cache(jendela, metode):
+    """Acuan: scene yang sama di `Main` baru, jadi memo kosong dan semuanya dipotong ulang."""
+    app = buat_scene()
+    app.window_clipping = jendela
+    app.metode_potong_garis = metode
+    return app.potong_semua_bentuk()
+
+
+def sama(hasil, acuan):
+    return len(hasil) == len(acuan) and all(np.array_equal(a, b) for a, b in zip(hasil, acuan))
+
+
+def test_seret_jendela_dan_ganti_metode():
+    app = buat_scene()
+    daftar_jendela = [(300.0 + 8 * i, 200.0 + 3 * i, 940.0 + 8 * i, 560.0 + 3 * i) for i in (0, 1, 2, 3, 2, 1, 0)]
+
+    for metode in ('cohen_sutherland', 'liang_barsky', 'cohen_sutherland'):
+        app.metode_potong_garis = metode
+        for jendela in daftar_jendela:
+            app.window_clipping = jendela
+            assert sama(app.potong_semua_bentuk(), potong_tanpa_cache(jendela, metode)), (metode, jendela)
+
+    # Menyeret kembali ke posisi lama dengan metode yang sama memakai hasil yang diingat.
+    statistik = app.cache_pemotongan.statistik()
+    assert statistik['memo_hit'] > 0
+    assert statistik['memo'] == len(app.cache_pemotongan)
+
+
+def test_kedua_metode_berbeda_pada_garis_terpotong():
+    # Memastikan uji di atas peka terhadap hasil basi: kedua metode tidak identik sampai bit terakhir.
+    jendela = (300.0, 200.0, 940.0, 560.0)
+    hasil_cs = potong_tanpa_cache(jendela, 'cohen_sutherland')
+    hasil_lb = potong_tanpa_cache(jendela, 'liang_barsky')
+    assert not sama(hasil_cs, hasil_lb)
+    assert all(np.allclose(a, b) for a, b in zip(hasil_cs, hasil_lb) if a is not None)
@@ -0,0 +1,79 @@
+"""Urutan kirim `DaftarGambar.kelompok` (tanpa konteks OpenGL): kelompok keadaan, transparan, dan kedalaman."""
+import numpy as np
+from OpenGL.GL import GL_LINE_LOOP, GL_LINES, GL_POINTS, GL_POLYGON
+
+from daftar_gambar import DaftarGambar
+
+
+def buat_daftar(rng, jumlah=300):
+    """Primitif acak dalam beberapa panggilan `tambah`; mengembalikan daftar dan salinan datanya per primitif."""
+    daftar, primitif = DaftarGambar(), []
+    pilihan_mode = np.array([GL_POINTS, GL_LINES, GL_LINE_LOOP, GL_POLYGON])
+    pilihan_warna = np.array([(1, 0, 0), (0, 0, 1), (0.2, 0.8, 0.2), (0, 0, 0)], dtype=np.float32)
+    kunci_acak = rng.permutation(jumlah)
+    for awal in range(0, jumlah, 50):
+        n = 50
+        alpha = 0.3 if awal % 100 else 1.0
+        mode = pilihan_mode[rng.integers(0, 4, n)]
+        panjang = np.where(mode == GL_POINTS, 1, rng.integers(2, 6, n))
+        simpul = rng.uniform(0, 100, size=(int(panjang.sum()), 2))
+        kunci = kunci_acak[awal:awal + n] // 2  # sebagian kunci sama
+        ukuran = rng.choice([1.0, 2.0, 4.0], n).astype(np.float32)
+        warna = pilihan_warna[rng.integers(0, 4, n)]
+        daftar.tambah(mode, simpul, panjang, kunci, ukuran, warna, alpha)
+        for i, potongan in enumerate(np.split(simpul, np.cumsum(panjang)[:-1])):
+            primitif.append((mode[i], potongan, kunci[i], ukuran[i], (*warna[i], alpha)))
+    return daftar, primitif
+
+
+def test_kelompok_keadaan_dan_urutan_transparan():
+    daftar, primitif = buat_daftar(np.random.default_rng(5))
+    simpul, awal, panjang, batas, mode, ukuran, warna = daftar.kelompok()
+    assert len(panjang) == len(primitif) and batas[0] == 0 and batas[-1] == len(panjang)
+
+    # Setiap kelompok punya satu keadaan, dan kelompok berurutan tidak berkeadaan sama.
+    keadaan = [(int(mode[a]), float(ukuran[a]), tuple(warna[a].tolist())) for a in batas[:-1]]
+    for (dari, sampai), k in zip(zip(batas[:-1], batas[1:]), keadaan):
+        assert all((int(mode[i]), float(ukuran[i]), tuple(warna[i].tolist())) == k for i in range(dari, sampai))
+    assert all(a != b for a, b in zip(keadaan, keadaan[1:]))
+
+    # Opak dikirim dulu, tiap keadaan opak tepat satu kelompok; transparan menyusul urut kunci.
+    transparan = warna[:, 3] < 1
+    jumlah_opak = int((~transparan).sum())
+    assert not transparan[:jumlah_opak].any() and transparan[jumlah_opak:].all()
+    keadaan_opak = [k for k in keadaan if k[2][3] == 1]
+    assert len(keadaan_opak) == len(set(keadaan_opak))
+
+    # Kedalaman mengikuti peringkat kunci: kunci sama -> z sama, kunci lebih besar -> lebih dekat.
+    z = simpul[awal, 2]
+    assert np.all((z > -1) & (z < 1))
+    asal = []
+    for i in range(len(panjang)):
+        titik = simpul[awal[i]:awal[i] + panjang[i]]
+        assert np.all(titik[:, 2] == titik[0, 2])
+        cocok = [j for j, p in enumerate(primitif) if len(p[1]) == panjang[i] and np.allclose(p[1], titik[:, :2])]
+        asal.append(cocok[0])
+    kunci = np.array([primitif[j][2] for j in asal])
+    assert sorted(asal) == list(range(len(primitif)))
+    urut = np.argsort(kunci, kind='stable')
+    assert np.all(np.diff(z[urut]) >= 0)
+    assert np.all((np.diff(z[urut]) > 0) == (np.diff(kunci[urut]) > 0))
+    assert np.all(np.diff(kunci[jumlah_opak:]) >= 0)
+    for i, j in enumerate(asal):
+        assert (int(mode[i]), float(ukuran[i])) == (int(primitif[j][0]), float(primitif[j][3]))
+        np.testing.assert_allclose(warna[i], primitif[j][4])
+
+
+def test_warna_sama_dari_panggilan_berbeda_satu_kelompok():
+    daftar = DaftarGambar()
+    segmen = np.array([[0, 0], [10, 10]], dtype=np.float64)
+    daftar.tambah(GL_LINES, segmen, [2], 3, 2.0, (0.2, 0.8, 0.2))
+    daftar.tambah(GL_LINES, segmen + 5, [2], 1, 2.0, (1.0, 0.0, 0.0))
+    daftar.tambah(GL_LINES, segmen + 9, [2], 2, 2.0, (0.2, 0.8, 0.2))
+    simpul, _, _, batas, _, _, warna = daftar.kelompok()
+    # Dua garis hijau dari panggilan berbeda menjadi satu kelompok (nomor warna urut RGBA).
+    assert batas.tolist() == [0, 2, 3]
+    np.testing.assert_allclose(warna[:, :3], [(0.2, 0.8, 0.2), (0.2, 0.8, 0.2), (1.0, 0.0, 0.0)])
+    # Kedalaman tetap dari kunci: 3 (hijau pertama) > 2 (hijau kedua) > 1 (merah).
+    z = simpul[::2, 2]
+    assert z[0] > z[1] > z[2]
@@ -0,0 +1,94 @@
+"""Uji kena tepat (pemilihan.py) dan urutan pemilihan `Main.cari_bentuk_di` lewat `IndeksSpasial.cari_titik`."""
+import numpy as np
+import pytest
+
+from Modul_A import Elips, Garis, Main, Persegi, Titik
+from pemilihan import TOLERANSI_KENA, uji_kena
+from penyimpanan_bentuk import PenyimpananBentuk
+from transformasi import rotasi_2d
+
+
+def kena(penyimpanan, id_bentuk, titik, toleransi=TOLERANSI_KENA):
+    return [bool(uji_kena(penyimpanan, [id_bentuk], x, y, toleransi)[0]) for x, y in titik]
+
+
+@pytest.mark.parametrize('toleransi', [0.0, TOLERANSI_KENA])
+def test_elips_radius_ditambah_setengah_tebal_dan_toleransi(toleransi):
+    app = Main()
+    elips = Elips((100, 100), 40.0, 20.0, (0, 0, 0), 4.0, app.penyimpanan)
+    # Batas kena: radius + ketebalan / 2 + toleransi di setiap sumbu elips.
+    rx, ry = 40 + 2 + toleransi, 20 + 2 + toleransi
+    assert kena(app.penyimpanan, elips.id, [(100 + rx - 0.1, 100), (100 - rx + 0.1, 100), (100, 100 + ry - 0.1),
+                                            (100, 100), (100 + rx * 0.7, 100 + ry * 0.7)], toleransi) == [True] * 5
+    assert kena(app.penyimpanan, elips.id, [(100 + rx + 0.1, 100), (100, 100 - ry - 0.1),
+                                            (100 + rx * 0.72, 100 + ry * 0.72)], toleransi) == [False] * 3
+
+
+def test_elips_diputar():
+    app = Main()
+    elips = Elips((100, 100), 40.0, 20.0, (0, 0, 0), 4.0, app.penyimpanan)
+    elips.transformasi(rotasi_2d(90, (100, 100)))
+    # Setelah diputar 90 derajat sumbu panjangnya tegak.
+    assert kena(app.penyimpanan, elips.id, [(100, 144.9), (100, 55.1), (124.9, 100)]) == [True] * 3
+    assert kena(app.penyimpanan, elips.id, [(144.9, 100), (100, 145.1)]) == [False] * 2
+
+
+def test_poligon_genap_ganjil():
+    penyimpanan = PenyimpananBentuk()
+    # Huruf C (cekung) dan bintang segi lima yang memotong dirinya sendiri.
+    huruf_c = penyimpanan.tambah('poligon', (0, 0, 0), 1.0,
+                                 [(0, 0), (100, 0), (100, 20), (20, 20), (20, 80), (100, 80), (100, 100), (0, 100)])
+    sudut = np.radians(90 + 144 * np.arange(5))
+    bintang = penyimpanan.tambah('poligon', (0, 0, 0), 1.0,
+                                 np.column_stack((300 + 100 * np.cos(sudut), 300 + 100 * np.sin(sudut))))
+
+    # Di dalam batang C kena, di celah C (di dalam kotaknya) tidak; toleransi 0 agar hanya isi yang diuji.
+    assert kena(penyimpanan, huruf_c, [(10, 50), (50, 10), (50, 90)], 0.0) == [True] * 3
+    assert kena(penyimpanan, huruf_c, [(60, 50), (99, 50)], 0.0) == [False] * 2
+    # Segi lima di tengah bintang dilingkupi dua kali (genap) sehingga bukan bagian isi; ujung bintang kena.
+    assert kena(penyimpanan, bintang, [(300, 300)], 0.0) == [False]
+    assert kena(penyimpanan, bintang, [(300, 380)], 0.0) == [True]
+    # Outline tetap kena dalam setengah ketebalan + toleransi, juga di celah C.
+    assert kena(penyimpanan, huruf_c, [(60, 20.5 + TOLERANSI_KENA - 0.1)]) == [True]
+    assert kena(penyimpanan, huruf_c, [(60, 20.5 + TOLERANSI_KENA + 0.1)]) == [False]
+
+
+def test_garis_tidak_punya_isi():
+    app = Main()
+    garis = Garis((0, 0), (100, 100), (0, 0, 0), 2.0, app.penyimpanan)
+    assert kena(app.penyimpanan, garis.id, [(50, 50), (50 + 2.8, 50 - 2.8)]) == [True, True]
+    assert kena(app.penyimpanan, garis.id, [(80, 20), (110, 110)]) == [False, False]
+
+
+def test_titik_persegi_selebar_ukuran_titik():
+    app = Main()
+    titik = Titik((10, 10), (0, 0, 0), 3.0, app.penyimpanan)
+    # Titik digambar dengan glPointSize(ketebalan * 2): jangkauannya ketebalan + toleransi di tiap sumbu.
+    assert kena(app.penyimpanan, titik.id, [(16, 16), (4, 10)]) == [True, True]
+    assert kena(app.penyimpanan, titik.id, [(16.1, 10), (10, 3.9)]) == [False, False]
+
+
+def test_bentuk_paling_atas_dipilih_lebih_dulu():
+    app = Main()
+    bawah = Persegi((0, 0), (400, 400), (0, 0, 1), 2.0, app.penyimpanan)
+    tengah = Elips((200, 200), 50.0, 50.0, (1, 0, 0), 2.0, app.penyimpanan)
+    atas = Garis((100, 300), (300, 100), (0, 1, 0), 2.0, app.penyimpanan)
+    for bentuk in (bawah, tengah, atas):
+        app.tambah_bentuk(bentuk)
+
+    # Kandidat fase kasar urut dari yang digambar terakhir, termasuk saat melintasi beberapa sel grid.
+    app.perbarui_indeks_spasial()
+    assert app.indeks_spasial.cari_titik(200, 200, 10.0).tolist() == [atas.id, tengah.id, bawah.id]
+    assert app.indeks_spasial.cari_titik(170, 230, 0.0).tolist() == [atas.id, tengah.id, bawah.id]
+
+    assert app.cari_bentuk_di(200, 200) is atas
+    # Kotak garis dan elips memuat titik ini, tetapi hanya elips yang benar-benar kena.
+    assert app.cari_bentuk_di(220, 230) is tengah
+    # Di sudut kotak elips (di luar elipsnya) dan jauh dari garis, persegi di bawahnya yang terpilih.
+    assert app.cari_bentuk_di(157, 157) is bawah
+    assert app.cari_bentuk_di(500, 500) is None
+
+    # Bentuk yang ditambahkan kemudian menjadi paling atas.
+    titik = Titik((220, 230), (0, 0, 0), 2.0, app.penyimpanan)
+    app.tambah_bentuk(titik)
+    assert app.cari_bentuk_di(220, 230) is titik
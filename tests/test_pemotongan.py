@@ -0,0 +1,114 @@
+"""Mesin pemotongan batch (pemotongan.py) dibandingkan dengan rutin per bentuk di `Modul_A.Main`."""
+import numpy as np
+import pytest
+
+from Modul_A import Main
+from pemotongan import (cohen_sutherland_batch, kemas_poligon, liang_barsky_batch, pecah_poligon,
+                        potong_garis_batch, sutherland_hodgman_batch)
+
+JENDELA = (320.0, 180.0, 960.0, 540.0)
+
+
+@pytest.fixture
+def app():
+    app = Main()
+    app.window_clipping = JENDELA
+    return app
+
+
+def poligon_acak(rng, jumlah):
+    """Poligon acak 3..8 simpul (boleh cekung) di sekitar jendela: di dalam, di luar, dan memotong sisi."""
+    daftar = []
+    for _ in range(jumlah):
+        pusat = rng.uniform((0, 0), (1280, 720))
+        n = int(rng.integers(3, 9))
+        sudut = np.sort(rng.uniform(0, 2 * np.pi, n))
+        radius = rng.uniform(5, 250, n)
+        daftar.append(pusat + np.column_stack((np.cos(sudut), np.sin(sudut))) * radius[:, None])
+    return daftar
+
+
+def kasus_khusus():
+    x_min, y_min, x_max, y_max = JENDELA
+    return [
+        np.array([(400, 200), (500, 200), (500, 300), (400, 300)]),                      # seluruhnya di dalam
+        np.array([(0, 0), (100, 0), (50, 80)]),                                           # seluruhnya di luar
+        np.array([(x_min - 50, 300), (x_min + 50, 300), (x_min + 50, 400), (x_min - 50, 400)]),  # memotong sisi kiri
+        np.array([(x_min - 100, y_min - 100), (x_max + 100, y_min - 100),
+                  (x_max + 100, y_max + 100), (x_min - 100, y_max + 100)]),               # menutupi jendela
+        # Kotaknya menyentuh jendela, tetapi poligonnya di luar sudut: hasilnya tanpa simpul.
+        np.array([(x_min - 100, y_min + 20), (x_min + 20, y_min - 100), (x_min - 100, y_min - 100)]),
+        np.array([(x_min, 200), (x_min, 300), (x_min - 40, 250)]),                        # menempel sisi kiri
+        np.zeros((0, 2)),                                                                 # poligon kosong
+    ]
+
+
+def test_sutherland_hodgman_batch_sama_dengan_per_bentuk(app):
+    daftar_poligon = kasus_khusus() + poligon_acak(np.random.default_rng(1), 2000)
+    simpul, offset = kemas_poligon(daftar_poligon)
+    simpul_hasil, offset_hasil = sutherland_hodgman_batch(simpul, offset, JENDELA)
+    hasil_batch = pecah_poligon(simpul_hasil, offset_hasil)
+
+    assert len(hasil_batch) == len(daftar_poligon)
+    for poligon, hasil in zip(daftar_poligon, hasil_batch):
+        acuan = app.algoritma_sutherland_hodgman([tuple(p) for p in poligon.tolist()])
+        np.testing.assert_array_equal(hasil, np.asarray(acuan, dtype=np.float64).reshape(-1, 2))
+
+    jumlah_hasil = np.diff(offset_hasil)
+    assert jumlah_hasil[1] == 0 and jumlah_hasil[4] == 0 and jumlah_hasil[6] == 0
+    np.testing.assert_array_equal(hasil_batch[0], daftar_poligon[0])
+    # Poligon yang menutupi jendela terpotong menjadi persegi jendela itu sendiri.
+    assert sorted(map(tuple, hasil_batch[3].tolist())) == sorted(
+        [(JENDELA[0], JENDELA[1]), (JENDELA[2], JENDELA[1]), (JENDELA[2], JENDELA[3]), (JENDELA[0], JENDELA[3])])
+
+
+def segmen_uji(rng, jumlah):
+    """Segmen acak ditambah kasus tepi: terima langsung, tolak langsung, di sisi jendela, dan panjang nol."""
+    x_min, y_min, x_max, y_max = JENDELA
+    khusus = [
+        ((400, 200), (900, 500)),                  # seluruhnya di dalam (terima langsung)
+        ((0, 0), (200, 100)),                      # di kiri bawah jendela (tolak langsung)
+        ((1000, 0), (1200, 700)),                  # di kanan jendela (tolak langsung)
+        ((0, 300), (1280, 400)),                   # menembus dua sisi
+        ((x_min, 100), (x_min, 600)),              # tepat di sisi kiri
+        ((100, y_max), (1100, y_max)),             # tepat di sisi atas
+        ((x_min, 300), (x_min - 100, 300)),        # berujung di sisi kiri, mengarah keluar
+        ((500, 300), (500, 300)),                  # panjang nol di dalam
+        ((100, 100), (100, 100)),                  # panjang nol di luar
+        ((x_max, y_min), (x_max, y_min)),          # panjang nol di sudut jendela
+    ]
+    acak = rng.uniform((-200, -200), (1480, 920), size=(jumlah, 2, 2))
+    # Sebagian segmen acak dibuat vertikal/horizontal agar pembagian dengan nol ikut teruji.
+    acak[::7, 1, 0] = acak[::7, 0, 0]
+    acak[3::7, 1, 1] = acak[3::7, 0, 1]
+    return np.concatenate((np.array(khusus, dtype=np.float64), acak))
+
+
+def test_cohen_sutherland_batch_sama_dengan_per_garis(app):
+    segmen = segmen_uji(np.random.default_rng(2), 5000)
+    hasil, diterima = cohen_sutherland_batch(segmen, JENDELA)
+
+    for (p1, p2), seg, terima in zip(segmen.tolist(), hasil, diterima):
+        terima_acuan, q1, q2 = app.algoritma_cohen_sutherland(tuple(p1), tuple(p2))
+        assert terima == terima_acuan
+        if terima:
+            np.testing.assert_array_equal(seg, [q1, q2])
+
+    assert diterima[:10].tolist() == [True, False, False, True, True, True, True, True, False, True]
+
+
+def test_liang_barsky_batch_sama_dengan_per_garis(app):
+    segmen = segmen_uji(np.random.default_rng(3), 5000)
+    hasil, diterima = liang_barsky_batch(segmen, JENDELA)
+
+    for (p1, p2), seg, terima in zip(segmen.tolist(), hasil, diterima):
+        terima_acuan, q1, q2 = app.algoritma_cohen_sutherland(tuple(p1), tuple(p2))
+        assert terima == terima_acuan
+        if terima:
+            # Rumus parametrik berbeda dari Cohen-Sutherland, jadi hanya sama sampai pembulatan.
+            np.testing.assert_allclose(seg, [q1, q2], rtol=0, atol=1e-9)
+
+
+def test_potong_garis_batch_metode_tidak_dikenal():
+    with pytest.raises(ValueError):
+        potong_garis_batch(np.zeros((1, 2, 2)), JENDELA, 'bresenham')
@@ -0,0 +1,96 @@
+"""
+Rasterisasi CPU (rasterisasi.py): rentang scanline pada bentuk yang diketahui, dan gambar
+`PenggambarCPU` dibandingkan dengan OpenGL di konteks headless (dilewati jika tidak tersedia).
+"""
+import numpy as np
+import pytest
+
+from pemotongan import kemas_poligon
+from rasterisasi import PenggambarCPU, kolom_rentang, rentang_poligon
+
+LEBAR, TINGGI = 640, 360
+
+
+def rentang(daftar_poligon, baris_atas=0, baris_bawah=100):
+    simpul, offset = kemas_poligon([np.asarray(p, dtype=np.float64) for p in daftar_poligon])
+    return rentang_poligon(simpul, offset, baris_atas, baris_bawah)
+
+
+def test_rentang_persegi_dan_segitiga():
+    poligon, baris, x_kiri, x_kanan = rentang([[(2, 2), (6, 2), (6, 5), (2, 5)],
+                                               [(0, 0), (8, 0), (0, 8)]])
+    # Persegi: baris yang pusatnya (j + 0.5) di (2, 5], selebar 2..6.
+    persegi = poligon == 0
+    assert baris[persegi].tolist() == [2, 3, 4]
+    assert x_kiri[persegi].tolist() == [2.0] * 3 and x_kanan[persegi].tolist() == [6.0] * 3
+    # Segitiga siku-siku: tepi kanannya x = 8 - y di pusat setiap baris.
+    segitiga = poligon == 1
+    assert baris[segitiga].tolist() == list(range(8))
+    np.testing.assert_array_equal(x_kiri[segitiga], 0.0)
+    np.testing.assert_array_equal(x_kanan[segitiga], 8 - (np.arange(8) + 0.5))
+
+
+def test_rentang_dibatasi_pita_baris():
+    poligon, baris, _, _ = rentang([[(0, 0), (8, 0), (0, 8)], [(0, 20), (4, 20), (4, 30)]], 3, 6)
+    assert poligon.tolist() == [0, 0, 0] and baris.tolist() == [3, 4, 5]
+
+
+def test_rentang_kosong_dan_datar():
+    assert all(len(hasil) == 0 for hasil in rentang([np.zeros((0, 2))]))
+    # Poligon tanpa tinggi (semua sisi mendatar) tidak menutupi baris mana pun.
+    assert all(len(hasil) == 0 for hasil in rentang([[(1, 3.5), (9, 3.5), (5, 3.5)]]))
+
+
+def test_kolom_rentang():
+    awal, akhir = kolom_rentang(np.array([2.0, 2.4, 2.6, -5.0, 7.0, 5.0]),
+                                np.array([6.0, 6.5, 6.6, 3.0, 20.0, 4.0]), 10)
+    # Kolom dengan pusat (k + 0.5) di [x_kiri, x_kanan), dipotong ke [0, lebar); rentang terbalik kosong.
+    assert awal.tolist() == [2, 2, 3, 0, 7, 5]
+    assert akhir.tolist() == [6, 6, 7, 3, 10, 5]
+
+
+def test_rentang_sama_dengan_uji_pusat_piksel():
+    rng = np.random.default_rng(4)
+    daftar_poligon = []
+    for _ in range(200):
+        sudut = np.sort(rng.uniform(0, 2 * np.pi, int(rng.integers(3, 9))))
+        radius = rng.uniform(1, 15, size=2)
+        daftar_poligon.append(rng.uniform(-5, 45, size=2) + np.column_stack((np.cos(sudut), np.sin(sudut))) * radius)
+
+    ukuran = 40
+    poligon, baris, x_kiri, x_kanan = rentang(daftar_poligon, 0, ukuran)
+    awal, akhir = kolom_rentang(x_kiri, x_kanan, ukuran)
+    tertutup = np.zeros((len(daftar_poligon), ukuran, ukuran), dtype=bool)
+    for i, j, a, b in zip(poligon, baris, awal, akhir):
+        tertutup[i, j, a:b] = True
+
+    # Acuan: pusat piksel di dalam poligon konveks jika berada di sisi yang sama dari semua sisinya.
+    pusat = np.stack(np.meshgrid(np.arange(ukuran) + 0.5, np.arange(ukuran) + 0.5), axis=-1)
+    for i, p in enumerate(daftar_poligon):
+        sisi = np.roll(p, -1, axis=0) - p
+        silang = sisi[:, 0] * (pusat[..., None, 1] - p[:, 1]) - sisi[:, 1] * (pusat[..., None, 0] - p[:, 0])
+        acuan = np.all(silang > 0, axis=-1) | np.all(silang < 0, axis=-1)
+        np.testing.assert_array_equal(tertutup[i], acuan)
+
+
+@pytest.mark.parametrize('jendela', [None, (160.0, 90.0, 480.0, 270.0), (-50.0, 100.0, 300.0, 500.0)])
+def test_cpu_sama_dengan_gl(konteks, jendela):
+    from benchmark import buat_scene_campuran, gambar_berurutan
+
+    app = buat_scene_campuran(2000, seed=3, lebar=LEBAR, tinggi=TINGGI)
+    app.lebar, app.tinggi = LEBAR, TINGGI
+    app.inisialisasi_gl()
+    app.window_clipping = jendela
+
+    gambar_berurutan(app, konteks)
+    konteks.selesai()
+    acuan = konteks.baca_piksel()[..., :3].astype(np.int16)
+
+    penggambar = PenggambarCPU(LEBAR, TINGGI, jumlah_tile=2)
+    try:
+        gambar = penggambar.gambar(app)[..., :3].astype(np.int16)
+    finally:
+        penggambar.tutup()
+    selisih = np.abs(gambar - acuan).max(axis=2)
+    # Hanya tepi titik dan garis tebal yang boleh berbeda dari rasterisasi llvmpipe.
+    assert np.mean(selisih > 8) < 0.005
@@ -0,0 +1,167 @@
+"""
+Transformasi NumPy untuk Modul_A (2D, matriks homogen 3x3) dan Modul_B (3D,
+matriks 4x4 dan quaternion).
+
+Semua fungsi menerima skalar atau array dan bekerja per batch: n matriks dibuat
+dalam satu panggilan tanpa loop Python. Sudut dalam derajat, quaternion
+disimpan sebagai (w, x, y, z), dan matriks memakai konvensi vektor kolom
+(p' = M @ p); untuk OpenGL (urutan kolom) kirim transpos matriks.
+"""
+import math
+
+import numpy as np
+
+QUATERNION_IDENTITAS = np.array([1.0, 0.0, 0.0, 0.0])
+
+
+def _tipe(*nilai):
+    """float32 jika semua masukan float32 (mis. array instans), selain itu float64."""
+    return np.result_type(*nilai, np.float32)
+
+
+def _identitas(bentuk, ukuran, dtype):
+    hasil = np.zeros(bentuk + (ukuran, ukuran), dtype=dtype)
+    for i in range(ukuran):
+        hasil[..., i, i] = 1
+    return hasil
+
+
+# --- 2D -----------------------------------------------------------------------------
+
+def translasi_2d(dx, dy):
+    """Matriks translasi homogen (..., 3, 3)."""
+    dx, dy = np.broadcast_arrays(dx, dy)
+    hasil = _identitas(dx.shape, 3, _tipe(dx, dy))
+    hasil[..., 0, 2] = dx
+    hasil[..., 1, 2] = dy
+    return hasil
+
+
+def rotasi_2d(sudut, pusat=(0.0, 0.0)):
+    """Rotasi `sudut` derajat (berlawanan jarum jam) terhadap titik `pusat` (..., 2): matriks (..., 3, 3)."""
+    sudut = np.radians(sudut)
+    pusat = np.asarray(pusat)
+    cos_s, sin_s = np.cos(sudut), np.sin(sudut)
+    pusat_x, pusat_y = pusat[..., 0], pusat[..., 1]
+    cos_s, sin_s, pusat_x, pusat_y = np.broadcast_arrays(cos_s, sin_s, pusat_x, pusat_y)
+
+    # Gabungan (ke asal -> rotasi -> kembali) ditulis langsung.
+    hasil = _identitas(cos_s.shape, 3, _tipe(cos_s, pusat_x))
+    hasil[..., 0, 0], hasil[..., 0, 1] = cos_s, -sin_s
+    hasil[..., 1, 0], hasil[..., 1, 1] = sin_s, cos_s
+    hasil[..., 0, 2] = pusat_x - cos_s * pusat_x + sin_s * pusat_y
+    hasil[..., 1, 2] = pusat_y - sin_s * pusat_x - cos_s * pusat_y
+    return hasil
+
+
+def skala_2d(skala_x, skala_y, pusat=(0.0, 0.0)):
+    """Penskalaan terhadap titik `pusat` (..., 2): matriks (..., 3, 3)."""
+    pusat = np.asarray(pusat)
+    skala_x, skala_y, pusat_x, pusat_y = np.broadcast_arrays(skala_x, skala_y, pusat[..., 0], pusat[..., 1])
+    hasil = _identitas(skala_x.shape, 3, _tipe(skala_x, pusat_x))
+    hasil[..., 0, 0], hasil[..., 1, 1] = skala_x, skala_y
+    hasil[..., 0, 2] = pusat_x - skala_x * pusat_x
+    hasil[..., 1, 2] = pusat_y - skala_y * pusat_y
+    return hasil
+
+
+# --- Quaternion ---------------------------------------------------------------------
+
+def quaternion_sumbu_sudut(sumbu, sudut):
+    """Quaternion rotasi `sudut` derajat terhadap `sumbu` (..., 3) (tidak harus satuan): (..., 4)."""
+    sumbu = np.asarray(sumbu, dtype=np.float64)
+    panjang = np.linalg.norm(sumbu, axis=-1, keepdims=True)
+    sumbu = np.divide(sumbu, panjang, out=np.zeros_like(sumbu), where=panjang > 0)
+    setengah = np.radians(np.asarray(sudut, dtype=np.float64))[..., None] / 2
+    vektor = sumbu * np.sin(setengah)
+    return np.concatenate((np.broadcast_to(np.cos(setengah), vektor.shape[:-1] + (1,)), vektor), axis=-1)
+
+
+def kali_quaternion(a, b):
+    """Hasil kali Hamilton a * b (rotasi b dulu, lalu a)."""
+    a, b = np.asarray(a), np.asarray(b)
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((aw * bw - ax * bx - ay * by - az * bz,
+                     aw * bx + ax * bw + ay * bz - az * by,
+                     aw * by - ax * bz + ay * bw + az * bx,
+                     aw * bz + ax * by - ay * bx + az * bw), axis=-1)
+
+
+def normalkan_quaternion(q):
+    q = np.asarray(q)
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def quaternion_seret(dx, dy, kepekaan=0.4):
+    """
+    Rotasi dari seretan mouse (dx, dy) piksel di layar: berputar terhadap sumbu layar
+    yang tegak lurus arah seretan, sebesar `kepekaan` derajat per piksel.
+    """
+    return quaternion_sumbu_sudut((dy, dx, 0.0), math.hypot(dx, dy) * kepekaan)
+
+
+def quaternion_acak(jumlah, rng):
+    """`jumlah` quaternion satuan acak yang terdistribusi merata."""
+    return normalkan_quaternion(rng.normal(size=(jumlah, 4)))
+
+
+def matriks_rotasi(q):
+    """Matriks rotasi (..., 3, 3) dari quaternion satuan (..., 4)."""
+    q = np.asarray(q)
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    hasil = np.empty(q.shape[:-1] + (3, 3), dtype=_tipe(q))
+    hasil[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    hasil[..., 0, 1] = 2 * (x * y - w * z)
+    hasil[..., 0, 2] = 2 * (x * z + w * y)
+    hasil[..., 1, 0] = 2 * (x * y + w * z)
+    hasil[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    hasil[..., 1, 2] = 2 * (y * z - w * x)
+    hasil[..., 2, 0] = 2 * (x * z - w * y)
+    hasil[..., 2, 1] = 2 * (y * z + w * x)
+    hasil[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return hasil
+
+
+# --- 3D -----------------------------------------------------------------------------
+
+def matriks_model(posisi, orientasi, skala=1.0):
+    """
+    Matriks model (..., 4, 4) = translasi(posisi) @ rotasi(orientasi) @ skala, sama dengan
+    glTranslatef lalu rotasi lalu glScalef. `skala` boleh skalar, (...,) atau (..., 3).
+    """
+    posisi, orientasi, skala = np.asarray(posisi), np.asarray(orientasi), np.asarray(skala)
+    if skala.ndim < posisi.ndim:
+        skala = skala[..., None]
+    rotasi = matriks_rotasi(orientasi) * skala[..., None, :]
+    bentuk = np.broadcast_shapes(posisi.shape[:-1], rotasi.shape[:-2])
+
+    hasil = np.zeros(bentuk + (4, 4), dtype=_tipe(posisi, orientasi, skala))
+    hasil[..., :3, :3] = rotasi
+    hasil[..., :3, 3] = posisi
+    hasil[..., 3, 3] = 1
+    return hasil
+
+
+def matriks_normal(model):
+    """Matriks normal (..., 3, 3): invers-transpos bagian 3x3 matriks model (lewat kofaktor, tanpa np.linalg.inv)."""
+    baris_0, baris_1, baris_2 = np.moveaxis(np.asarray(model)[..., :3, :3], -2, 0)
+    kofaktor = np.stack((np.cross(baris_1, baris_2), np.cross(baris_2, baris_0), np.cross(baris_0, baris_1)), axis=-2)
+    determinan = np.einsum('...i,...i->...', baris_0, kofaktor[..., 0, :])
+    return kofaktor / determinan[..., None, None]
+
+
+def matriks_perspektif(fovy, aspek, dekat, jauh):
+    """Matriks proyeksi 4x4 yang sama dengan gluPerspective."""
+    f = 1.0 / math.tan(math.radians(fovy) / 2)
+    return np.array([
+        [f / aspek, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (jauh + dekat) / (dekat - jauh), 2 * jauh * dekat / (dekat - jauh)],
+        [0, 0, -1, 0],
+    ])
+
+
+def untuk_gl(matriks):
+    """Matriks (..., 4, 4) dalam urutan kolom float32 untuk glLoadMatrixf, uniform, atau atribut instans."""
+    return np.ascontiguousarray(np.swapaxes(matriks, -1, -2), dtype=np.float32)